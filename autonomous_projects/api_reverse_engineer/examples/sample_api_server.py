@@ -5,9 +5,12 @@ This creates a simple Flask API that can be used to test the traffic capture
 and analysis functionality.
 """
 
-from flask import Flask, jsonify, request, abort
+from flask import Flask, Response, jsonify, request, abort
+from collections import defaultdict
+from functools import lru_cache
+import hmac
+import json
 import time
-import random
 
 
 app = Flask(__name__)
@@ -25,52 +28,99 @@ POSTS = [
     {"id": 3, "user_id": 2, "title": "API Design", "content": "Best practices for API design"}
 ]
 
+# Posts indexed by author, kept in sync with POSTS
+POSTS_BY_USER = defaultdict(list)
+for _post in POSTS:
+    POSTS_BY_USER[_post['user_id']].append(_post)
+
 # Simple auth token for testing
 VALID_TOKEN = "test-token-12345"
+_BEARER_PREFIX = b'Bearer '
+_TOKEN_BYTES = VALID_TOKEN.encode()
 
 def require_auth():
     """Check for valid authentication."""
-    auth_header = request.headers.get('Authorization')
+    auth_header = request.environ.get('HTTP_AUTHORIZATION')
     if not auth_header:
         abort(401, description="Missing Authorization header")
     
-    if not auth_header.startswith('Bearer '):
+    # WSGI header values are latin-1 decoded, so this round-trips the raw bytes
+    header = auth_header.encode('latin-1')
+    if not header.startswith(_BEARER_PREFIX):
         abort(401, description="Invalid authorization format")
     
-    token = auth_header[7:]  # Remove 'Bearer ' prefix
-    if token != VALID_TOKEN:
+    token = memoryview(header)[len(_BEARER_PREFIX):]
+    if not hmac.compare_digest(token, _TOKEN_BYTES):
         abort(401, description="Invalid token")
 
+# Rate limit header state, refreshed at most once per second
+_RL_STATE = {'tick': 0.0, 'reset': 0, 'remaining': 99, 'headers': {}}
+
+def _refresh_rate_limit_headers():
+    """Rebuild the cached rate limit headers for the current second."""
+    now = time.time()
+    if now >= _RL_STATE['reset']:
+        _RL_STATE['reset'] = int(now) + 3600
+        _RL_STATE['remaining'] = 99
+    elif _RL_STATE['remaining'] > 50:
+        _RL_STATE['remaining'] -= 1
+
+    _RL_STATE['headers'] = {
+        'X-RateLimit-Limit': '100',
+        'X-RateLimit-Remaining': str(_RL_STATE['remaining']),
+        'X-RateLimit-Reset': str(_RL_STATE['reset'])
+    }
+    _RL_STATE['tick'] = time.monotonic() + 1.0
+
 def add_rate_limit_headers(response):
     """Add rate limiting headers to responses."""
-    response.headers['X-RateLimit-Limit'] = '100'
-    response.headers['X-RateLimit-Remaining'] = str(random.randint(50, 99))
-    response.headers['X-RateLimit-Reset'] = str(int(time.time()) + 3600)
+    if time.monotonic() >= _RL_STATE['tick']:
+        _refresh_rate_limit_headers()
+    response.headers.update(_RL_STATE['headers'])
     return response
 
+ERROR_TITLES = {
+    400: "Bad request",
+    401: "Unauthorized",
+    404: "Not found"
+}
+
+@lru_cache(maxsize=256)
+def _make_error(status, description):
+    """Serialize an error body, reusing the bytes for repeated errors."""
+    body = {"error": ERROR_TITLES[status], "message": description}
+    return json.dumps(body).encode('utf-8')
+
+def _error_response(status, error):
+    return Response(_make_error(status, str(error.description)),
+                    status=status, mimetype='application/json')
+
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({"error": "Not found", "message": str(error.description)}), 404
+    return _error_response(404, error)
 
 @app.errorhandler(401)
 def unauthorized(error):
-    return jsonify({"error": "Unauthorized", "message": str(error.description)}), 401
+    return _error_response(401, error)
 
 @app.errorhandler(400)
 def bad_request(error):
-    return jsonify({"error": "Bad request", "message": str(error.description)}), 400
+    return _error_response(400, error)
 
 # Public endpoints (no auth required)
+_VERSION_BODY = json.dumps({"version": "1.0.0", "name": "Sample API"}).encode('utf-8')
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    response = jsonify({"status": "healthy", "timestamp": time.time()})
+    body = f'{{"status": "healthy", "timestamp": {time.time()!r}}}'.encode('utf-8')
+    response = Response(body, mimetype='application/json')
     return add_rate_limit_headers(response)
 
 @app.route('/version', methods=['GET'])
 def get_version():
     """Get API version."""
-    response = jsonify({"version": "1.0.0", "name": "Sample API"})
+    response = Response(_VERSION_BODY, mimetype='application/json')
     return add_rate_limit_headers(response)
 
 # User endpoints (require auth)
@@ -194,15 +244,16 @@ def get_posts():
     limit = request.args.get('limit', default=10, type=int)
     offset = request.args.get('offset', default=0, type=int)
     
-    posts = POSTS
     if user_id:
-        posts = [p for p in posts if p['user_id'] == user_id]
+        matching = POSTS_BY_USER.get(user_id, [])
+    else:
+        matching = POSTS
     
-    posts = posts[offset:offset+limit]
+    posts = matching[offset:offset+limit]
     
     response = jsonify({
         "posts": posts,
-        "total": len(posts),
+        "total": len(matching),
         "limit": limit,
         "offset": offset
     })
@@ -266,6 +317,7 @@ def create_user_post(user_id):
     }
     
     POSTS.append(new_post)
+    POSTS_BY_USER[user_id].append(new_post)
     
     response = jsonify(new_post)
     response.status_code = 201
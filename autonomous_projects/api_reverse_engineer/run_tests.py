@@ -4,12 +4,72 @@ Test runner for the API reverse engineering tool.
 This script runs all tests including unit tests, integration tests, and examples.
 """
 
+import os
 import sys
+import hashlib
+import pickle
+import signal
+import importlib.util
 import unittest
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 
+def _iter_test_ids(suite):
+    """Yield the ids of all test cases in a (nested) test suite."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_test_ids(test)
+        else:
+            yield test.id()
+
+
+def _tests_fingerprint(start_dir):
+    """Hash the path, mtime and size of every Python file under start_dir."""
+    entries = sorted(
+        (str(path.relative_to(start_dir)), stat.st_mtime_ns, stat.st_size)
+        for path in start_dir.rglob("*.py")
+        for stat in (path.stat(),)
+    )
+    return hashlib.sha1(repr(entries).encode()).hexdigest()
+
+
+def _discover_tests(loader, start_dir):
+    """
+    Discover tests under start_dir, reusing the cached test ids when the
+    test files have not changed since the last run.
+    """
+    cache_file = start_dir / "__pycache__" / "suite_cache.pkl"
+    key = _tests_fingerprint(start_dir)
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+        if cached["key"] == key:
+            # discover() would put start_dir on sys.path for us
+            if str(start_dir) not in sys.path:
+                sys.path.insert(0, str(start_dir))
+            return loader.loadTestsFromNames(cached["ids"])
+    except Exception:
+        pass
+        
+    suite = loader.discover(str(start_dir), pattern="test_*.py")
+    
+    # Don't cache a discovery that hit import errors
+    if not loader.errors:
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            with open(cache_file, 'wb') as f:
+                pickle.dump({"key": key, "ids": list(_iter_test_ids(suite))}, f)
+        except OSError:
+            pass
+            
+    return suite
+
+
 def run_unit_tests():
     """Run all unit tests."""
     print("Running unit tests...")
@@ -18,7 +78,7 @@ def run_unit_tests():
     # Discover and run unit tests
     loader = unittest.TestLoader()
     start_dir = Path(__file__).parent / "tests"
-    suite = loader.discover(str(start_dir), pattern="test_*.py")
+    suite = _discover_tests(loader, start_dir)
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
@@ -26,23 +86,66 @@ def run_unit_tests():
     return result.wasSuccessful()
 
 
+def _stream_process(cmd, timeout, on_line, cwd=None):
+    """
+    Run a command, passing each line of combined stdout/stderr to on_line.
+    
+    Output is consumed as it is produced instead of being buffered in full.
+    Raises subprocess.TimeoutExpired if the command outlives the timeout.
+    """
+    # On POSIX the child leads its own process group, so a timeout also
+    # kills grandchildren that would otherwise keep the pipe open
+    new_group = os.name == 'posix'
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, bufsize=1, cwd=cwd, start_new_session=new_group)
+    timed_out = threading.Event()
+    
+    def kill():
+        # Nothing to do if the command was reaped just before the deadline
+        if proc.returncode is not None:
+            return
+        timed_out.set()
+        if new_group:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        else:
+            proc.kill()
+            
+    # The read loop blocks, so enforce the timeout by killing the child
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            on_line(line)
+        returncode = proc.wait()
+    finally:
+        # Once cancelled and joined, the timer can no longer fire, so the
+        # flag says for certain whether the command was killed
+        timer.cancel()
+        timer.join()
+        proc.stdout.close()
+        
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+        
+    return returncode
+
+
 def run_integration_test():
     """Run the integration test."""
     print("\nRunning integration test...")
     print("=" * 50)
     
     try:
-        # Run the integration test
+        # Run the integration test, echoing its output as it arrives
         integration_script = Path(__file__).parent / "examples" / "integration_test.py"
-        result = subprocess.run([
+        returncode = _stream_process([
             sys.executable, str(integration_script)
-        ], capture_output=True, text=True, timeout=300)  # 5 minute timeout
+        ], timeout=300, on_line=sys.stdout.write)  # 5 minute timeout
         
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-            
-        return result.returncode == 0
+        return returncode == 0
         
     except subprocess.TimeoutExpired:
         print("✗ Integration test timed out")
@@ -52,6 +155,17 @@ def run_integration_test():
         return False
 
 
+def _run_example_script(script_path, cwd):
+    """Run a single example script, returning its return code and output tail."""
+    # Only the tail is reported on failure, so don't keep more than that
+    tail = deque(maxlen=20)
+    returncode = _stream_process([
+        sys.executable, str(script_path)
+    ], timeout=120, on_line=tail.append, cwd=cwd)
+    
+    return returncode, "".join(tail)
+
+
 def run_example_scripts():
     """Run example scripts to ensure they work."""
     print("\nRunning example scripts...")
@@ -64,34 +178,36 @@ def run_example_scripts():
     
     success = True
     
-    for script in example_scripts:
-        script_path = examples_dir / script
-        if not script_path.exists():
-            print(f"⚠ Example script not found: {script}")
-            continue
-            
-        try:
+    # Scripts are independent, so launch them concurrently and report in order
+    futures = {}
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for script in example_scripts:
+            script_path = examples_dir / script
+            if not script_path.exists():
+                print(f"⚠ Example script not found: {script}")
+                continue
+                
             print(f"Running {script}...")
-            result = subprocess.run([
-                sys.executable, str(script_path)
-            ], capture_output=True, text=True, timeout=120, cwd=examples_dir.parent)
+            futures[script] = executor.submit(_run_example_script, script_path, examples_dir.parent)
             
-            if result.returncode == 0:
-                print(f"✓ {script} completed successfully")
-            else:
-                print(f"✗ {script} failed with return code {result.returncode}")
-                if result.stdout:
-                    print("STDOUT:", result.stdout[-500:])  # Last 500 chars
-                if result.stderr:
-                    print("STDERR:", result.stderr[-500:])  # Last 500 chars
-                success = False
+        for script, future in futures.items():
+            try:
+                returncode, output = future.result()
                 
-        except subprocess.TimeoutExpired:
-            print(f"✗ {script} timed out")
-            success = False
-        except Exception as e:
-            print(f"✗ Error running {script}: {e}")
-            success = False
+                if returncode == 0:
+                    print(f"✓ {script} completed successfully")
+                else:
+                    print(f"✗ {script} failed with return code {returncode}")
+                    if output:
+                        print("OUTPUT:", output[-500:])  # Last 500 chars
+                    success = False
+                    
+            except subprocess.TimeoutExpired:
+                print(f"✗ {script} timed out")
+                success = False
+            except Exception as e:
+                print(f"✗ Error running {script}: {e}")
+                success = False
             
     return success
 
@@ -110,11 +226,11 @@ def check_dependencies():
     
     missing_packages = []
     
+    # find_spec only consults the import finders, so nothing is executed
     for package in required_packages:
-        try:
-            __import__(package)
+        if importlib.util.find_spec(package) is not None:
             print(f"✓ {package}")
-        except ImportError:
+        else:
             print(f"✗ {package} (missing)")
             missing_packages.append(package)
             
@@ -126,6 +242,16 @@ def check_dependencies():
     return True
 
 
+def _compile_one(file_path):
+    """Compile a single file, returning (path, error) where error may be None."""
+    try:
+        with open(file_path, 'rb') as f:
+            compile(f.read(), str(file_path), 'exec')
+        return file_path, None
+    except Exception as e:
+        return file_path, e
+
+
 def run_code_quality_checks():
     """Run basic code quality checks."""
     print("\nRunning code quality checks...")
@@ -136,17 +262,19 @@ def run_code_quality_checks():
     # Check for syntax errors
     python_files = list(src_dir.rglob("*.py"))
     
+    # Files are independent, so compile them in parallel
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(_compile_one, python_files))
+    
     syntax_errors = 0
-    for file_path in python_files:
-        try:
-            with open(file_path, 'r') as f:
-                compile(f.read(), str(file_path), 'exec')
+    for file_path, error in results:
+        if error is None:
             print(f"✓ {file_path.relative_to(src_dir)}")
-        except SyntaxError as e:
-            print(f"✗ {file_path.relative_to(src_dir)}: {e}")
+        elif isinstance(error, SyntaxError):
+            print(f"✗ {file_path.relative_to(src_dir)}: {error}")
             syntax_errors += 1
-        except Exception as e:
-            print(f"⚠ {file_path.relative_to(src_dir)}: {e}")
+        else:
+            print(f"⚠ {file_path.relative_to(src_dir)}: {error}")
             
     if syntax_errors > 0:
         print(f"\nFound {syntax_errors} syntax errors")
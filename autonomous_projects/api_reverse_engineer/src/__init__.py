@@ -8,12 +8,37 @@ fully-typed client libraries in multiple programming languages.
 __version__ = "1.0.0"
 __author__ = "Claude Code Agent"
 
-from .capture import TrafficCapture
-from .analyzer import RequestAnalyzer
-from .generators import PythonGenerator, TypeScriptGenerator, JavaScriptGenerator
-from .documentation import DocumentationGenerator
-from .types import APISpec, Endpoint, Parameter
-from .cli import APIReverseEngineerCLI
+import importlib
+
+# Public names are imported from their modules on first access, so
+# importing the package (e.g. for `python -m src.cli`) doesn't load
+# mitmproxy and every generator up front
+_LAZY_IMPORTS = {
+    "TrafficCapture": ".capture",
+    "RequestAnalyzer": ".analyzer",
+    "PythonGenerator": ".generators",
+    "TypeScriptGenerator": ".generators",
+    "JavaScriptGenerator": ".generators",
+    "DocumentationGenerator": ".documentation",
+    "APIReverseEngineerCLI": ".cli",
+    "APISpec": ".types",
+    "Endpoint": ".types",
+    "Parameter": ".types"
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "TrafficCapture",
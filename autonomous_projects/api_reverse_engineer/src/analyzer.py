@@ -4,67 +4,252 @@ Request/Response analyzer for pattern detection and type inference.
 
 import json
 import re
-from typing import Dict, List, Any, Optional, Set, Union
+from typing import Dict, Iterable, List, Any, Optional, Set, Union
 from urllib.parse import urlparse, parse_qs
 from collections import defaultdict, Counter
 import statistics
 import logging
+import random
+from functools import lru_cache
+from operator import itemgetter
 
 from .types import (
     APICall, APISpec, Endpoint, Parameter, ResponseSchema, 
-    HTTPMethod, ParameterType, AuthType, AuthPattern, RateLimit
+    HTTPMethod, ParameterType, AuthType, AuthPattern, RateLimit, NOT_JSON,
+    CaseInsensitiveDict
 )
 
 
+# Path normalization patterns, compiled once at import time. Numeric IDs,
+# UUIDs and other long IDs are matched as whole segments in a single scan.
+_RE_ID_UNION = re.compile(
+    r'/(?:\d+'
+    r'|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+    r'|[a-zA-Z0-9_-]{20,})(?=/|$)',
+    re.IGNORECASE
+)
+_RE_PATH_PARAM = re.compile(r'\{(\w+)\}')
+
+# Fall back to the regex-based normalization instead of the segment scanner.
+# Read once at import, when _normalize_path is chosen.
+USE_REGEX_NORMALIZATION = False
+
+_HEX_CHARS = frozenset('0123456789abcdefABCDEF-')
+
+# Lowercased request headers that indicate an authenticated call
+_AUTH_HEADERS = frozenset(['authorization', 'x-api-key', 'apikey', 'api-key'])
+
+# Standard request headers that are never reported as endpoint parameters
+_STANDARD_HEADERS = frozenset(['host', 'user-agent', 'accept', 'content-length'])
+
+
+def _is_uuid(segment: str) -> bool:
+    """Check whether a path segment is a UUID."""
+    return (
+        len(segment) == 36
+        and segment[8] == '-' and segment[13] == '-'
+        and segment[18] == '-' and segment[23] == '-'
+        and all(c in _HEX_CHARS for c in segment)
+    )
+
+
+def _is_long_id(segment: str) -> bool:
+    """Check whether a path segment looks like an opaque identifier."""
+    return (
+        len(segment) >= 20
+        and segment.isascii()
+        and segment.replace('_', '').replace('-', '').isalnum()
+    )
+
+
+def _normalize_path_regex(path: str) -> str:
+    """Normalize a path using the ID regex."""
+    return _RE_ID_UNION.sub('/{id}', path)
+
+
+def _normalize_path_segments(path: str) -> str:
+    """Normalize a path by replacing IDs with placeholders."""
+    # Classify each segment with cheap string tests instead of regex scans
+    segments = path.split('/')
+    for i, segment in enumerate(segments):
+        if not segment:
+            continue
+        if segment.isdigit() or _is_uuid(segment) or _is_long_id(segment):
+            segments[i] = '{id}'
+            
+    return '/'.join(segments)
+
+
+# The implementation is picked once, so cached results always come from it
+_normalize_path = lru_cache(maxsize=4096)(
+    _normalize_path_regex if USE_REGEX_NORMALIZATION else _normalize_path_segments
+)
+
+
+def _reservoir_add(samples: List[Any], seen: int, value: Any, k: int, rng: random.Random):
+    """
+    Add value to a fixed-size sample of k values (Algorithm R).
+    
+    seen is the number of values observed so far, including this one.
+    rng picks the replaced samples, so a seeded one makes the sample
+    reproducible.
+    """
+    if len(samples) < k:
+        samples.append(value)
+    else:
+        j = rng.randrange(seen)
+        if j < k:
+            samples[j] = value
+
+
+def _lower_header_items(headers: Dict[str, str]) -> List[tuple]:
+    """Get (original name, lowercased name, value) for each header."""
+    if isinstance(headers, CaseInsensitiveDict):
+        return headers.lower_items()
+    return [(header, header.lower(), value) for header, value in headers.items()]
+
+
+class _CallView:
+    """Per-call values derived once and shared by the analysis passes."""
+    
+    __slots__ = ('call', 'origin', 'path', 'normalized_path', 'method', 'header_items', 'header_names')
+    
+    def __init__(self, call: APICall):
+        self.call = call
+        parsed = urlparse(call.request.url)
+        self.origin = (parsed.scheme, parsed.netloc)
+        self.path = parsed.path
+        self.normalized_path = _normalize_path(self.path)
+        self.method = call.request.method
+        # (original name, lowercased name, value) for each request header
+        self.header_items = _lower_header_items(call.request.headers)
+        self.header_names = {lower for _, lower, _ in self.header_items}
+
+
+# Parameter type and JSON schema type for each JSON value type. Lookups are
+# by exact type; subclasses fall back to the closest entry in their MRO.
+_TYPE_MAP = {
+    type(None): ParameterType.NULL,
+    bool: ParameterType.BOOLEAN,
+    int: ParameterType.INTEGER,
+    float: ParameterType.FLOAT,
+    str: ParameterType.STRING,
+    list: ParameterType.ARRAY,
+    dict: ParameterType.OBJECT
+}
+
+_SCHEMA_TYPE_MAP = {
+    type(None): "null",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+    list: "array",
+    dict: "object"
+}
+
+
+def _lookup_base_type(mapping: Dict[type, Any], value: Any, default: Any) -> Any:
+    """Look up the closest base class of value's type in mapping."""
+    for base in type(value).__mro__[1:]:
+        if base in mapping:
+            return mapping[base]
+    return default
+
+
+class _UncacheableShape(Exception):
+    """Raised when a value is too deeply nested to fingerprint."""
+
+
 class TypeInferencer:
     """Infer types from JSON values."""
     
     @staticmethod
     def infer_type(value: Any) -> ParameterType:
         """Infer the parameter type from a value."""
-        if value is None:
-            return ParameterType.NULL
-        elif isinstance(value, bool):
-            return ParameterType.BOOLEAN
-        elif isinstance(value, int):
-            return ParameterType.INTEGER
-        elif isinstance(value, float):
-            return ParameterType.FLOAT
-        elif isinstance(value, str):
-            return ParameterType.STRING
-        elif isinstance(value, list):
-            return ParameterType.ARRAY
-        elif isinstance(value, dict):
-            return ParameterType.OBJECT
-        else:
-            return ParameterType.STRING
+        return _TYPE_MAP.get(type(value)) or _lookup_base_type(_TYPE_MAP, value, ParameterType.STRING)
             
+    # Schemas of recently seen body shapes, keyed by structural fingerprint
+    _schema_cache: Dict[tuple, Dict[str, Any]] = {}
+    _SCHEMA_CACHE_SIZE = 1024
+    
     @staticmethod
-    def infer_schema(data: Any) -> Dict[str, Any]:
-        """Infer a JSON schema from data."""
-        if data is None:
-            return {"type": "null"}
-        elif isinstance(data, bool):
-            return {"type": "boolean"}
-        elif isinstance(data, int):
-            return {"type": "integer"}
-        elif isinstance(data, float):
-            return {"type": "number"}
-        elif isinstance(data, str):
-            return {"type": "string"}
-        elif isinstance(data, list):
+    def _fingerprint(data: Any, depth: int = 2) -> Any:
+        """
+        Build a hashable key describing the structure of data.
+        
+        Only the top two container levels are fingerprinted; raises
+        _UncacheableShape for anything nested deeper, since the key would
+        no longer identify the schema exactly.
+        """
+        data_type = type(data)
+        if data_type is dict:
+            if depth == 0:
+                raise _UncacheableShape
+            return ('obj', tuple(
+                (key, TypeInferencer._fingerprint(value, depth - 1))
+                for key, value in data.items()
+            ))
+        elif data_type is list:
             if not data:
-                return {"type": "array", "items": {}}
-            # Infer type from first item (could be improved)
-            item_schema = TypeInferencer.infer_schema(data[0])
-            return {"type": "array", "items": item_schema}
-        elif isinstance(data, dict):
-            properties = {}
-            for key, value in data.items():
-                properties[key] = TypeInferencer.infer_schema(value)
-            return {"type": "object", "properties": properties}
-        else:
-            return {"type": "string"}
+                return ('arr',)
+            if depth == 0:
+                raise _UncacheableShape
+            return ('arr', TypeInferencer._fingerprint(data[0], depth - 1))
+        elif isinstance(data, (dict, list)):
+            raise _UncacheableShape
+        return data_type
+        
+    @staticmethod
+    def infer_schema(data: Any) -> Dict[str, Any]:
+        """
+        Infer a JSON schema from data.
+        
+        Schemas for repeated shallow shapes are cached and shared between
+        calls, so callers must not mutate the returned schema.
+        """
+        try:
+            key = TypeInferencer._fingerprint(data)
+        except _UncacheableShape:
+            return TypeInferencer._infer_schema(data)
+            
+        cache = TypeInferencer._schema_cache
+        schema = cache.get(key)
+        if schema is None:
+            schema = TypeInferencer._infer_schema(data)
+            if len(cache) >= TypeInferencer._SCHEMA_CACHE_SIZE:
+                # Evict the oldest entry
+                del cache[next(iter(cache))]
+            cache[key] = schema
+        return schema
+        
+    @staticmethod
+    def _infer_schema(data: Any) -> Dict[str, Any]:
+        """Infer a JSON schema from data without consulting the cache."""
+        # Walk the value with an explicit stack of (schema to fill, value)
+        # pairs so deeply nested bodies can't hit the recursion limit
+        result = {}
+        stack = [(result, data)]
+        
+        while stack:
+            schema, value = stack.pop()
+            
+            schema_type = (_SCHEMA_TYPE_MAP.get(type(value))
+                           or _lookup_base_type(_SCHEMA_TYPE_MAP, value, "string"))
+            schema["type"] = schema_type
+            
+            if schema_type == "array":
+                schema["items"] = items = {}
+                # Infer type from first item (could be improved)
+                if value:
+                    stack.append((items, value[0]))
+            elif schema_type == "object":
+                schema["properties"] = properties = {}
+                for key, item in value.items():
+                    properties[key] = child = {}
+                    stack.append((child, item))
+                
+        return result
 
 
 class PatternDetector:
@@ -89,19 +274,10 @@ class PatternDetector:
         
     def _normalize_path(self, path: str) -> str:
         """Normalize a path by replacing IDs with placeholders."""
-        # Replace numeric IDs
-        path = re.sub(r'/\d+', '/{id}', path)
-        
-        # Replace UUIDs
-        uuid_pattern = r'/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
-        path = re.sub(uuid_pattern, '/{id}', path, flags=re.IGNORECASE)
-        
-        # Replace other common ID patterns
-        path = re.sub(r'/[a-zA-Z0-9_-]{20,}', '/{id}', path)
-        
-        return path
+        return _normalize_path(path)
         
-    def detect_auth_patterns(self, calls: List[APICall]) -> List[AuthPattern]:
+    def detect_auth_patterns(self, calls: List[APICall],
+                             views: Optional[List[_CallView]] = None) -> List[AuthPattern]:
         """Detect authentication patterns from captured calls."""
         auth_patterns = []
         
@@ -110,13 +286,12 @@ class PatternDetector:
         bearer_tokens = set()
         api_keys = set()
         
-        for call in calls:
-            headers = call.request.headers
+        if views is None:
+            views = [_CallView(call) for call in calls]
             
+        for view in views:
             # Check for common auth headers
-            for header, value in headers.items():
-                header_lower = header.lower()
-                
+            for header, header_lower, value in view.header_items:
                 if header_lower == 'authorization':
                     if value.startswith('Bearer '):
                         bearer_tokens.add(value[7:])
@@ -157,11 +332,7 @@ class PatternDetector:
         rate_limit_headers = {}
         
         for call in calls:
-            headers = call.response.headers
-            
-            for header, value in headers.items():
-                header_lower = header.lower()
-                
+            for header, header_lower, value in _lower_header_items(call.response.headers):
                 if 'rate-limit' in header_lower or 'ratelimit' in header_lower:
                     rate_limit_headers[header] = value
                 elif header_lower in ['x-ratelimit-remaining', 'x-ratelimit-limit']:
@@ -176,33 +347,50 @@ class PatternDetector:
 class RequestAnalyzer:
     """Main analyzer for API requests and responses."""
     
+    # Seed for sampling response examples, so the same capture always
+    # produces the same spec
+    SAMPLE_SEED = 0
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.type_inferencer = TypeInferencer()
         self.pattern_detector = PatternDetector()
+        self._random = random.Random(self.SAMPLE_SEED)
         
-    def analyze_calls(self, calls: List[APICall]) -> APISpec:
-        """Analyze a list of API calls and generate an API specification."""
-        if not calls:
+    def analyze_calls(self, calls: Iterable[APICall]) -> APISpec:
+        """
+        Analyze API calls and generate an API specification.
+        
+        calls may be any iterable, such as a generator streaming calls from
+        a file; it is consumed once.
+        """
+        # Every analysis samples from the same seed
+        self._random.seed(self.SAMPLE_SEED)
+        
+        # Derive per-call values once for all passes
+        views = self._preprocess(calls)
+        if not views:
             raise ValueError("No API calls to analyze")
             
+        calls = [view.call for view in views]
         self.logger.info(f"Analyzing {len(calls)} API calls")
         
         # Group calls by endpoint
-        endpoint_groups = self._group_by_endpoint(calls)
+        endpoint_groups = self._group_views_by_endpoint(views)
         
         # Analyze each endpoint
         endpoints = []
-        for endpoint_key, endpoint_calls in endpoint_groups.items():
-            endpoint = self._analyze_endpoint(endpoint_key, endpoint_calls)
+        for endpoint_key, endpoint_views in endpoint_groups.items():
+            endpoint_calls = [view.call for view in endpoint_views]
+            endpoint = self._analyze_endpoint(endpoint_key, endpoint_calls, endpoint_views)
             endpoints.append(endpoint)
             
         # Detect global patterns
-        auth_patterns = self.pattern_detector.detect_auth_patterns(calls)
+        auth_patterns = self.pattern_detector.detect_auth_patterns(calls, views)
         rate_limits = self.pattern_detector.detect_rate_limits(calls)
         
         # Determine base URL
-        base_url = self._determine_base_url(calls)
+        base_url = self._determine_base_url(calls, views)
         
         # Create API spec
         api_spec = APISpec(
@@ -216,24 +404,33 @@ class RequestAnalyzer:
         self.logger.info(f"Generated API spec with {len(endpoints)} endpoints")
         return api_spec
         
-    def _group_by_endpoint(self, calls: List[APICall]) -> Dict[str, List[APICall]]:
-        """Group API calls by endpoint (method + normalized path)."""
+    def _preprocess(self, calls: Iterable[APICall]) -> List[_CallView]:
+        """Parse each call's URL and headers once for all analysis passes."""
+        return [_CallView(call) for call in calls]
+        
+    def _group_views_by_endpoint(self, views: List[_CallView]) -> Dict[str, List[_CallView]]:
+        """Group preprocessed calls by endpoint (method + normalized path)."""
+        # Group on (method, path) tuples and only format a key per endpoint
         groups = defaultdict(list)
         
-        for call in calls:
-            parsed_url = urlparse(call.request.url)
-            path = parsed_url.path
-            method = call.request.method
-            
-            # Normalize path
-            normalized_path = self.pattern_detector._normalize_path(path)
-            endpoint_key = f"{method} {normalized_path}"
-            
-            groups[endpoint_key].append(call)
+        for view in views:
+            groups[view.method, view.normalized_path].append(view)
             
-        return dict(groups)
+        return {
+            f"{method} {path}": group_views
+            for (method, path), group_views in groups.items()
+        }
+        
+    def _group_by_endpoint(self, calls: List[APICall]) -> Dict[str, List[APICall]]:
+        """Group API calls by endpoint (method + normalized path)."""
+        groups = self._group_views_by_endpoint(self._preprocess(calls))
+        return {
+            endpoint_key: [view.call for view in views]
+            for endpoint_key, views in groups.items()
+        }
         
-    def _analyze_endpoint(self, endpoint_key: str, calls: List[APICall]) -> Endpoint:
+    def _analyze_endpoint(self, endpoint_key: str, calls: List[APICall],
+                          views: Optional[List[_CallView]] = None) -> Endpoint:
         """Analyze a single endpoint from multiple calls."""
         method_str, path = endpoint_key.split(' ', 1)
         method = HTTPMethod(method_str)
@@ -250,7 +447,7 @@ class RequestAnalyzer:
         responses = self._analyze_responses(calls)
         
         # Detect auth requirement
-        auth_required = self._detect_auth_requirement(calls)
+        auth_required = self._detect_auth_requirement(calls, views)
         
         # Generate summary and description
         summary = self._generate_summary(method, path, calls)
@@ -272,7 +469,7 @@ class RequestAnalyzer:
         parameters = []
         
         # Find {id} placeholders in path
-        param_matches = re.findall(r'\{(\w+)\}', path)
+        param_matches = _RE_PATH_PARAM.findall(path)
         
         for param_name in param_matches:
             # For now, assume all path params are strings
@@ -290,49 +487,37 @@ class RequestAnalyzer:
     def _analyze_query_parameters(self, calls: List[APICall]) -> List[Parameter]:
         """Analyze query parameters from API calls."""
         param_stats = defaultdict(lambda: {
-            'values': [],
+            'example': None,
             'types': Counter(),
-            'required': 0,
-            'total': 0
+            'present': 0
         })
         
+        infer_type = self.type_inferencer.infer_type
+        
         for call in calls:
-            query_params = call.request.query_params
-            
-            # Track which params appear in this call
-            call_params = set(query_params.keys())
-            
-            # Update stats for all parameters we've seen
-            for param_name in param_stats:
-                param_stats[param_name]['total'] += 1
-                if param_name in call_params:
-                    param_stats[param_name]['required'] += 1
-                    
-            # Add new parameters from this call
-            for param_name, value in query_params.items():
+            for param_name, value in call.request.query_params.items():
                 stats = param_stats[param_name]
-                stats['values'].append(value)
-                stats['types'][self.type_inferencer.infer_type(value)] += 1
-                stats['total'] += 1
-                stats['required'] += 1
+                stats['present'] += 1
+                stats['types'][infer_type(value)] += 1
+                
+                # The first value seen is the example; no others are kept
+                if stats['present'] == 1:
+                    stats['example'] = value
                 
         # Convert stats to parameters
         parameters = []
         for param_name, stats in param_stats.items():
             # Determine most common type
-            most_common_type = stats['types'].most_common(1)[0][0]
+            most_common_type = max(stats['types'].items(), key=itemgetter(1))[0]
             
             # Determine if required (appears in > 50% of calls)
-            required = stats['required'] / len(calls) > 0.5
-            
-            # Get example value
-            example = stats['values'][0] if stats['values'] else None
+            required = stats['present'] / len(calls) > 0.5
             
             parameter = Parameter(
                 name=param_name,
                 type=most_common_type,
                 required=required,
-                example=example,
+                example=stats['example'],
                 description=f"Query parameter: {param_name}"
             )
             parameters.append(parameter)
@@ -341,21 +526,18 @@ class RequestAnalyzer:
         
     def _analyze_headers(self, calls: List[APICall]) -> List[Parameter]:
         """Analyze common headers that might be required."""
-        header_stats = defaultdict(lambda: {'count': 0, 'values': set()})
+        header_counts = Counter()
         
         for call in calls:
-            for header, value in call.request.headers.items():
+            for header, header_lower, _ in _lower_header_items(call.request.headers):
                 # Skip standard HTTP headers
-                if header.lower() in ['host', 'user-agent', 'accept', 'content-length']:
-                    continue
-                    
-                header_stats[header]['count'] += 1
-                header_stats[header]['values'].add(value)
+                if header_lower not in _STANDARD_HEADERS:
+                    header_counts[header] += 1
                 
         # Only include headers that appear in most calls
         parameters = []
-        for header, stats in header_stats.items():
-            if stats['count'] / len(calls) > 0.8:  # Appears in 80% of calls
+        for header, count in header_counts.items():
+            if count / len(calls) > 0.8:  # Appears in 80% of calls
                 parameter = Parameter(
                     name=header,
                     type=ParameterType.STRING,
@@ -371,14 +553,10 @@ class RequestAnalyzer:
         bodies = []
         
         for call in calls:
-            if call.request.body:
-                try:
-                    # Try to parse as JSON
-                    body_data = json.loads(call.request.body)
-                    bodies.append(body_data)
-                except json.JSONDecodeError:
-                    # Handle non-JSON bodies
-                    continue
+            # Non-JSON bodies are skipped
+            body_data = call.request.json_body()
+            if body_data is not NOT_JSON:
+                bodies.append(body_data)
                     
         if not bodies:
             return None
@@ -400,34 +578,43 @@ class RequestAnalyzer:
             # Analyze response bodies
             schema = None
             examples = []
+            samples = []
+            seen = 0
             
             for response in response_list:
-                if response.body:
-                    try:
-                        body_data = json.loads(response.body)
-                        examples.append(body_data)
-                        if schema is None:
-                            schema = self.type_inferencer.infer_schema(body_data)
-                    except json.JSONDecodeError:
-                        continue
-                        
+                body_data = response.json_body()
+                if body_data is NOT_JSON:
+                    continue
+                    
+                # The first body is always the lead example and gives the
+                # schema; a reproducible sample of the rest fills the other
+                # two example slots
+                seen += 1
+                if seen == 1:
+                    examples.append(body_data)
+                    schema = self.type_inferencer.infer_schema(body_data)
+                else:
+                    _reservoir_add(samples, seen - 1, body_data, 2, self._random)
+                    
+            examples.extend(samples)
             response_schema = ResponseSchema(
                 status_code=status_code,
                 content_type=content_type,
                 schema=schema or {},
-                examples=examples[:3]  # Keep only first 3 examples
+                examples=examples
             )
             responses.append(response_schema)
             
         return responses
         
-    def _detect_auth_requirement(self, calls: List[APICall]) -> bool:
+    def _detect_auth_requirement(self, calls: List[APICall],
+                                 views: Optional[List[_CallView]] = None) -> bool:
         """Detect if authentication is required for this endpoint."""
-        auth_headers = ['authorization', 'x-api-key', 'apikey', 'api-key']
-        
-        for call in calls:
-            headers = {k.lower(): v for k, v in call.request.headers.items()}
-            if any(auth_header in headers for auth_header in auth_headers):
+        if views is None:
+            views = self._preprocess(calls)
+            
+        for view in views:
+            if not _AUTH_HEADERS.isdisjoint(view.header_names):
                 return True
                 
         return False
@@ -450,13 +637,18 @@ class RequestAnalyzer:
         
         return f"{operation} {resource}"
         
-    def _determine_base_url(self, calls: List[APICall]) -> str:
+    def _determine_base_url(self, calls: List[APICall],
+                            views: Optional[List[_CallView]] = None) -> str:
         """Determine the base URL from captured calls."""
         if not calls:
             return "https://api.example.com"
             
-        # Use the first call to determine base URL
-        first_url = calls[0].request.url
-        parsed = urlparse(first_url)
+        if views is None:
+            views = self._preprocess(calls)
+            
+        # Use the most common origin, so a few calls to other hosts
+        # (CDNs, auth servers) don't decide the base URL
+        origins = Counter(view.origin for view in views)
+        scheme, netloc = origins.most_common(1)[0][0]
         
-        return f"{parsed.scheme}://{parsed.netloc}"
\ No newline at end of file
+        return f"{scheme}://{netloc}"
\ No newline at end of file
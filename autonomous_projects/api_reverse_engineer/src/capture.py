@@ -2,11 +2,14 @@
 Traffic capture module using mitmproxy for intercepting HTTP(S) requests.
 """
 
-import json
+import sys
 import time
+import queue
 import logging
 import threading
-from typing import Dict, List, Optional, Callable, Set
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Callable
 from urllib.parse import urlparse, parse_qs
 from pathlib import Path
 
@@ -14,7 +17,37 @@ from mitmproxy import http, options
 from mitmproxy.tools.dump import DumpMaster
 from mitmproxy.addons import script
 
-from .types import APICall, CapturedRequest, CapturedResponse
+from . import serialization
+from .types import APICall, CapturedRequest, CapturedResponse, CaseInsensitiveDict
+
+
+# Content types whose bodies are never text, so decoding them is skipped
+_BINARY_CT_PREFIXES = (
+    'image/', 'video/', 'audio/', 'font/',
+    'application/octet-stream', 'application/pdf', 'application/zip'
+)
+
+
+def _intern_headers(headers) -> CaseInsensitiveDict:
+    """
+    Copy headers, interning the names.
+    
+    The same few header names repeat on every call, so interning them lets
+    all captured calls share one string object per name.
+    """
+    return CaseInsensitiveDict({
+        sys.intern(name): value for name, value in headers.items()
+    })
+
+
+def _decode_body(content: bytes, content_type: str) -> Optional[str]:
+    """Decode a body as text, or describe it if it is binary."""
+    if not content:
+        return None
+    if content_type.lower().startswith(_BINARY_CT_PREFIXES):
+        return f"<binary data: {len(content)} bytes>"
+    # Replace undecodable bytes rather than taking the exception path
+    return content.decode('utf-8', errors='replace')
 
 
 class TrafficCapture:
@@ -24,32 +57,42 @@ class TrafficCapture:
     
     def __init__(self, 
                  port: int = 8080,
-                 target_hosts: Optional[Set[str]] = None,
+                 target_hosts: Optional[Iterable[str]] = None,
                  output_file: Optional[str] = None,
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 max_calls: Optional[int] = None):
         """
         Initialize the traffic capture.
         
         Args:
             port: Port for the proxy server
-            target_hosts: Set of hostnames to capture (None = capture all)
+            target_hosts: Hostnames to capture (None = capture all)
             output_file: File to save captured data
             verbose: Enable verbose logging
+            max_calls: Keep only the most recent calls (None = keep all)
         """
         self.port = port
-        self.target_hosts = target_hosts or set()
+        self.target_hosts = frozenset(target_hosts or ())
         self.output_file = output_file
         self.verbose = verbose
+        self.max_calls = max_calls
         
-        # Storage for captured API calls
-        self.captured_calls: List[APICall] = []
+        # Storage for captured API calls, appended to from the proxy thread
+        self.captured_calls: Deque[APICall] = deque(maxlen=max_calls)
+        self._calls_lock = threading.Lock()
+        self._call_count = 0
         self.call_callbacks: List[Callable[[APICall], None]] = []
         
+        # Callbacks run on a worker thread so slow callbacks can't stall the proxy
+        self._callback_queue: "queue.Queue[Optional[APICall]]" = queue.Queue(maxsize=1000)
+        self._callback_thread: Optional[threading.Thread] = None
+        
         # mitmproxy components
         self.master: Optional[DumpMaster] = None
         self.addon = None
         self.capture_thread: Optional[threading.Thread] = None
         self.is_running = False
+        self._stop_event = threading.Event()
         
         # Setup logging
         self._setup_logging()
@@ -84,6 +127,8 @@ class TrafficCapture:
                 confdir=str(Path.home() / ".mitmproxy")
             )
             
+            self._stop_event.clear()
+            
             # Create the addon for handling requests
             self.addon = CaptureAddon(self)
             
@@ -118,20 +163,55 @@ class TrafficCapture:
             self.logger.error(f"Capture error: {e}")
         finally:
             self.is_running = False
+            self._stop_event.set()
             
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the capture stops.
+        
+        Args:
+            timeout: Maximum number of seconds to wait (None = no limit)
+            
+        Returns:
+            True if the capture stopped, False if the timeout expired
+        """
+        return self._stop_event.wait(timeout)
+        
     def stop_capture(self):
         """Stop capturing traffic."""
         if self.master:
             self.master.shutdown()
             self.is_running = False
+            self._stop_event.set()
             self.logger.info("Stopped traffic capture")
             
         if self.capture_thread and self.capture_thread.is_alive():
             self.capture_thread.join(timeout=5)
             
-    def get_captured_calls(self) -> List[APICall]:
-        """Get all captured API calls."""
-        return self.captured_calls.copy()
+        # Let pending callbacks finish, then stop the worker
+        if self._callback_thread and self._callback_thread.is_alive():
+            self._callback_queue.put(None)
+            self._callback_thread.join(timeout=5)
+        self._callback_thread = None
+            
+    @property
+    def call_count(self) -> int:
+        """Total number of calls captured, including any evicted by max_calls."""
+        return self._call_count
+        
+    def get_captured_calls(self, since: int = 0) -> List[APICall]:
+        """
+        Get captured API calls.
+        
+        Args:
+            since: Number of calls already seen; only calls captured after
+                those are returned
+        """
+        with self._calls_lock:
+            # Account for calls evicted by max_calls
+            evicted = self._call_count - len(self.captured_calls)
+            start = max(since - evicted, 0)
+            return list(islice(self.captured_calls, start, None))
         
     def save_to_file(self, filename: Optional[str] = None):
         """Save captured calls to a JSON file."""
@@ -139,29 +219,52 @@ class TrafficCapture:
         if not output_file:
             raise ValueError("No output file specified")
             
-        data = {
-            "captured_at": time.time(),
-            "total_calls": len(self.captured_calls),
-            "calls": [self._serialize_call(call) for call in self.captured_calls]
-        }
-        
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        with self._calls_lock:
+            calls = list(self.captured_calls)
             
-        self.logger.info(f"Saved {len(self.captured_calls)} calls to {output_file}")
+        # Write one call at a time so only a single serialized call is held
+        # in memory, rather than the whole capture
+        with open(output_file, 'wb') as f:
+            f.write(b'{"captured_at": %s, "total_calls": %d, "calls": [\n' % (
+                serialization.dumps(time.time()), len(calls)
+            ))
+            for i, call in enumerate(calls):
+                if i:
+                    f.write(b',\n')
+                f.write(serialization.dumps(self._serialize_call(call)))
+            f.write(b'\n]}\n')
+            
+        self.logger.info(f"Saved {len(calls)} calls to {output_file}")
         
     def load_from_file(self, filename: str):
         """Load captured calls from a JSON file."""
-        with open(filename, 'r') as f:
-            data = json.load(f)
+        with open(filename, 'rb') as f:
+            data = serialization.loads(f.read())
             
-        self.captured_calls = [
+        calls = [
             self._deserialize_call(call_data) 
             for call_data in data.get("calls", [])
         ]
         
+        with self._calls_lock:
+            self.captured_calls = deque(calls, maxlen=self.max_calls)
+            self._call_count = len(calls)
+        
         self.logger.info(f"Loaded {len(self.captured_calls)} calls from {filename}")
         
+    def iter_calls_from_file(self, filename: str) -> Iterator[APICall]:
+        """
+        Iterate over the calls in a JSON file written by save_to_file.
+        
+        Unlike load_from_file, the file is read in chunks as calls are
+        decoded one at a time, and calls are not stored on this capture.
+        Only the calls the consumer keeps stay in memory; the file text is
+        never held whole.
+        """
+        with open(filename, 'r', encoding='utf-8') as f:
+            for call_data in serialization.iter_items(f, "calls"):
+                yield self._deserialize_call(call_data)
+            
     def _serialize_call(self, call: APICall) -> Dict:
         """Serialize an APICall to a dictionary."""
         return {
@@ -190,8 +293,8 @@ class TrafficCapture:
         
         request = CapturedRequest(
             url=req_data["url"],
-            method=req_data["method"],
-            headers=req_data["headers"],
+            method=sys.intern(req_data["method"]),
+            headers=_intern_headers(req_data["headers"]),
             query_params=req_data["query_params"],
             body=req_data.get("body"),
             timestamp=req_data.get("timestamp")
@@ -199,7 +302,7 @@ class TrafficCapture:
         
         response = CapturedResponse(
             status_code=resp_data["status_code"],
-            headers=resp_data["headers"],
+            headers=_intern_headers(resp_data["headers"]),
             body=resp_data.get("body"),
             content_type=resp_data.get("content_type"),
             timestamp=resp_data.get("timestamp")
@@ -219,20 +322,45 @@ class TrafficCapture:
         
     def _handle_captured_call(self, call: APICall):
         """Handle a newly captured API call."""
-        self.captured_calls.append(call)
+        with self._calls_lock:
+            self.captured_calls.append(call)
+            self._call_count += 1
         
-        # Run callbacks
-        for callback in self.call_callbacks:
+        # Hand the call to the callback worker
+        if self.call_callbacks:
+            self._ensure_callback_worker()
             try:
-                callback(call)
-            except Exception as e:
-                self.logger.error(f"Callback error: {e}")
+                self._callback_queue.put_nowait(call)
+            except queue.Full:
+                self.logger.warning("Callback queue full, skipping callbacks for captured call")
                 
         if self.verbose:
             self.logger.debug(
                 f"Captured: {call.request.method} {call.request.url} "
                 f"-> {call.response.status_code}"
             )
+            
+    def _ensure_callback_worker(self):
+        """Start the callback worker thread if it isn't running."""
+        if self._callback_thread is None or not self._callback_thread.is_alive():
+            self._callback_thread = threading.Thread(
+                target=self._run_callbacks,
+                daemon=True
+            )
+            self._callback_thread.start()
+            
+    def _run_callbacks(self):
+        """Run callbacks for queued calls until a None sentinel is received."""
+        while True:
+            call = self._callback_queue.get()
+            if call is None:
+                return
+                
+            for callback in self.call_callbacks:
+                try:
+                    callback(call)
+                except Exception as e:
+                    self.logger.error(f"Callback error: {e}")
 
 
 class CaptureAddon:
@@ -250,9 +378,10 @@ class CaptureAddon:
     def response(self, flow: http.HTTPFlow):
         """Handle responses."""
         try:
-            # Check if we should capture this host
-            host = urlparse(flow.request.pretty_url).netloc
-            if not self.capture._should_capture_host(host):
+            # Check if we should capture this host; the URL is only parsed
+            # when a host filter is set
+            if (self.capture.target_hosts and
+                    not self.capture._should_capture_host(urlparse(flow.request.pretty_url).netloc)):
                 return
                 
             # Parse request
@@ -284,48 +413,48 @@ class CaptureAddon:
         """Parse mitmproxy request to CapturedRequest."""
         # Parse query parameters
         parsed_url = urlparse(request.pretty_url)
-        query_params = parse_qs(parsed_url.query)
-        
-        # Flatten single-item lists in query params
-        for key, value in query_params.items():
-            if len(value) == 1:
-                query_params[key] = value[0]
+        # Intern parameter names and flatten single-item lists
+        query_params = {
+            sys.intern(key): value[0] if len(value) == 1 else value
+            for key, value in parse_qs(parsed_url.query).items()
+        }
                 
         # Get body content
-        body = None
-        if request.content:
-            try:
-                body = request.content.decode('utf-8')
-            except UnicodeDecodeError:
-                body = f"<binary data: {len(request.content)} bytes>"
+        content_type = request.headers.get('content-type', '')
+        body = _decode_body(request.content, content_type)
                 
-        return CapturedRequest(
+        captured = CapturedRequest(
             url=request.pretty_url,
-            method=request.method,
-            headers=dict(request.headers),
+            method=sys.intern(request.method),
+            headers=_intern_headers(request.headers),
             query_params=query_params,
             body=body,
             timestamp=getattr(request, 'timestamp_start', time.time())
         )
         
+        # Parse JSON bodies once here so the analyzer never re-decodes them
+        if 'application/json' in content_type:
+            captured.json_body()
+            
+        return captured
+        
     def _parse_response(self, response: http.HTTPResponse) -> CapturedResponse:
         """Parse mitmproxy response to CapturedResponse."""
         # Get content type
         content_type = response.headers.get('content-type', '')
         
         # Get body content
-        body = None
-        if response.content:
-            try:
-                # Try to decode as text
-                body = response.content.decode('utf-8')
-            except UnicodeDecodeError:
-                body = f"<binary data: {len(response.content)} bytes>"
+        body = _decode_body(response.content, content_type)
                 
-        return CapturedResponse(
+        captured = CapturedResponse(
             status_code=response.status_code,
-            headers=dict(response.headers),
+            headers=_intern_headers(response.headers),
             body=body,
             content_type=content_type,
             timestamp=time.time()
-        )
\ No newline at end of file
+        )
+        
+        if 'application/json' in content_type:
+            captured.json_body()
+            
+        return captured
\ No newline at end of file
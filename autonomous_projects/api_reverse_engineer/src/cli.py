@@ -3,22 +3,70 @@ Command-line interface for the API reverse engineering tool.
 """
 
 import argparse
-import json
+import itertools
 import sys
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
+
+# Capture, analysis and generation modules are imported inside the commands
+# that use them, so a command only pays for the imports it needs (capture
+# pulls in mitmproxy)
+from . import serialization
+from .types import (
+    APISpec, AuthPattern, AuthType, Endpoint, HTTPMethod, Parameter, ParameterType, ResponseSchema
+)
+
+
+# HTTP method name -> HTTPMethod, avoiding an Enum value lookup per endpoint
+_METHOD_LOOKUP = {method.value: method for method in HTTPMethod}
+
+
+def _http_method(name: str) -> HTTPMethod:
+    """Look up an HTTP method by name, raising ValueError like HTTPMethod(name)."""
+    method = _METHOD_LOOKUP.get(name)
+    if method is None:
+        raise ValueError(f"{name!r} is not a valid HTTPMethod")
+    return method
+
+# Generator class in the generators package for each SDK language
+_GENERATOR_CLASSES = {
+    'python': 'PythonGenerator',
+    'typescript': 'TypeScriptGenerator',
+    'javascript': 'JavaScriptGenerator'
+}
+
+# Options of the workflow command: (flags, add_argument keyword arguments).
+# _add_workflow_args passes these to argparse and _parse_workflow_args reads
+# the destinations, types, defaults and choices from them
+_WORKFLOW_ARGS = (
+    (('--port',), {'type': int, 'default': 8080, 'help': 'Proxy server port (default: 8080)'}),
+    (('--hosts',), {'nargs': '*', 'help': 'Target hostnames to capture'}),
+    (('--duration',), {'type': int, 'default': 300, 'help': 'Capture duration in seconds (default: 300)'}),
+    (('--output-dir', '-o'), {'required': True, 'help': 'Output directory for all generated files'}),
+    (('--languages',), {'nargs': '*', 'choices': ['python', 'typescript', 'javascript'],
+                        'default': ['python', 'typescript'],
+                        'help': 'Programming languages to generate SDKs for'}),
+    (('--api-title',), {'help': 'API title'})
+)
+
+# Seconds between progress messages while capturing
+PROGRESS_INTERVAL = 5
+
+# Buffer size for large output files, so they are written in few syscalls
+WRITE_BUFFER_SIZE = 512 * 1024
 
-from .capture import TrafficCapture
-from .analyzer import RequestAnalyzer
-from .generators import PythonGenerator, TypeScriptGenerator, JavaScriptGenerator
-from .documentation import DocumentationGenerator
-from .types import APISpec
 
 
 def setup_logging(verbose: bool = False):
     """Setup logging configuration."""
+    # Configure once per process; later runs reuse the existing handlers
+    if logging.getLogger().handlers:
+        return
+        
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
@@ -32,8 +80,23 @@ class APIReverseEngineerCLI:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-    def create_parser(self) -> argparse.ArgumentParser:
-        """Create the argument parser."""
+    # Subcommand name -> (help text, method adding its arguments)
+    COMMANDS = {
+        'capture': ('Capture API traffic', '_add_capture_args'),
+        'analyze': ('Analyze captured traffic', '_add_analyze_args'),
+        'generate': ('Generate SDK from API spec', '_add_generate_args'),
+        'docs': ('Generate documentation', '_add_docs_args'),
+        'workflow': ('Complete capture and analysis workflow', '_add_workflow_args')
+    }
+    
+    def create_parser(self, argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+        """
+        Create the argument parser.
+        
+        If argv is given and names a subcommand, only that subcommand's
+        parser is built. Otherwise (no argv, help, or an unknown command)
+        all subcommands are built.
+        """
         parser = argparse.ArgumentParser(
             description="Automated API Reverse Engineering Tool",
             formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -55,25 +118,17 @@ Examples:
         
         subparsers = parser.add_subparsers(dest='command', help='Available commands')
         
-        # Capture command
-        capture_parser = subparsers.add_parser('capture', help='Capture API traffic')
-        self._add_capture_args(capture_parser)
-        
-        # Analyze command
-        analyze_parser = subparsers.add_parser('analyze', help='Analyze captured traffic')
-        self._add_analyze_args(analyze_parser)
-        
-        # Generate command
-        generate_parser = subparsers.add_parser('generate', help='Generate SDK from API spec')
-        self._add_generate_args(generate_parser)
-        
-        # Documentation command
-        docs_parser = subparsers.add_parser('docs', help='Generate documentation')
-        self._add_docs_args(docs_parser)
-        
-        # Complete workflow command
-        workflow_parser = subparsers.add_parser('workflow', help='Complete capture and analysis workflow')
-        self._add_workflow_args(workflow_parser)
+        # The first positional argument selects the subcommand
+        selected = next((arg for arg in argv or [] if not arg.startswith('-')), None)
+        if selected in self.COMMANDS:
+            commands = [selected]
+        else:
+            commands = list(self.COMMANDS)
+            
+        for command in commands:
+            help_text, add_args = self.COMMANDS[command]
+            command_parser = subparsers.add_parser(command, help=help_text)
+            getattr(self, add_args)(command_parser)
         
         # Global options
         parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose logging')
@@ -112,22 +167,87 @@ Examples:
         
     def _add_workflow_args(self, parser: argparse.ArgumentParser):
         """Add arguments for workflow command."""
-        parser.add_argument('--port', type=int, default=8080, help='Proxy server port (default: 8080)')
-        parser.add_argument('--hosts', nargs='*', help='Target hostnames to capture')
-        parser.add_argument('--duration', type=int, default=300, help='Capture duration in seconds (default: 300)')
-        parser.add_argument('--output-dir', '-o', required=True, help='Output directory for all generated files')
-        parser.add_argument('--languages', nargs='*', choices=['python', 'typescript', 'javascript'], 
-                          default=['python', 'typescript'], help='Programming languages to generate SDKs for')
-        parser.add_argument('--api-title', help='API title')
+        for flags, options in _WORKFLOW_ARGS:
+            parser.add_argument(*flags, **options)
+            
+    # Options of the workflow command for _parse_workflow_args, built from
+    # _WORKFLOW_ARGS: flag -> (destination, add_argument keyword arguments)
+    _WORKFLOW_OPTIONS = {
+        flag: (flags[0].lstrip('-').replace('-', '_'), options)
+        for flags, options in _WORKFLOW_ARGS
+        for flag in flags
+    }
+    
+    def _parse_workflow_args(self, argv: List[str]) -> Optional[argparse.Namespace]:
+        """
+        Parse a plain `workflow` command line without building a parser.
+        
+        Only `[-v] workflow --option value ...` is handled; for anything
+        else (other commands, help, unknown options, invalid or missing
+        values) None is returned so argparse parses and reports it.
+        """
+        verbose = False
+        argv = list(argv)
+        while argv and argv[0] in ('-v', '--verbose'):
+            verbose = True
+            argv.pop(0)
+            
+        if not argv or argv[0] != 'workflow':
+            return None
+            
+        values = {
+            'command': 'workflow',
+            'verbose': verbose
+        }
+        for dest, options in self._WORKFLOW_OPTIONS.values():
+            values[dest] = options.get('default')
+        
+        i = 1
+        while i < len(argv):
+            option = self._WORKFLOW_OPTIONS.get(argv[i])
+            if option is None:
+                return None
+            dest, options = option
+            value_type = options.get('type', str)
+            choices = options.get('choices')
+            
+            # Collect the values up to the next option
+            j = i + 1
+            while j < len(argv) and not argv[j].startswith('-'):
+                j += 1
+            option_values = argv[i + 1:j]
+            
+            multiple = options.get('nargs') == '*'
+            if not multiple and len(option_values) != 1:
+                return None
+            try:
+                option_values = [value_type(value) for value in option_values]
+            except ValueError:
+                return None
+            if choices is not None and not all(value in choices for value in option_values):
+                return None
+            values[dest] = option_values if multiple else option_values[0]
+            i = j
+            
+        for dest, options in self._WORKFLOW_OPTIONS.values():
+            if options.get('required') and values[dest] is None:
+                return None
+            
+        return argparse.Namespace(**values)
         
     def run(self, args: Optional[List[str]] = None):
         """Run the CLI with provided arguments."""
-        parser = self.create_parser()
-        parsed_args = parser.parse_args(args)
-        
-        if not parsed_args.command:
-            parser.print_help()
-            return
+        if args is None:
+            args = sys.argv[1:]
+            
+        parsed_args = self._parse_workflow_args(args)
+        if parsed_args is None:
+            parser = self.create_parser(args)
+            parsed_args = parser.parse_args(args)
+            
+            if not parsed_args.command:
+                parser.print_help()
+                return
             
         setup_logging(parsed_args.verbose)
         
@@ -153,27 +273,18 @@ Examples:
             
     def cmd_capture(self, args):
         """Handle capture command."""
+        from .capture import TrafficCapture
+        
         self.logger.info(f"Starting traffic capture on port {args.port}")
         
         # Create traffic capture instance
-        target_hosts = set(args.hosts) if args.hosts else None
         capture = TrafficCapture(
             port=args.port,
-            target_hosts=target_hosts,
+            target_hosts=args.hosts,
             output_file=args.output,
             verbose=args.verbose
         )
         
-        # Add callback to show progress
-        call_count = 0
-        def progress_callback(api_call):
-            nonlocal call_count
-            call_count += 1
-            if call_count % 10 == 0:
-                self.logger.info(f"Captured {call_count} API calls")
-                
-        capture.add_callback(progress_callback)
-        
         # Start capture
         if not capture.start_capture(background=False if args.duration else True):
             self.logger.error("Failed to start traffic capture")
@@ -182,71 +293,70 @@ Examples:
         try:
             if args.duration:
                 self.logger.info(f"Capturing for {args.duration} seconds...")
-                time.sleep(args.duration)
             else:
                 self.logger.info("Capturing traffic... Press Ctrl+C to stop")
-                while capture.is_running:
-                    time.sleep(1)
+            self._wait_with_progress(capture, args.duration)
         finally:
             capture.stop_capture()
             capture.save_to_file()
             
         self.logger.info(f"Captured {len(capture.captured_calls)} API calls to {args.output}")
         
+    def _wait_with_progress(self, capture, duration: Optional[float] = None):
+        """
+        Wait for a capture to stop, or for duration seconds, logging the
+        number of captured calls every PROGRESS_INTERVAL seconds.
+        
+        Progress is read from the capture's call count here rather than
+        counted in a per-call callback, so nothing extra runs per call.
+        """
+        deadline = time.monotonic() + duration if duration else None
+        last_count = 0
+        
+        while True:
+            timeout = PROGRESS_INTERVAL
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    return
+                    
+            if capture.wait(timeout=timeout):
+                return
+                
+            call_count = capture.call_count
+            if call_count != last_count:
+                self.logger.info("Captured %d API calls", call_count)
+                last_count = call_count
+                
     def cmd_analyze(self, args):
         """Handle analyze command."""
+        from .capture import TrafficCapture
+        from .analyzer import RequestAnalyzer
+        
         self.logger.info(f"Analyzing traffic from {args.input_file}")
         
-        # Load captured traffic
-        capture = TrafficCapture()
-        capture.load_from_file(args.input_file)
+        # Stream captured traffic into the analyzer
+        calls = TrafficCapture().iter_calls_from_file(args.input_file)
         
-        if not capture.captured_calls:
+        first_call = next(calls, None)
+        if first_call is None:
             self.logger.error("No API calls found in input file")
             return
             
         # Analyze traffic
         analyzer = RequestAnalyzer()
-        api_spec = analyzer.analyze_calls(capture.captured_calls)
+        api_spec = analyzer.analyze_calls(itertools.chain([first_call], calls))
         
         # Update API spec with user-provided values
         if args.api_title:
             api_spec.title = args.api_title
         api_spec.version = args.api_version
         
-        # Create output directory
+        # Save the spec, SDKs for requested languages and documentation
         output_dir = Path(args.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Save API specification
-        spec_file = output_dir / "api_spec.json"
-        with open(spec_file, 'w') as f:
-            json.dump(api_spec.to_dict(), f, indent=2)
-        self.logger.info(f"Saved API specification to {spec_file}")
-        
-        # Generate SDKs for requested languages
-        for language in args.languages:
-            self.logger.info(f"Generating {language} SDK...")
-            self._generate_sdk(api_spec, language, str(output_dir / language))
-            
-        # Generate documentation
-        self.logger.info("Generating documentation...")
-        doc_generator = DocumentationGenerator(api_spec)
-        
-        # Markdown documentation
-        markdown_file = output_dir / "README.md"
-        doc_generator.generate_markdown(str(markdown_file))
-        self.logger.info(f"Generated Markdown documentation: {markdown_file}")
-        
-        # OpenAPI specification
-        openapi_file = output_dir / "openapi.json"
-        doc_generator.generate_openapi(str(openapi_file))
-        self.logger.info(f"Generated OpenAPI specification: {openapi_file}")
-        
-        # Postman collection
-        postman_file = output_dir / "postman_collection.json"
-        doc_generator.generate_postman(str(postman_file))
-        self.logger.info(f"Generated Postman collection: {postman_file}")
+        self._emit_artifacts(api_spec, output_dir, {
+            language: str(output_dir / language) for language in args.languages
+        })
         
         self.logger.info(f"Analysis complete! Generated files in {output_dir}")
         
@@ -255,11 +365,7 @@ Examples:
         self.logger.info(f"Generating {args.language} SDK from {args.api_spec}")
         
         # Load API specification
-        with open(args.api_spec, 'r') as f:
-            spec_data = json.load(f)
-            
-        # Convert to APISpec object
-        api_spec = self._dict_to_api_spec(spec_data)
+        api_spec = self._load_api_spec(args.api_spec)
         
         # Generate SDK
         self._generate_sdk(api_spec, args.language, args.output_dir)
@@ -268,29 +374,39 @@ Examples:
         
     def cmd_docs(self, args):
         """Handle docs command."""
+        from .documentation import DocumentationGenerator
+        
         self.logger.info(f"Generating {args.format} documentation from {args.api_spec}")
         
         # Load API specification
-        with open(args.api_spec, 'r') as f:
-            spec_data = json.load(f)
-            
-        api_spec = self._dict_to_api_spec(spec_data)
+        api_spec = self._load_api_spec(args.api_spec)
         doc_generator = DocumentationGenerator(api_spec)
         
         if args.format == 'markdown':
             content = doc_generator.generate_markdown(args.output)
-        elif args.format == 'openapi':
-            content = json.dumps(doc_generator.generate_openapi(args.output), indent=2)
-        elif args.format == 'postman':
-            content = json.dumps(doc_generator.generate_postman(args.output), indent=2)
-            
-        if not args.output:
-            print(content)
+            if not args.output:
+                print(content)
         else:
+            # Serialize JSON formats once and use the bytes for either target
+            if args.format == 'openapi':
+                document = doc_generator.generate_openapi()
+            else:
+                document = doc_generator.generate_postman()
+            data = serialization.dumps_indented(document)
+            
+            if args.output:
+                Path(args.output).write_bytes(data)
+            else:
+                print(data.decode('utf-8'))
+                
+        if args.output:
             self.logger.info(f"Generated {args.format} documentation: {args.output}")
             
     def cmd_workflow(self, args):
         """Handle complete workflow command."""
+        from .capture import TrafficCapture
+        from .analyzer import RequestAnalyzer
+        
         self.logger.info("Starting complete API reverse engineering workflow")
         
         # Create output directory
@@ -301,10 +417,9 @@ Examples:
         self.logger.info("Step 1: Capturing API traffic...")
         traffic_file = output_dir / "captured_traffic.json"
         
-        target_hosts = set(args.hosts) if args.hosts else None
         capture = TrafficCapture(
             port=args.port,
-            target_hosts=target_hosts,
+            target_hosts=args.hosts,
             output_file=str(traffic_file),
             verbose=args.verbose
         )
@@ -315,7 +430,7 @@ Examples:
             
         try:
             self.logger.info(f"Capturing for {args.duration} seconds... Configure your application to use proxy at localhost:{args.port}")
-            time.sleep(args.duration)
+            capture.wait(timeout=args.duration)
         finally:
             capture.stop_capture()
             capture.save_to_file()
@@ -334,24 +449,12 @@ Examples:
         if args.api_title:
             api_spec.title = args.api_title
             
-        # Save API specification
+        # Step 3: Generate SDKs and documentation
+        self.logger.info("Step 3: Generating SDKs and documentation...")
+        self._emit_artifacts(api_spec, output_dir, {
+            language: str(output_dir / f"sdk_{language}") for language in args.languages
+        })
         spec_file = output_dir / "api_spec.json"
-        with open(spec_file, 'w') as f:
-            json.dump(api_spec.to_dict(), f, indent=2)
-            
-        # Step 3: Generate SDKs
-        self.logger.info("Step 3: Generating SDKs...")
-        for language in args.languages:
-            self.logger.info(f"Generating {language} SDK...")
-            self._generate_sdk(api_spec, language, str(output_dir / f"sdk_{language}"))
-            
-        # Step 4: Generate documentation
-        self.logger.info("Step 4: Generating documentation...")
-        doc_generator = DocumentationGenerator(api_spec)
-        
-        doc_generator.generate_markdown(str(output_dir / "README.md"))
-        doc_generator.generate_openapi(str(output_dir / "openapi.json"))
-        doc_generator.generate_postman(str(output_dir / "postman_collection.json"))
         
         self.logger.info(f"""
 Workflow complete! Generated files:
@@ -367,29 +470,103 @@ Summary:
 - Languages generated: {', '.join(args.languages)}
         """)
         
-    def _generate_sdk(self, api_spec: APISpec, language: str, output_dir: str):
+    def _emit_artifacts(self, api_spec: APISpec, output_dir: Path, sdk_dirs: Dict[str, str]):
+        """
+        Write the API spec, documentation and SDKs for an analyzed API.
+        
+        The spec and documentation files are written on background threads
+        while the SDKs are generated.
+        
+        Args:
+            api_spec: Analyzed API specification
+            output_dir: Directory for the spec and documentation files
+            sdk_dirs: Output directory for each SDK language
+        """
+        from .documentation import DocumentationGenerator
+        
+        # Create every output directory up front so the writers and
+        # generators don't each have to
+        for path in {output_dir, *map(Path, sdk_dirs.values())}:
+            path.mkdir(parents=True, exist_ok=True)
+            
+        doc_generator = DocumentationGenerator(api_spec).prepare()
+        doc_files = DocumentationGenerator.OUTPUT_FILES
+        outputs = [
+            (partial(self._write_api_spec, api_spec), output_dir / "api_spec.json", "API specification"),
+            (doc_generator.generate_markdown, output_dir / doc_files['markdown'], "Markdown documentation"),
+            (doc_generator.generate_openapi, output_dir / doc_files['openapi'], "OpenAPI specification"),
+            (doc_generator.generate_postman, output_dir / doc_files['postman'], "Postman collection")
+        ]
+        
+        with ThreadPoolExecutor(max_workers=len(outputs)) as pool:
+            futures = [
+                (pool.submit(write, str(path)), path, description)
+                for write, path, description in outputs
+            ]
+            
+            self._generate_sdks(api_spec, sdk_dirs, already_created=True)
+            
+            # Re-raise any error from the background writes
+            for future, path, description in futures:
+                future.result()
+                self.logger.info("Generated %s: %s", description, path)
+                
+    def _write_api_spec(self, api_spec: APISpec, spec_file: str):
+        """Write the API specification JSON through a large write buffer."""
+        with open(spec_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            api_spec.write_json(f)
+            
+    def _generate_sdks(self, api_spec: APISpec, output_dirs: Dict[str, str],
+                       already_created: bool = False):
+        """
+        Generate SDKs for several languages concurrently.
+        
+        Args:
+            api_spec: API specification to generate from
+            output_dirs: Output directory for each language
+            already_created: Whether the output directories already exist
+        """
+        for language in output_dirs:
+            self.logger.info("Generating %s SDK...", language)
+            
+        # Generators only read the spec, so they can share it across threads
+        with ThreadPoolExecutor(max_workers=max(len(output_dirs), 1)) as pool:
+            futures = [
+                pool.submit(self._generate_sdk, api_spec, language, output_dir, already_created)
+                for language, output_dir in output_dirs.items()
+            ]
+            for future in futures:
+                future.result()
+                
+    def _generate_sdk(self, api_spec: APISpec, language: str, output_dir: str,
+                      already_created: bool = False):
         """Generate SDK for a specific language."""
-        generators = {
-            'python': PythonGenerator,
-            'typescript': TypeScriptGenerator,
-            'javascript': JavaScriptGenerator
-        }
+        from . import generators
         
-        generator_class = generators.get(language)
-        if not generator_class:
+        class_name = _GENERATOR_CLASSES.get(language)
+        if not class_name:
             raise ValueError(f"Unsupported language: {language}")
             
-        generator = generator_class(api_spec)
-        files = generator.generate(output_dir)
-        
-        self.logger.info(f"Generated {len(files)} files for {language} SDK")
-        
+        # Only the requested language's generator module is imported
+        generator_class = getattr(generators, class_name)
+        generator = generator_class(api_spec, create_output_dir=not already_created)
+        # Only the file count is used, so the content isn't kept
+        files = generator.generate(output_dir, return_contents=False)
+        
+        self.logger.info("Generated %d files for %s SDK", len(files), language)
+        
+    def _load_api_spec(self, spec_path: str) -> APISpec:
+        """Load an API specification file."""
+        with open(spec_path, 'rb') as f:
+            return self._dict_to_api_spec(serialization.loads(f.read()))
+            
     def _dict_to_api_spec(self, data: dict) -> APISpec:
-        """Convert dictionary to APISpec object."""
-        # This is a simplified conversion - in a full implementation,
-        # you'd need to properly reconstruct all the nested objects
-        from .types import APISpec, Endpoint, HTTPMethod
+        """
+        Convert dictionary to APISpec object.
         
+        Everything APISpec.to_dict() writes is rebuilt, so a spec file
+        loads back to the spec it was written from.
+        """
         api_spec = APISpec(
             base_url=data.get('base_url', ''),
             title=data.get('title', 'Generated API'),
@@ -397,18 +574,47 @@ Summary:
             description=data.get('description', '')
         )
         
-        # Convert endpoints (simplified)
-        for ep_data in data.get('endpoints', []):
-            endpoint = Endpoint(
+        api_spec.endpoints = [
+            Endpoint(
                 path=ep_data['path'],
-                method=HTTPMethod(ep_data['method']),
+                method=_http_method(ep_data['method']),
                 summary=ep_data.get('summary'),
-                description=ep_data.get('description')
+                description=ep_data.get('description'),
+                parameters=[self._dict_to_parameter(p) for p in ep_data.get('parameters', [])],
+                query_params=[self._dict_to_parameter(p) for p in ep_data.get('query_params', [])],
+                responses=[
+                    ResponseSchema(
+                        status_code=r['status_code'],
+                        content_type=r.get('content_type'),
+                        schema=r.get('schema')
+                    )
+                    for r in ep_data.get('responses', [])
+                ]
+            )
+            for ep_data in data.get('endpoints', [])
+        ]
+        
+        api_spec.auth_patterns = [
+            AuthPattern(
+                type=AuthType(auth['type']),
+                header_name=auth.get('header_name'),
+                parameter_name=auth.get('parameter_name'),
+                token_prefix=auth.get('token_prefix')
             )
-            api_spec.endpoints.append(endpoint)
+            for auth in data.get('auth_patterns', [])
+        ]
             
         return api_spec
-
+        
+    def _dict_to_parameter(self, data: Dict[str, Any]) -> Parameter:
+        """Convert a parameter dictionary to a Parameter."""
+        return Parameter(
+            name=data['name'],
+            type=ParameterType(data['type']),
+            required=data.get('required', False),
+            description=data.get('description'),
+            example=data.get('example')
+        )
 
 def main():
     """Main entry point for the CLI."""
@@ -2,63 +2,326 @@
 Documentation generator for API specifications.
 """
 
+import io
+import itertools
 import json
-from typing import Dict, List, Any, Optional
+import re
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import textwrap
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
+from . import serialization
 from .types import APISpec, Endpoint, Parameter, ResponseSchema, AuthType
 
 
+# OpenAPI security scheme names, in order of preference
+_SECURITY_SCHEMES = [
+    (AuthType.BEARER_TOKEN, "bearerAuth"),
+    (AuthType.API_KEY, "apiKey"),
+    (AuthType.BASIC_AUTH, "basicAuth")
+]
+
+
+def _dumps_pretty(data: Any) -> str:
+    """Serialize data to JSON text with two-space indentation."""
+    return serialization.dumps_indented(data).decode('utf-8')
+
+
+# Markdown badge for each HTTP method
+_METHOD_BADGES = {
+    "GET": "🟢 GET",
+    "POST": "🟡 POST", 
+    "PUT": "🔵 PUT",
+    "DELETE": "🔴 DELETE",
+    "PATCH": "🟠 PATCH",
+    "HEAD": "⚪ HEAD",
+    "OPTIONS": "⚫ OPTIONS"
+}
+
+# Reason phrase for each documented HTTP status code
+_STATUS_DESCRIPTIONS = {
+    200: "OK",
+    201: "Created",
+    202: "Accepted",
+    204: "No Content",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    422: "Unprocessable Entity",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable"
+}
+
+# Static Markdown text following the title section fields
+_TABLE_OF_CONTENTS = """
+
+---
+
+## Table of Contents
+
+- [Authentication](#authentication)
+- [Rate Limiting](#rate-limiting)
+- [Endpoints](#endpoints)
+- [Examples](#examples)
+- [Error Handling](#error-handling)"""
+
+# Markdown error handling section, which doesn't depend on the spec
+_ERROR_HANDLING_SECTION = """## Error Handling
+
+The API uses standard HTTP status codes to indicate success or failure of requests.
+
+### Common Status Codes
+
+| Code | Description |
+|------|-------------|
+| 200 | Success |
+| 201 | Created |
+| 400 | Bad Request - Invalid parameters |
+| 401 | Unauthorized - Authentication required |
+| 403 | Forbidden - Insufficient permissions |
+| 404 | Not Found - Resource does not exist |
+| 429 | Too Many Requests - Rate limit exceeded |
+| 500 | Internal Server Error |
+
+### Error Response Format
+
+Error responses typically include additional information:
+
+```json
+{
+  "error": {
+    "code": "INVALID_REQUEST",
+    "message": "The request parameters are invalid",
+    "details": {}
+  }
+}
+```"""
+
+# Path template variable, e.g. {id}
+_PATH_VAR_RE = re.compile(r"\{([^}]+)\}")
+
+# Markdown parameter table row, and its Required column by param.required
+_PARAM_ROW = "\n| `{}` | {} | {} | {} | {} |".format
+_REQUIRED_MARKS = ("❌", "✅")
+
+
+class _EndpointView:
+    """Per-endpoint values derived once and shared by the output formats."""
+    
+    __slots__ = ('endpoint', 'method', 'method_lower', 'parameters', 'request_body_json', 'example_path',
+                 'query_examples', 'path_parts')
+    
+    def __init__(self, endpoint: Endpoint):
+        self.endpoint = endpoint
+        self.method = endpoint.method.value
+        self.method_lower = self.method.lower()
+        # (parameter, location) for path, query and header parameters
+        self.parameters = tuple(itertools.chain(
+            ((param, "path") for param in endpoint.parameters),
+            ((param, "query") for param in endpoint.query_params),
+            ((param, "header") for param in endpoint.headers)
+        ))
+        # Indented request body JSON, or None without a body
+        self.request_body_json = _dumps_pretty(endpoint.request_body) if endpoint.request_body else None
+        # Path with example values for its parameters, in a single pass
+        examples = {param.name: str(param.example or "123") for param in endpoint.parameters}
+        self.example_path = _PATH_VAR_RE.sub(
+            lambda match: examples.get(match.group(1), match.group(0)), endpoint.path
+        ) if examples else endpoint.path
+        # (name, example value) for query parameters that have an example
+        self.query_examples = [(param.name, param.example) for param in endpoint.query_params if param.example]
+        # Path segments for the Postman URL
+        self.path_parts = tuple(endpoint.path.strip('/').split('/')) if endpoint.path != '/' else ()
+
+
 class DocumentationGenerator:
     """Generate comprehensive documentation from API specifications."""
     
+    # File name written by generate_all() for each output format
+    OUTPUT_FILES = {
+        'markdown': 'README.md',
+        'openapi': 'openapi.json',
+        'postman': 'postman_collection.json'
+    }
+    
     def __init__(self, api_spec: APISpec):
         self.api_spec = api_spec
+        self._prepared_spec: Optional[APISpec] = None
+        
+    def prepare(self) -> 'DocumentationGenerator':
+        """
+        Precompute the data shared by all output formats.
+        
+        This runs automatically on first use and when api_spec is replaced;
+        call it again if the API spec is modified in place afterwards.
+        Generated outputs are reused until then.
+        """
+        # Outputs and endpoint views derived from the previous state of the spec
+        self._outputs: Dict[str, Any] = {}
+        self._endpoint_views: Dict[int, _EndpointView] = {}
+        
+        auth_types = {auth_pattern.type for auth_pattern in self.api_spec.auth_patterns}
+        
+        # Security requirement for authenticated OpenAPI operations
+        self._security = next(
+            ([{name: []}] for auth_type, name in _SECURITY_SCHEMES if auth_type in auth_types),
+            None
+        )
+        
+        # Auth headers of authenticated endpoints, formatted once per target,
+        # and the OpenAPI security schemes of the auth patterns
+        curl_lines, code_lines, postman_headers = [], [], []
+        self._security_schemes: Dict[str, Dict[str, str]] = {}
+        for auth_pattern in self.api_spec.auth_patterns:
+            if auth_pattern.type == AuthType.BEARER_TOKEN:
+                curl_lines.append('-H "Authorization: Bearer YOUR_TOKEN"')
+                code_lines.append('    "Authorization": "Bearer YOUR_TOKEN"')
+                postman_headers.append(("Authorization", "Bearer {{token}}"))
+                self._security_schemes["bearerAuth"] = {"type": "http", "scheme": "bearer"}
+            elif auth_pattern.type == AuthType.API_KEY:
+                header_name = auth_pattern.header_name or "X-API-Key"
+                curl_lines.append(f'-H "{header_name}: YOUR_API_KEY"')
+                code_lines.append(f'    "{header_name}": "YOUR_API_KEY"')
+                postman_headers.append((header_name, "{{apiKey}}"))
+                self._security_schemes["apiKey"] = {"type": "apiKey", "in": "header", "name": header_name}
+            elif auth_pattern.type == AuthType.BASIC_AUTH:
+                self._security_schemes["basicAuth"] = {"type": "http", "scheme": "basic"}
+        self._curl_auth_lines = tuple(curl_lines)
+        self._code_auth_lines = tuple(code_lines)
+        self._postman_auth_headers = tuple(postman_headers)
+        
+
+        # Endpoints grouped by their first path segment ('' for the root)
+        self._resource_groups: Dict[str, List[Endpoint]] = defaultdict(list)
+        for endpoint in self.api_spec.endpoints:
+            path = endpoint.path
+            resource = path[1:].partition('/')[0] if path.startswith('/') else ''
+            self._resource_groups[resource].append(endpoint)
+            
+        self._prepared_spec = self.api_spec
+        return self
+        
+    def _ensure_prepared(self):
+        """Run prepare() if it hasn't been run yet for the current API spec."""
+        if self._prepared_spec is not self.api_spec:
+            self.prepare()
+            
+    def _endpoint_view(self, endpoint: Endpoint) -> _EndpointView:
+        """Get the shared derived values for an endpoint."""
+        self._ensure_prepared()
+        view = self._endpoint_views.get(id(endpoint))
+        if view is None or view.endpoint is not endpoint:
+            view = self._endpoint_views[id(endpoint)] = _EndpointView(endpoint)
+        return view
+        
+    def _cached_output(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return the output of build(), reusing it until the next prepare()."""
+        self._ensure_prepared()
+        output = self._outputs.get(name)
+        if output is None:
+            output = self._outputs[name] = build()
+        return output
         
     def generate_markdown(self, output_file: Optional[str] = None) -> str:
         """Generate Markdown documentation."""
-        content = self._generate_markdown_content()
+        content = self._cached_output('markdown', self._generate_markdown_content)
         
         if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Encoded in one pass and written in binary mode, rather than
+            # through a text wrapper's incremental encoder
+            data = self._cached_output('markdown_bytes', lambda: content.encode('utf-8'))
+            with open(output_file, 'wb') as f:
+                f.write(data)
                 
         return content
         
     def generate_openapi(self, output_file: Optional[str] = None) -> Dict[str, Any]:
-        """Generate OpenAPI 3.0 specification."""
-        spec = self._generate_openapi_spec()
+        """
+        Generate OpenAPI 3.0 specification.
+        
+        Repeated calls share the returned dictionary, which must not be
+        modified.
+        """
+        spec = self._cached_output('openapi', self._generate_openapi_spec)
         
         if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(spec, f, indent=2)
+            self._write_json_file(output_file, 'openapi', spec)
                 
         return spec
         
     def generate_postman(self, output_file: Optional[str] = None) -> Dict[str, Any]:
-        """Generate Postman collection."""
-        collection = self._generate_postman_collection()
+        """
+        Generate Postman collection.
+        
+        Repeated calls share the returned dictionary, which must not be
+        modified.
+        """
+        collection = self._cached_output('postman', self._generate_postman_collection)
         
         if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(collection, f, indent=2)
+            self._write_json_file(output_file, 'postman', collection)
                 
         return collection
         
+    def generate_all(self, output_dir: str) -> Dict[str, Any]:
+        """
+        Generate every output format into output_dir, using OUTPUT_FILES.
+        
+        The formats are independent, so they are generated and written on
+        separate threads.
+        
+        Returns:
+            Dict mapping format name to the generated output
+        """
+        self._ensure_prepared()
+        generators = {
+            'markdown': self.generate_markdown,
+            'openapi': self.generate_openapi,
+            'postman': self.generate_postman
+        }
+        
+        with ThreadPoolExecutor(max_workers=len(generators)) as pool:
+            futures = {
+                name: pool.submit(generate, str(Path(output_dir) / self.OUTPUT_FILES[name]))
+                for name, generate in generators.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+            
+    def _write_json_file(self, output_file: str, name: str, document: Dict[str, Any]):
+        """
+        Write a generated document as indented JSON in a single write.
+        
+        The serialized bytes are kept with the document, so writing it again
+        doesn't re-serialize it.
+        """
+        data = self._cached_output(f"{name}_json", lambda: serialization.dumps_indented(document))
+        with open(output_file, 'wb') as f:
+            f.write(data)
+            
     def _generate_markdown_content(self) -> str:
         """Generate the complete Markdown documentation."""
-        sections = [
-            self._generate_title_section(),
-            self._generate_overview_section(),
-            self._generate_authentication_section(),
-            self._generate_rate_limiting_section(),
-            self._generate_endpoints_section(),
-            self._generate_examples_section(),
-            self._generate_error_handling_section()
-        ]
-        
-        return "\n\n".join(filter(None, sections))
+        # Sections write straight into one buffer instead of being joined
+        # level by level; the separators between them are written here
+        buf = io.StringIO()
+        buf.write(self._generate_title_section())
+        buf.write("\n\n")
+        buf.write(self._generate_overview_section())
+        buf.write("\n\n")
+        self._write_authentication_section(buf)
+        buf.write("\n\n")
+        self._write_rate_limiting_section(buf)
+        buf.write("\n\n")
+        self._write_endpoints_section(buf)
+        buf.write("\n\n")
+        self._write_examples_section(buf)
+        buf.write("\n\n")
+        buf.write(self._generate_error_handling_section())
+        return buf.getvalue()
         
     def _generate_title_section(self) -> str:
         """Generate the title and description section."""
@@ -67,17 +330,7 @@ class DocumentationGenerator:
 {self.api_spec.description}
 
 **Base URL:** `{self.api_spec.base_url}`
-**Version:** {self.api_spec.version}
-
----
-
-## Table of Contents
-
-- [Authentication](#authentication)
-- [Rate Limiting](#rate-limiting)
-- [Endpoints](#endpoints)
-- [Examples](#examples)
-- [Error Handling](#error-handling)"""
+**Version:** {self.api_spec.version}""" + _TABLE_OF_CONTENTS
         
     def _generate_overview_section(self) -> str:
         """Generate the API overview section."""
@@ -94,216 +347,159 @@ This API documentation was automatically generated from network traffic analysis
         
     def _generate_authentication_section(self) -> str:
         """Generate the authentication section."""
+        buf = io.StringIO()
+        self._write_authentication_section(buf)
+        return buf.getvalue()
+        
+    def _write_authentication_section(self, buf: io.StringIO):
+        """Write the authentication section."""
         if not self.api_spec.auth_patterns:
-            return "## Authentication\n\nNo authentication required."
+            buf.write("## Authentication\n\nNo authentication required.")
+            return
             
-        content = ["## Authentication"]
+        write = buf.write
+        write("## Authentication")
         
         for i, auth_pattern in enumerate(self.api_spec.auth_patterns):
-            content.append(f"\n### Method {i + 1}: {auth_pattern.type.value.replace('_', ' ').title()}")
+            write(f"\n\n### Method {i + 1}: {auth_pattern.type.value.replace('_', ' ').title()}")
             
             if auth_pattern.type == AuthType.BEARER_TOKEN:
-                content.append("Include the Bearer token in the Authorization header:")
-                content.append("```")
-                content.append("Authorization: Bearer YOUR_TOKEN")
-                content.append("```")
+                write("\nInclude the Bearer token in the Authorization header:")
+                write("\n```\nAuthorization: Bearer YOUR_TOKEN\n```")
                 
             elif auth_pattern.type == AuthType.API_KEY:
                 header_name = auth_pattern.header_name or "X-API-Key"
-                content.append(f"Include your API key in the `{header_name}` header:")
-                content.append("```")
-                content.append(f"{header_name}: YOUR_API_KEY")
-                content.append("```")
+                write(f"\nInclude your API key in the `{header_name}` header:")
+                write(f"\n```\n{header_name}: YOUR_API_KEY\n```")
                 
             elif auth_pattern.type == AuthType.BASIC_AUTH:
-                content.append("Use HTTP Basic Authentication:")
-                content.append("```")
-                content.append("Authorization: Basic BASE64(username:password)")
-                content.append("```")
+                write("\nUse HTTP Basic Authentication:")
+                write("\n```\nAuthorization: Basic BASE64(username:password)\n```")
                 
             elif auth_pattern.type == AuthType.CUSTOM_HEADER:
                 header_name = auth_pattern.header_name or "Authorization"
-                content.append(f"Include authentication in the `{header_name}` header:")
-                content.append("```")
-                content.append(f"{header_name}: YOUR_AUTH_VALUE")
-                content.append("```")
+                write(f"\nInclude authentication in the `{header_name}` header:")
+                write(f"\n```\n{header_name}: YOUR_AUTH_VALUE\n```")
                 
-        return "\n".join(content)
-        
-    def _generate_rate_limiting_section(self) -> str:
-        """Generate the rate limiting section."""
+    def _write_rate_limiting_section(self, buf: io.StringIO):
+        """Write the rate limiting section."""
         if not self.api_spec.rate_limits:
-            return "## Rate Limiting\n\nNo rate limiting detected."
+            buf.write("## Rate Limiting\n\nNo rate limiting detected.")
+            return
             
-        content = ["## Rate Limiting"]
+        write = buf.write
+        write("## Rate Limiting")
         rate_limits = self.api_spec.rate_limits
         
         if rate_limits.requests_per_minute:
-            content.append(f"- **Per minute:** {rate_limits.requests_per_minute} requests")
+            write(f"\n- **Per minute:** {rate_limits.requests_per_minute} requests")
         if rate_limits.requests_per_hour:
-            content.append(f"- **Per hour:** {rate_limits.requests_per_hour} requests")
+            write(f"\n- **Per hour:** {rate_limits.requests_per_hour} requests")
         if rate_limits.requests_per_day:
-            content.append(f"- **Per day:** {rate_limits.requests_per_day} requests")
+            write(f"\n- **Per day:** {rate_limits.requests_per_day} requests")
             
         if rate_limits.headers:
-            content.append("\n**Rate limiting headers detected:**")
+            write("\n\n**Rate limiting headers detected:**")
             for header, description in rate_limits.headers.items():
-                content.append(f"- `{header}`: {description}")
+                write(f"\n- `{header}`: {description}")
                 
-        return "\n".join(content)
-        
-    def _generate_endpoints_section(self) -> str:
-        """Generate the endpoints section."""
-        content = ["## Endpoints"]
+    def _write_endpoints_section(self, buf: io.StringIO):
+        """Write the endpoints section."""
+        buf.write("## Endpoints")
+        self._ensure_prepared()
         
-        # Group endpoints by path for better organization
-        path_groups = {}
-        for endpoint in self.api_spec.endpoints:
-            base_path = endpoint.path.split('/')[1] if endpoint.path.startswith('/') else endpoint.path
-            if base_path not in path_groups:
-                path_groups[base_path] = []
-            path_groups[base_path].append(endpoint)
-            
-        for path_group, endpoints in path_groups.items():
+        # Endpoints are grouped by path for better organization
+        for path_group, endpoints in self._resource_groups.items():
             if path_group:
-                content.append(f"\n### {path_group.title()} Operations")
+                buf.write(f"\n\n### {path_group.title()} Operations")
             else:
-                content.append(f"\n### Root Operations")
+                buf.write("\n\n### Root Operations")
                 
             for endpoint in endpoints:
-                content.append(self._generate_endpoint_documentation(endpoint))
+                buf.write("\n")
+                self._write_endpoint_documentation(buf, endpoint)
                 
-        return "\n".join(content)
-        
-    def _generate_endpoint_documentation(self, endpoint: Endpoint) -> str:
-        """Generate documentation for a single endpoint."""
-        content = []
+    def _write_endpoint_documentation(self, buf: io.StringIO, endpoint: Endpoint):
+        """Write documentation for a single endpoint."""
+        write = buf.write
+        view = self._endpoint_view(endpoint)
         
         # Endpoint header
-        method_badge = self._get_method_badge(endpoint.method.value)
-        content.append(f"\n#### {method_badge} `{endpoint.path}`")
+        method_badge = self._get_method_badge(view.method)
+        write(f"\n#### {method_badge} `{endpoint.path}`")
         
         if endpoint.summary:
-            content.append(f"\n**{endpoint.summary}**")
+            write(f"\n\n**{endpoint.summary}**")
             
         if endpoint.description:
-            content.append(f"\n{endpoint.description}")
+            write(f"\n\n{endpoint.description}")
             
         # Authentication requirement
         if endpoint.auth_required:
-            content.append("\n🔒 **Authentication required**")
+            write("\n\n🔒 **Authentication required**")
             
         # Parameters
-        all_params = endpoint.parameters + endpoint.query_params + endpoint.headers
-        if all_params:
-            content.append("\n**Parameters:**")
-            content.append("\n| Name | Type | Location | Required | Description |")
-            content.append("|------|------|----------|----------|-------------|")
-            
-            for param in endpoint.parameters:
-                location = "path"
-                required = "✅" if param.required else "❌"
-                description = param.description or "-"
-                content.append(f"| `{param.name}` | {param.type.value} | {location} | {required} | {description} |")
-                
-            for param in endpoint.query_params:
-                location = "query"
-                required = "✅" if param.required else "❌"
-                description = param.description or "-"
-                content.append(f"| `{param.name}` | {param.type.value} | {location} | {required} | {description} |")
-                
-            for param in endpoint.headers:
-                location = "header"
-                required = "✅" if param.required else "❌"
-                description = param.description or "-"
-                content.append(f"| `{param.name}` | {param.type.value} | {location} | {required} | {description} |")
+        if view.parameters:
+            write("\n\n**Parameters:**")
+            write("\n\n| Name | Type | Location | Required | Description |")
+            write("\n|------|------|----------|----------|-------------|")
+            write("".join(
+                _PARAM_ROW(param.name, param.type.value, location, _REQUIRED_MARKS[param.required],
+                           param.description or "-")
+                for param, location in view.parameters
+            ))
                 
         # Request body
-        if endpoint.request_body:
-            content.append("\n**Request Body:**")
-            content.append("```json")
-            content.append(json.dumps(endpoint.request_body, indent=2))
-            content.append("```")
+        if view.request_body_json is not None:
+            write("\n\n**Request Body:**\n```json\n")
+            write(view.request_body_json)
+            write("\n```")
             
         # Responses
         if endpoint.responses:
-            content.append("\n**Responses:**")
+            write("\n\n**Responses:**")
             for response in endpoint.responses:
-                content.append(f"\n**{response.status_code}** - {self._get_status_description(response.status_code)}")
+                write(f"\n\n**{response.status_code}** - {_STATUS_DESCRIPTIONS.get(response.status_code, 'Unknown')}")
                 
                 if response.content_type:
-                    content.append(f"Content-Type: `{response.content_type}`")
+                    write(f"\nContent-Type: `{response.content_type}`")
                     
                 if response.schema:
-                    content.append("```json")
-                    content.append(json.dumps(response.schema, indent=2))
-                    content.append("```")
+                    write("\n```json\n")
+                    write(_dumps_pretty(response.schema))
+                    write("\n```")
                     
                 if response.examples:
-                    content.append("**Example response:**")
-                    content.append("```json")
-                    content.append(json.dumps(response.examples[0], indent=2))
-                    content.append("```")
+                    write("\n**Example response:**\n```json\n")
+                    write(_dumps_pretty(response.examples[0]))
+                    write("\n```")
                     
-        return "\n".join(content)
-        
-    def _generate_examples_section(self) -> str:
-        """Generate usage examples section."""
-        content = ["## Examples"]
+    def _write_examples_section(self, buf: io.StringIO):
+        """Write the usage examples section."""
+        buf.write("## Examples")
         
         # Show examples for first few endpoints
         for i, endpoint in enumerate(self.api_spec.endpoints[:3]):
-            content.append(f"\n### Example {i + 1}: {endpoint.summary or endpoint.method.value + ' ' + endpoint.path}")
+            buf.write(f"\n\n### Example {i + 1}: {endpoint.summary or endpoint.method.value + ' ' + endpoint.path}")
+            
+            curl_cmd, python_code, js_code = self._generate_examples(endpoint)
             
             # cURL example
-            content.append("\n**cURL:**")
-            curl_cmd = self._generate_curl_example(endpoint)
-            content.append(f"```bash\n{curl_cmd}\n```")
+            buf.write("\n\n**cURL:**\n```bash\n")
+            buf.write(curl_cmd)
             
             # Python example
-            content.append("\n**Python (requests):**")
-            python_code = self._generate_python_example(endpoint)
-            content.append(f"```python\n{python_code}\n```")
+            buf.write("\n```\n\n**Python (requests):**\n```python\n")
+            buf.write(python_code)
             
             # JavaScript example
-            content.append("\n**JavaScript (fetch):**")
-            js_code = self._generate_javascript_example(endpoint)
-            content.append(f"```javascript\n{js_code}\n```")
+            buf.write("\n```\n\n**JavaScript (fetch):**\n```javascript\n")
+            buf.write(js_code)
+            buf.write("\n```")
             
-        return "\n".join(content)
-        
     def _generate_error_handling_section(self) -> str:
         """Generate error handling section."""
-        return """## Error Handling
-
-The API uses standard HTTP status codes to indicate success or failure of requests.
-
-### Common Status Codes
-
-| Code | Description |
-|------|-------------|
-| 200 | Success |
-| 201 | Created |
-| 400 | Bad Request - Invalid parameters |
-| 401 | Unauthorized - Authentication required |
-| 403 | Forbidden - Insufficient permissions |
-| 404 | Not Found - Resource does not exist |
-| 429 | Too Many Requests - Rate limit exceeded |
-| 500 | Internal Server Error |
-
-### Error Response Format
-
-Error responses typically include additional information:
-
-```json
-{
-  "error": {
-    "code": "INVALID_REQUEST",
-    "message": "The request parameters are invalid",
-    "details": {}
-  }
-}
-```"""
+        return _ERROR_HANDLING_SECTION
         
     def _generate_openapi_spec(self) -> Dict[str, Any]:
         """Generate OpenAPI 3.0 specification."""
@@ -328,29 +524,14 @@ Error responses typically include additional information:
         }
         
         # Add security schemes
-        for auth_pattern in self.api_spec.auth_patterns:
-            if auth_pattern.type == AuthType.BEARER_TOKEN:
-                spec["components"]["securitySchemes"]["bearerAuth"] = {
-                    "type": "http",
-                    "scheme": "bearer"
-                }
-            elif auth_pattern.type == AuthType.API_KEY:
-                header_name = auth_pattern.header_name or "X-API-Key"
-                spec["components"]["securitySchemes"]["apiKey"] = {
-                    "type": "apiKey",
-                    "in": "header",
-                    "name": header_name
-                }
-            elif auth_pattern.type == AuthType.BASIC_AUTH:
-                spec["components"]["securitySchemes"]["basicAuth"] = {
-                    "type": "http",
-                    "scheme": "basic"
-                }
-                
+        self._ensure_prepared()
+        for name, scheme in self._security_schemes.items():
+            spec["components"]["securitySchemes"][name] = dict(scheme)
+            
         # Add paths
         for endpoint in self.api_spec.endpoints:
             path = endpoint.path
-            method = endpoint.method.value.lower()
+            method = self._endpoint_view(endpoint).method_lower
             
             if path not in spec["paths"]:
                 spec["paths"][path] = {}
@@ -361,32 +542,26 @@ Error responses typically include additional information:
         
     def _endpoint_to_openapi(self, endpoint: Endpoint) -> Dict[str, Any]:
         """Convert an endpoint to OpenAPI format."""
+        # Path and query parameters; headers are not documented as parameters
+        parameters = [
+            {
+                "name": param.name,
+                "in": location,
+                "required": param.required,
+                "description": param.description,
+                "schema": {"type": param.type.value}
+            }
+            for param, location in self._endpoint_view(endpoint).parameters
+            if location != "header"
+        ]
+        
         operation = {
             "summary": endpoint.summary,
             "description": endpoint.description,
-            "parameters": [],
+            "parameters": parameters,
             "responses": {}
         }
         
-        # Add parameters
-        for param in endpoint.parameters:
-            operation["parameters"].append({
-                "name": param.name,
-                "in": "path",
-                "required": param.required,
-                "description": param.description,
-                "schema": {"type": param.type.value}
-            })
-            
-        for param in endpoint.query_params:
-            operation["parameters"].append({
-                "name": param.name,
-                "in": "query", 
-                "required": param.required,
-                "description": param.description,
-                "schema": {"type": param.type.value}
-            })
-            
         # Add request body
         if endpoint.request_body:
             operation["requestBody"] = {
@@ -400,7 +575,7 @@ Error responses typically include additional information:
         # Add responses
         for response in endpoint.responses:
             response_obj = {
-                "description": self._get_status_description(response.status_code)
+                "description": _STATUS_DESCRIPTIONS.get(response.status_code, "Unknown")
             }
             
             if response.schema:
@@ -413,13 +588,9 @@ Error responses typically include additional information:
             operation["responses"][str(response.status_code)] = response_obj
             
         # Add security
-        if endpoint.auth_required:
-            if any(auth.type == AuthType.BEARER_TOKEN for auth in self.api_spec.auth_patterns):
-                operation["security"] = [{"bearerAuth": []}]
-            elif any(auth.type == AuthType.API_KEY for auth in self.api_spec.auth_patterns):
-                operation["security"] = [{"apiKey": []}]
-            elif any(auth.type == AuthType.BASIC_AUTH for auth in self.api_spec.auth_patterns):
-                operation["security"] = [{"basicAuth": []}]
+        self._ensure_prepared()
+        if endpoint.auth_required and self._security:
+            operation["security"] = self._security
                 
         return operation
         
@@ -441,18 +612,11 @@ Error responses typically include additional information:
             ]
         }
         
-        # Group endpoints by resource
-        resource_groups = {}
-        for endpoint in self.api_spec.endpoints:
-            resource = endpoint.path.split('/')[1] if endpoint.path.startswith('/') else 'root'
-            if resource not in resource_groups:
-                resource_groups[resource] = []
-            resource_groups[resource].append(endpoint)
-            
         # Create folders for each resource
-        for resource, endpoints in resource_groups.items():
+        self._ensure_prepared()
+        for resource, endpoints in self._resource_groups.items():
             folder = {
-                "name": resource.title(),
+                "name": resource.title() or "Root",
                 "item": []
             }
             
@@ -466,35 +630,29 @@ Error responses typically include additional information:
         
     def _endpoint_to_postman_request(self, endpoint: Endpoint) -> Dict[str, Any]:
         """Convert an endpoint to a Postman request."""
+        view = self._endpoint_view(endpoint)
         request = {
-            "name": endpoint.summary or f"{endpoint.method.value} {endpoint.path}",
+            "name": endpoint.summary or f"{view.method} {endpoint.path}",
             "request": {
-                "method": endpoint.method.value,
+                "method": view.method,
                 "header": [],
                 "url": {
                     "raw": "{{baseUrl}}" + endpoint.path,
                     "host": ["{{baseUrl}}"],
-                    "path": endpoint.path.strip('/').split('/') if endpoint.path != '/' else []
+                    "path": list(view.path_parts)
                 }
             }
         }
         
         # Add headers
         if endpoint.auth_required:
-            for auth_pattern in self.api_spec.auth_patterns:
-                if auth_pattern.type == AuthType.BEARER_TOKEN:
-                    request["request"]["header"].append({
-                        "key": "Authorization",
-                        "value": "Bearer {{token}}",
-                        "type": "text"
-                    })
-                elif auth_pattern.type == AuthType.API_KEY:
-                    header_name = auth_pattern.header_name or "X-API-Key"
-                    request["request"]["header"].append({
-                        "key": header_name,
-                        "value": "{{apiKey}}",
-                        "type": "text"
-                    })
+            self._ensure_prepared()
+            for header_name, value in self._postman_auth_headers:
+                request["request"]["header"].append({
+                    "key": header_name,
+                    "value": value,
+                    "type": "text"
+                })
                     
         # Add query parameters
         if endpoint.query_params:
@@ -508,7 +666,7 @@ Error responses typically include additional information:
             request["request"]["url"]["query"] = query_params
             
         # Add request body
-        if endpoint.request_body:
+        if view.request_body_json is not None:
             request["request"]["header"].append({
                 "key": "Content-Type",
                 "value": "application/json",
@@ -516,114 +674,91 @@ Error responses typically include additional information:
             })
             request["request"]["body"] = {
                 "mode": "raw",
-                "raw": json.dumps(endpoint.request_body, indent=2)
+                "raw": view.request_body_json
             }
             
         return request
         
     def _get_method_badge(self, method: str) -> str:
         """Get a colored badge for HTTP method."""
-        badges = {
-            "GET": "🟢 GET",
-            "POST": "🟡 POST", 
-            "PUT": "🔵 PUT",
-            "DELETE": "🔴 DELETE",
-            "PATCH": "🟠 PATCH",
-            "HEAD": "⚪ HEAD",
-            "OPTIONS": "⚫ OPTIONS"
-        }
-        return badges.get(method, f"⚪ {method}")
+        return _METHOD_BADGES.get(method, f"⚪ {method}")
         
     def _get_status_description(self, status_code: int) -> str:
         """Get description for HTTP status code."""
-        descriptions = {
-            200: "OK",
-            201: "Created",
-            202: "Accepted",
-            204: "No Content",
-            400: "Bad Request",
-            401: "Unauthorized",
-            403: "Forbidden",
-            404: "Not Found",
-            422: "Unprocessable Entity",
-            429: "Too Many Requests",
-            500: "Internal Server Error",
-            502: "Bad Gateway",
-            503: "Service Unavailable"
-        }
-        return descriptions.get(status_code, "Unknown")
+        return _STATUS_DESCRIPTIONS.get(status_code, "Unknown")
         
     def _generate_curl_example(self, endpoint: Endpoint) -> str:
         """Generate a cURL example for an endpoint."""
-        parts = [f"curl -X {endpoint.method.value}"]
+        view = self._endpoint_view(endpoint)
+        parts = [f"curl -X {view.method}"]
         
         # URL with path parameters
-        url = self.api_spec.base_url + endpoint.path
-        for param in endpoint.parameters:
-            example_value = param.example or "123"
-            url = url.replace(f"{{{param.name}}}", str(example_value))
-            
+        url = self.api_spec.base_url + view.example_path
+        
         # Add query parameters
-        query_parts = []
-        for param in endpoint.query_params:
-            if param.example:
-                query_parts.append(f"{param.name}={param.example}")
-                
-        if query_parts:
-            url += "?" + "&".join(query_parts)
+        if view.query_examples:
+            url += "?" + "&".join(f"{name}={example}" for name, example in view.query_examples)
             
         parts.append(f'"{url}"')
         
         # Add headers
         parts.append('-H "Content-Type: application/json"')
-        
         if endpoint.auth_required:
-            for auth_pattern in self.api_spec.auth_patterns:
-                if auth_pattern.type == AuthType.BEARER_TOKEN:
-                    parts.append('-H "Authorization: Bearer YOUR_TOKEN"')
-                elif auth_pattern.type == AuthType.API_KEY:
-                    header_name = auth_pattern.header_name or "X-API-Key"
-                    parts.append(f'-H "{header_name}: YOUR_API_KEY"')
+            parts.extend(self._curl_auth_lines)
                     
         # Add request body
         if endpoint.request_body:
-            body = json.dumps(endpoint.request_body, separators=(',', ':'))
+            body = serialization.dumps(endpoint.request_body).decode('utf-8')
             parts.append(f"-d '{body}'")
             
         return " \\\n  ".join(parts)
         
-    def _generate_python_example(self, endpoint: Endpoint) -> str:
+    def _generate_examples(self, endpoint: Endpoint) -> Tuple[str, str, str]:
+        """
+        Generate the cURL, Python and JavaScript examples for an endpoint.
+        
+        The Python and JavaScript examples share their auth header lines and
+        request body JSON, which are built once here.
+        """
+        auth_lines = self._code_auth_header_lines(endpoint)
+        body = json.dumps(endpoint.request_body) if endpoint.request_body else None
+        return (
+            self._generate_curl_example(endpoint),
+            self._generate_python_example(endpoint, auth_lines, body),
+            self._generate_javascript_example(endpoint, auth_lines, body)
+        )
+        
+    def _code_auth_header_lines(self, endpoint: Endpoint) -> List[str]:
+        """Format the auth headers of an endpoint as code dictionary entries."""
+        if not endpoint.auth_required:
+            return []
+        self._ensure_prepared()
+        return list(self._code_auth_lines)
+        
+    def _generate_python_example(self, endpoint: Endpoint, auth_lines: Optional[List[str]] = None,
+                                 body: Optional[str] = None) -> str:
         """Generate a Python example for an endpoint."""
+        view = self._endpoint_view(endpoint)
+        if auth_lines is None:
+            auth_lines = self._code_auth_header_lines(endpoint)
+        if body is None and endpoint.request_body:
+            body = json.dumps(endpoint.request_body)
         lines = ["import requests"]
         
         # URL
-        url_parts = [f'url = "{self.api_spec.base_url}{endpoint.path}"']
-        for param in endpoint.parameters:
-            example_value = param.example or "123"
-            url_parts.append(f'url = url.replace("{{{param.name}}}", "{example_value}")')
-            
-        lines.extend(url_parts)
+        lines.append(f'url = "{self.api_spec.base_url}{view.example_path}"')
         
         # Headers
         headers = ['headers = {', '    "Content-Type": "application/json"']
-        
-        if endpoint.auth_required:
-            for auth_pattern in self.api_spec.auth_patterns:
-                if auth_pattern.type == AuthType.BEARER_TOKEN:
-                    headers.append('    "Authorization": "Bearer YOUR_TOKEN"')
-                elif auth_pattern.type == AuthType.API_KEY:
-                    header_name = auth_pattern.header_name or "X-API-Key"
-                    headers.append(f'    "{header_name}": "YOUR_API_KEY"')
-                    
+        headers.extend(auth_lines)
         headers.append('}')
         lines.extend(headers)
         
         # Parameters
         if endpoint.query_params:
             params = ['params = {']
-            for param in endpoint.query_params:
-                if param.example:
-                    params.append(f'    "{param.name}": "{param.example}"')
+            for name, example in view.query_examples:
+                params.append(f'    "{name}": "{example}"')
             params.append('}')
             lines.extend(params)
             
@@ -631,54 +766,46 @@ Error responses typically include additional information:
         request_args = ['url', 'headers=headers']
         if endpoint.query_params:
             request_args.append('params=params')
-        if endpoint.request_body:
-            lines.append(f'data = {json.dumps(endpoint.request_body)}')
+        if body is not None:
+            lines.append(f'data = {body}')
             request_args.append('json=data')
             
-        lines.append(f'response = requests.{endpoint.method.value.lower()}({", ".join(request_args)})')
+        lines.append(f'response = requests.{view.method_lower}({", ".join(request_args)})')
         lines.append('print(response.json())')
         
         return "\n".join(lines)
         
-    def _generate_javascript_example(self, endpoint: Endpoint) -> str:
+    def _generate_javascript_example(self, endpoint: Endpoint, auth_lines: Optional[List[str]] = None,
+                                     body: Optional[str] = None) -> str:
         """Generate a JavaScript example for an endpoint."""
+        view = self._endpoint_view(endpoint)
+        if auth_lines is None:
+            auth_lines = self._code_auth_header_lines(endpoint)
+        if body is None and endpoint.request_body:
+            body = json.dumps(endpoint.request_body)
         lines = []
         
         # URL
-        url_parts = [f'let url = "{self.api_spec.base_url}{endpoint.path}";']
-        for param in endpoint.parameters:
-            example_value = param.example or "123"
-            url_parts.append(f'url = url.replace("{{{param.name}}}", "{example_value}");')
-            
-        lines.extend(url_parts)
+        lines.append(f'let url = "{self.api_spec.base_url}{view.example_path}";')
         
         # Query parameters
         if endpoint.query_params:
             lines.append('const params = new URLSearchParams();')
-            for param in endpoint.query_params:
-                if param.example:
-                    lines.append(f'params.append("{param.name}", "{param.example}");')
+            for name, example in view.query_examples:
+                lines.append(f'params.append("{name}", "{example}");')
             lines.append('if (params.toString()) url += "?" + params.toString();')
             
         # Headers
         headers = ['const headers = {', '    "Content-Type": "application/json"']
-        
-        if endpoint.auth_required:
-            for auth_pattern in self.api_spec.auth_patterns:
-                if auth_pattern.type == AuthType.BEARER_TOKEN:
-                    headers.append('    "Authorization": "Bearer YOUR_TOKEN"')
-                elif auth_pattern.type == AuthType.API_KEY:
-                    header_name = auth_pattern.header_name or "X-API-Key"
-                    headers.append(f'    "{header_name}": "YOUR_API_KEY"')
-                    
+        headers.extend(auth_lines)
         headers.append('};')
         lines.extend(headers)
         
         # Fetch options
-        fetch_options = ['const options = {', f'    method: "{endpoint.method.value}"', '    headers']
+        fetch_options = ['const options = {', f'    method: "{view.method}"', '    headers']
         
-        if endpoint.request_body:
-            lines.append(f'const data = {json.dumps(endpoint.request_body)};')
+        if body is not None:
+            lines.append(f'const data = {body};')
             fetch_options.append('    body: JSON.stringify(data)')
             
         fetch_options.append('};')
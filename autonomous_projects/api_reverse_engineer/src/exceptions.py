@@ -8,6 +8,9 @@ from typing import Optional, Any
 class APIReverseEngineerError(Exception):
     """Base exception for all API reverse engineering errors."""
     
+    # Slots keep the exception's instance __dict__ from being created
+    __slots__ = ("message", "details")
+    
     def __init__(self, message: str, details: Optional[Any] = None):
         super().__init__(message)
         self.message = message
@@ -17,68 +20,71 @@ class APIReverseEngineerError(Exception):
         if self.details:
             return f"{self.message} (Details: {self.details})"
         return self.message
+        
+    def __reduce__(self):
+        return (type(self), (self.message, self.details))
 
 
 class TrafficCaptureError(APIReverseEngineerError):
     """Raised when traffic capture fails."""
-    pass
+    __slots__ = ()
 
 
 class ProxyServerError(TrafficCaptureError):
     """Raised when proxy server cannot be started."""
-    pass
+    __slots__ = ()
 
 
 class TrafficAnalysisError(APIReverseEngineerError):
     """Raised when traffic analysis fails."""
-    pass
+    __slots__ = ()
 
 
 class InvalidTrafficDataError(TrafficAnalysisError):
     """Raised when traffic data is invalid or corrupted."""
-    pass
+    __slots__ = ()
 
 
 class InsufficientDataError(TrafficAnalysisError):
     """Raised when there's insufficient data for analysis."""
-    pass
+    __slots__ = ()
 
 
 class SDKGenerationError(APIReverseEngineerError):
     """Raised when SDK generation fails."""
-    pass
+    __slots__ = ()
 
 
 class UnsupportedLanguageError(SDKGenerationError):
     """Raised when trying to generate SDK for unsupported language."""
-    pass
+    __slots__ = ()
 
 
 class TemplateError(SDKGenerationError):
     """Raised when template processing fails."""
-    pass
+    __slots__ = ()
 
 
 class DocumentationError(APIReverseEngineerError):
     """Raised when documentation generation fails."""
-    pass
+    __slots__ = ()
 
 
 class FileOperationError(APIReverseEngineerError):
     """Raised when file operations fail."""
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(APIReverseEngineerError):
     """Raised when configuration is invalid."""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(APIReverseEngineerError):
     """Raised when data validation fails."""
-    pass
+    __slots__ = ()
 
 
 class NetworkError(APIReverseEngineerError):
     """Raised when network operations fail."""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -2,10 +2,30 @@
 SDK generators for multiple programming languages.
 """
 
-from .python_generator import PythonGenerator
-from .typescript_generator import TypeScriptGenerator  
-from .javascript_generator import JavaScriptGenerator
-from .base_generator import BaseGenerator
+import importlib
+
+# Generators are imported from their modules on first access, so using one
+# language doesn't load the others
+_LAZY_IMPORTS = {
+    "BaseGenerator": ".base_generator",
+    "PythonGenerator": ".python_generator",
+    "TypeScriptGenerator": ".typescript_generator",
+    "JavaScriptGenerator": ".javascript_generator"
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "BaseGenerator",
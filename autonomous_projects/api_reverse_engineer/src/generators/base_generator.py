@@ -2,118 +2,192 @@
 Base class for SDK generators.
 """
 
+import asyncio
+import os
+import re
+import string
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, List
-from pathlib import Path
 
 from ..types import APISpec, Endpoint, Parameter, ParameterType
 
 
+# Characters that aren't valid in identifiers
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+# Byte translation table with the same effect as _SANITIZE_RE, for ASCII names
+_IDENTIFIER_BYTES = frozenset((string.ascii_letters + string.digits + '_').encode('ascii'))
+_SANITIZE_TABLE = bytes(c if c in _IDENTIFIER_BYTES else ord('_') for c in range(256))
+
+# Method name prefix for each HTTP method
+_METHOD_PREFIXES = {
+    "GET": "get",
+    "POST": "create",
+    "PUT": "update",
+    "DELETE": "delete",
+    "PATCH": "patch"
+}
+
+# Type names for each target language
+_TYPE_MAPS = {
+    "python": {
+        ParameterType.STRING: "str",
+        ParameterType.INTEGER: "int",
+        ParameterType.FLOAT: "float",
+        ParameterType.BOOLEAN: "bool",
+        ParameterType.ARRAY: "List[Any]",
+        ParameterType.OBJECT: "Dict[str, Any]",
+        ParameterType.NULL: "Optional[Any]"
+    },
+    "typescript": {
+        ParameterType.STRING: "string",
+        ParameterType.INTEGER: "number",
+        ParameterType.FLOAT: "number",
+        ParameterType.BOOLEAN: "boolean",
+        ParameterType.ARRAY: "any[]",
+        ParameterType.OBJECT: "object",
+        ParameterType.NULL: "null"
+    },
+    "javascript": {
+        ParameterType.STRING: "string",
+        ParameterType.INTEGER: "number",
+        ParameterType.FLOAT: "number",
+        ParameterType.BOOLEAN: "boolean",
+        ParameterType.ARRAY: "Array",
+        ParameterType.OBJECT: "Object",
+        ParameterType.NULL: "null"
+    }
+}
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_name(name: str) -> str:
+    """Sanitize a name for use as an identifier."""
+    # Remove non-alphanumeric characters and replace with underscore, with
+    # a byte table lookup rather than a regex scan for ASCII names
+    if name.isascii():
+        sanitized = name.encode('ascii').translate(_SANITIZE_TABLE).decode('ascii')
+    else:
+        sanitized = _SANITIZE_RE.sub('_', name)
+    
+    # Ensure it doesn't start with a number
+    if sanitized and sanitized[0].isdigit():
+        sanitized = f"_{sanitized}"
+        
+    return sanitized or "unknown"
+
+
+@lru_cache(maxsize=4096)
+def _method_name(path: str, http_method: str) -> str:
+    """Generate a method name for an endpoint path and HTTP method."""
+    # Extract resource name from path
+    path_parts = [part for part in path.split('/') if part and not part.startswith('{')]
+    resource = path_parts[-1] if path_parts else "resource"
+    
+    # Create method name based on HTTP method
+    prefix = _METHOD_PREFIXES.get(http_method, http_method.lower())
+    return _sanitize_name(f"{prefix}_{resource}")
+
+
+@lru_cache(maxsize=4096)
+def _camel_case(name: str) -> str:
+    """Convert snake_case to camelCase."""
+    components = name.split('_')
+    return components[0] + ''.join(x.title() for x in components[1:])
+
+
 class BaseGenerator(ABC):
     """Base class for all SDK generators."""
     
-    def __init__(self, api_spec: APISpec):
+    def __init__(self, api_spec: APISpec, create_output_dir: bool = True):
         self.api_spec = api_spec
+        self.create_output_dir = create_output_dir
         
     @abstractmethod
-    def generate(self, output_dir: str) -> Dict[str, str]:
+    def generate(self, output_dir: str, return_contents: bool = True) -> Dict[str, Any]:
         """
         Generate SDK files.
         
         Args:
             output_dir: Directory to write generated files
+            return_contents: Return the generated content rather than just
+                its length, which lets callers that only need the file list
+                avoid keeping the content alive
             
         Returns:
-            Dict mapping file paths to generated content
+            Dict mapping file paths to generated content, or to its length
+            when return_contents is False
         """
         pass
         
+    async def generate_async(self, output_dir: str, return_contents: bool = True) -> Dict[str, Any]:
+        """
+        Generate SDK files without blocking the running event loop.
+        
+        generate() runs on a worker thread, so an async pipeline can generate
+        several SDKs, or do other I/O, while the files are written.
+        """
+        return await asyncio.to_thread(self.generate, output_dir, return_contents)
+        
     @abstractmethod
     def get_language_name(self) -> str:
         """Get the name of the target language."""
         pass
         
-    def _create_output_dir(self, output_dir: str) -> Path:
+    def _create_output_dir(self, output_dir: str):
         """Create output directory if it doesn't exist."""
-        path = Path(output_dir)
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        # Skipped when the caller has already created the directory
+        if self.create_output_dir:
+            os.makedirs(output_dir, exist_ok=True)
         
     def _write_file(self, file_path: str, content: str):
         """Write content to a file."""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Encoded in one pass and written in binary mode, rather than
+        # through a text wrapper's incremental encoder
+        with open(file_path, 'wb') as f:
+            f.write(content.encode('utf-8'))
             
-    def _sanitize_name(self, name: str) -> str:
-        """Sanitize a name for use as an identifier."""
-        # Remove non-alphanumeric characters and replace with underscore
-        import re
-        sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', name)
+    def _generated_files(self, files: Dict[str, str], return_contents: bool) -> Dict[str, Any]:
+        """Return generated files as reported by generate()."""
+        if return_contents:
+            return files
+        return {path: len(content) for path, content in files.items()}
         
-        # Ensure it doesn't start with a number
-        if sanitized and sanitized[0].isdigit():
-            sanitized = f"_{sanitized}"
+    def _write_files(self, files: Dict[str, str]):
+        """
+        Write generated files, given as a dict mapping path to content.
+        
+        The files are independent, so they are written on separate threads
+        to overlap their I/O.
+        """
+        with ThreadPoolExecutor(max_workers=max(len(files), 1)) as pool:
+            # Consume the results so that write errors are raised here
+            list(pool.map(self._write_file, files.keys(), files.values()))
             
-        return sanitized or "unknown"
+    def _sanitize_name(self, name: str) -> str:
+        """Sanitize a name for use as an identifier."""
+        return _sanitize_name(name)
         
     def _get_method_name(self, endpoint: Endpoint) -> str:
         """Generate a method name for an endpoint."""
-        # Extract resource name from path
-        path_parts = [part for part in endpoint.path.split('/') if part and not part.startswith('{')]
-        resource = path_parts[-1] if path_parts else "resource"
-        
-        # Create method name based on HTTP method
-        method_prefixes = {
-            "GET": "get",
-            "POST": "create", 
-            "PUT": "update",
-            "DELETE": "delete",
-            "PATCH": "patch"
-        }
-        
-        prefix = method_prefixes.get(endpoint.method.value, endpoint.method.value.lower())
-        method_name = f"{prefix}_{resource}"
-        
-        return self._sanitize_name(method_name)
+        # Cached by path and method rather than by endpoint object
+        return _method_name(endpoint.path, endpoint.method.value)
         
     def _type_to_string(self, param_type: ParameterType, language: str) -> str:
         """Convert ParameterType to language-specific type string."""
-        type_maps = {
-            "python": {
-                ParameterType.STRING: "str",
-                ParameterType.INTEGER: "int", 
-                ParameterType.FLOAT: "float",
-                ParameterType.BOOLEAN: "bool",
-                ParameterType.ARRAY: "List[Any]",
-                ParameterType.OBJECT: "Dict[str, Any]",
-                ParameterType.NULL: "Optional[Any]"
-            },
-            "typescript": {
-                ParameterType.STRING: "string",
-                ParameterType.INTEGER: "number",
-                ParameterType.FLOAT: "number", 
-                ParameterType.BOOLEAN: "boolean",
-                ParameterType.ARRAY: "any[]",
-                ParameterType.OBJECT: "object",
-                ParameterType.NULL: "null"
-            },
-            "javascript": {
-                ParameterType.STRING: "string",
-                ParameterType.INTEGER: "number",
-                ParameterType.FLOAT: "number",
-                ParameterType.BOOLEAN: "boolean", 
-                ParameterType.ARRAY: "Array",
-                ParameterType.OBJECT: "Object",
-                ParameterType.NULL: "null"
-            }
-        }
-        
-        return type_maps.get(language, {}).get(param_type, "any")
+        # No per-call dict for unknown languages
+        type_map = _TYPE_MAPS.get(language)
+        return type_map.get(param_type, "any") if type_map is not None else "any"
         
     def _get_auth_method(self) -> str:
         """Get the primary authentication method."""
-        if not self.api_spec.auth_patterns:
-            return "none"
-            
-        # Return the first auth pattern type
-        return self.api_spec.auth_patterns[0].type.value
\ No newline at end of file
+        # The first auth pattern type
+        patterns = self.api_spec.auth_patterns
+        return patterns[0].type.value if patterns else "none"
+        
+    def _get_client_class_name(self) -> str:
+        """Get the client class name."""
+        name = self._sanitize_name(self.api_spec.title.replace(" ", ""))
+        return f"{name}Client"
\ No newline at end of file
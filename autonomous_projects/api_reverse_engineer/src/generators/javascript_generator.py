@@ -2,172 +2,337 @@
 JavaScript SDK generator with JSDoc typing support.
 """
 
-from typing import Dict, List, Any
-from pathlib import Path
-import textwrap
+from typing import Dict, List, Any, Optional, Tuple
+import os
+import io
+import re
 
-from .base_generator import BaseGenerator
+from .base_generator import BaseGenerator, _camel_case
 from ..types import APISpec, Endpoint, Parameter, ParameterType, AuthType
 
 
-class JavaScriptGenerator(BaseGenerator):
-    """Generate JavaScript SDK with JSDoc typing support."""
-    
-    def get_language_name(self) -> str:
-        return "javascript"
-        
-    def generate(self, output_dir: str) -> Dict[str, str]:
-        """Generate JavaScript SDK files."""
-        output_path = self._create_output_dir(output_dir)
-        files = {}
-        
-        # Generate main client file
-        client_content = self._generate_client()
-        client_file = output_path / "client.js"
-        self._write_file(str(client_file), client_content)
-        files[str(client_file)] = client_content
-        
-        # Generate types file (JSDoc)
-        types_content = self._generate_types()
-        types_file = output_path / "types.js"
-        self._write_file(str(types_file), types_content)
-        files[str(types_file)] = types_content
-        
-        # Generate index file
-        index_content = self._generate_index()
-        index_file = output_path / "index.js"
-        self._write_file(str(index_file), index_content)
-        files[str(index_file)] = index_content
-        
-        # Generate package.json
-        package_content = self._generate_package_json()
-        package_file = output_path / "package.json"
-        self._write_file(str(package_file), package_content)
-        files[str(package_file)] = package_content
-        
-        # Generate README.md
-        readme_content = self._generate_readme()
-        readme_file = output_path / "README.md"
-        self._write_file(str(readme_file), readme_content)
-        files[str(readme_file)] = readme_content
-        
-        return files
-        
-    def _generate_client(self) -> str:
-        """Generate the main client class."""
-        methods = []
-        
-        for endpoint in self.api_spec.endpoints:
-            method_code = self._generate_method(endpoint)
-            methods.append(method_code)
-            
-        methods_str = "\n\n  ".join(methods)
-        
-        auth_jsdoc = self._generate_auth_jsdoc()
-        auth_init = self._generate_auth_init()
-        auth_headers = self._generate_auth_headers()
-        
-        return f'''/**
- * Generated API client for {self.api_spec.title}
- * 
- * This client was automatically generated from API traffic analysis.
- */
+# Path placeholders, capturing the parameter name
+_PATH_PARAM_RE = re.compile(r'\{([^}]+)\}')
 
-const {{ APIError }} = require('./types');
+# Characters that must be escaped in JavaScript template literal text
+_TEMPLATE_LITERAL_ESCAPES = str.maketrans({'\\': '\\\\', '`': '\\`', '$': '\\$'})
 
-/**
- * {self.api_spec.description}
- * @class
- */
-class {self._get_client_class_name()} {{
-  /**
-   * Create a new API client instance
-   * {auth_jsdoc}
-   * @param {{Object}} config - Configuration options
-   * @param {{string}} [config.baseUrl] - Base URL for the API
-   */
-  constructor(config = {{}}) {{
-    this.baseUrl = config.baseUrl || '{self.api_spec.base_url}';
-    {auth_init}
-  }}
+# Request body handling code of generated methods
+_REQUEST_BODY_CODE = '''if (data !== undefined) {
+      requestOptions.body = JSON.stringify(data);
+    }'''
 
-  /**
+# Generated code that adds the query string to the path
+_QUERY_STRING_APPEND = '''
+    if (searchParams.toString()) {
+      path += '?' + searchParams.toString();
+    }'''
+
+# Generated method code between the query code and the HTTP method,
+# indexed by whether the endpoint has a request body
+_METHOD_ENDS = tuple(
+    f"\n    \n    {body_code}\n    \n    return this.makeRequest('"
+    for body_code in ("", _REQUEST_BODY_CODE)
+)
+
+# Request and auth header methods shared by every generated client
+_MAKE_REQUEST_JS = '''  /**
    * Make an HTTP request to the API
    * @private
-   * @param {{string}} method - HTTP method
-   * @param {{string}} path - API path
-   * @param {{Object}} [options={}] - Request options
-   * @returns {{Promise<Object>}} API response
-   * @throws {{APIError}} When the request fails
+   * @param {string} method - HTTP method
+   * @param {string} path - API path
+   * @param {Object} [options={}] - Request options
+   * @returns {Promise<Object>} API response
+   * @throws {APIError} When the request fails
    */
-  async makeRequest(method, path, options = {{}}) {{
+  async makeRequest(method, path, options = {}) {
     const url = new URL(path.startsWith('/') ? path.slice(1) : path, this.baseUrl);
     
-    const headers = {{
+    const headers = {
       'Content-Type': 'application/json',
       'User-Agent': 'Generated-JavaScript-SDK/1.0.0',
       ...options.headers,
       ...this.getAuthHeaders()
-    }};
+    };
 
-    try {{
-      const response = await fetch(url.toString(), {{
+    try {
+      const response = await fetch(url.toString(), {
         method,
         headers,
         ...options
-      }});
+      });
 
-      if (response.status === 401) {{
+      if (response.status === 401) {
         throw new APIError('Invalid authentication credentials', 401);
-      }}
+      }
       
-      if (response.status === 429) {{
+      if (response.status === 429) {
         throw new APIError('Rate limit exceeded', 429);
-      }}
+      }
       
-      if (!response.ok) {{
+      if (!response.ok) {
         const errorText = await response.text();
-        throw new APIError(`API request failed: ${{response.status}} ${{errorText}}`, response.status);
-      }}
+        throw new APIError(`API request failed: ${response.status} ${errorText}`, response.status);
+      }
 
       const data = await response.json();
       
-      return {{
+      return {
         data,
         status: response.status,
         headers: Object.fromEntries(response.headers.entries())
-      }};
+      };
       
-    }} catch (error) {{
-      if (error instanceof APIError) {{
+    } catch (error) {
+      if (error instanceof APIError) {
         throw error;
-      }}
-      throw new APIError(`Network error: ${{error.message}}`, 0);
-    }}
-  }}
+      }
+      throw new APIError(`Network error: ${error.message}`, 0);
+    }
+  }
 
   /**
    * Get authentication headers
    * @private
-   * @returns {{Object}} Authentication headers
+   * @returns {Object} Authentication headers
    */
-  getAuthHeaders() {{
-    const headers = {{}};
+  getAuthHeaders() {
+    const headers = {};
+    
+'''
+
+# Types file, which doesn't depend on the API spec
+_TYPES_JS = '''/**
+ * Type definitions and error classes for the API client.
+ */
+
+/**
+ * API Error class
+ * @class
+ * @extends Error
+ */
+class APIError extends Error {
+  /**
+   * Create an API error
+   * @param {string} message - Error message
+   * @param {number} statusCode - HTTP status code
+   */
+  constructor(message, statusCode) {
+    super(message);
+    this.name = 'APIError';
+    this.statusCode = statusCode;
+  }
+}
+
+/**
+ * @typedef {Object} APIResponse
+ * @property {*} data - Response data
+ * @property {number} status - HTTP status code
+ * @property {Object} headers - Response headers
+ */
+
+module.exports = {
+  APIError
+};
+'''
+
+# README sections that don't depend on the API spec
+_README_ERROR_HANDLING = '''## Error Handling
+
+The SDK includes custom error handling:
+
+```javascript
+const { APIError } = require('./types');
+
+try {
+  const result = await client.someMethod();
+  console.log(result.data);
+} catch (error) {
+  if (error instanceof APIError) {
+    console.error(`API Error: ${error.message} (Status: ${error.statusCode})`);
+  } else {
+    console.error('Unexpected error:', error);
+  }
+}
+```
+
+## Node.js Compatibility
+
+This SDK requires Node.js 14.0.0 or higher for native fetch support.
+For older versions, you may need to install a fetch polyfill.
+
+'''
+
+# Generated code for each authentication method: the constructor JSDoc
+# and initialization, the getAuthHeaders() body (a format template for
+# the API key header name) and the README example's client config
+_AUTH_BLOCKS = {
+    "bearer_token": {
+        "jsdoc": "   * @param {string} config.token - Bearer token for authentication",
+        "init": "this.token = config.token;",
+        "headers": 'headers["Authorization"] = `Bearer ${{this.token}}`;',
+        "example": "{\n  token: 'your-bearer-token'\n}"
+    },
+    "api_key": {
+        "jsdoc": "   * @param {string} config.apiKey - API key for authentication",
+        "init": "this.apiKey = config.apiKey;",
+        "headers": 'headers["{header_name}"] = this.apiKey;',
+        "example": "{\n  apiKey: 'your-api-key'\n}"
+    },
+    "basic_auth": {
+        "jsdoc": "   * @param {string} config.username - Username for basic authentication\\n   * @param {string} config.password - Password for basic authentication",
+        "init": "this.username = config.username;\\n    this.password = config.password;",
+        "headers": '''const authString = Buffer.from(`${{this.username}}:${{this.password}}`).toString('base64');
+    headers["Authorization"] = `Basic ${{authString}}`;''',
+        "example": "{\n  username: 'your-username',\n  password: 'your-password'\n}"
+    }
+}
+
+# Generated code when no authentication is used
+_NO_AUTH_BLOCK = {
+    "jsdoc": "",
+    "init": "// No authentication required",
+    "headers": "// No authentication headers needed",
+    "example": ""
+}
+
+# JSDoc type name for each parameter type
+_JSDOC_TYPES = {
+    ParameterType.STRING: "string",
+    ParameterType.INTEGER: "number",
+    ParameterType.FLOAT: "number",
+    ParameterType.BOOLEAN: "boolean",
+    ParameterType.ARRAY: "Array",
+    ParameterType.OBJECT: "Object",
+    ParameterType.NULL: "*"
+}
+
+
+class JavaScriptGenerator(BaseGenerator):
+    """Generate JavaScript SDK with JSDoc typing support."""
     
-    {auth_headers}
+    def get_language_name(self) -> str:
+        return "javascript"
+        
+    def generate(self, output_dir: str, return_contents: bool = True) -> Dict[str, Any]:
+        """Generate JavaScript SDK files."""
+        self._create_output_dir(output_dir)
+        
+        # Shared by the client methods and the README examples
+        method_names = self._method_names()
+        
+        files = {
+            # Main client file
+            os.path.join(output_dir, "client.js"): self._generate_client(method_names),
+            # Types file (JSDoc)
+            os.path.join(output_dir, "types.js"): self._generate_types(),
+            os.path.join(output_dir, "index.js"): self._generate_index(),
+            os.path.join(output_dir, "package.json"): self._generate_package_json(),
+            os.path.join(output_dir, "README.md"): self._generate_readme(method_names)
+        }
+        
+        self._write_files(files)
+        return self._generated_files(files, return_contents)
+        
+    def _method_names(self) -> List[str]:
+        """Get the camelCase method name of each endpoint."""
+        return [self._camel_case(self._get_method_name(endpoint)) for endpoint in self.api_spec.endpoints]
+        
+    def _generate_client(self, method_names: Optional[List[str]] = None) -> str:
+        """Generate the main client class."""
+        if method_names is None:
+            method_names = self._method_names()
+        client_class = self._get_client_class_name()
+        auth_jsdoc = self._generate_auth_jsdoc()
+        auth_init = self._generate_auth_init()
+        auth_headers = self._generate_auth_headers()
+        
+        # Methods are written into one buffer rather than built as separate
+        # strings and joined
+        buf = io.StringIO()
+        write = buf.write
+        write(f'''/**
+ * Generated API client for {self.api_spec.title}
+ * 
+ * This client was automatically generated from API traffic analysis.
+ */
+
+const {{ APIError }} = require('./types');
+
+/**
+ * {self.api_spec.description}
+ * @class
+ */
+class {client_class} {{
+  /**
+   * Create a new API client instance
+   * {auth_jsdoc}
+   * @param {{Object}} config - Configuration options
+   * @param {{string}} [config.baseUrl] - Base URL for the API
+   */
+  constructor(config = {{}}) {{
+    this.baseUrl = config.baseUrl || '{self.api_spec.base_url}';
+    {auth_init}
+  }}
+
+{_MAKE_REQUEST_JS}    {auth_headers}
     
     return headers;
   }}
 
-  {methods_str}
+  ''')
+        
+        for i, (endpoint, method_name) in enumerate(zip(self.api_spec.endpoints, method_names)):
+            if i:
+                write("\n\n  ")
+            self._write_method(endpoint, buf, method_name)
+            
+        write(f'''
 }}
 
-module.exports = {{ {self._get_client_class_name()} }};'''
+module.exports = {{ {client_class} }};''')
+        return buf.getvalue()
         
     def _generate_method(self, endpoint: Endpoint) -> str:
         """Generate a method for an endpoint."""
-        method_name = self._camel_case(self._get_method_name(endpoint))
+        buf = io.StringIO()
+        self._write_method(endpoint, buf)
+        return buf.getvalue()
         
+    def _write_method(self, endpoint: Endpoint, buf: io.StringIO, method_name: Optional[str] = None):
+        """Write a method for an endpoint."""
+        if method_name is None:
+            method_name = self._camel_case(self._get_method_name(endpoint))
+        
+        # Endpoints without parameters or a body skip the parameter lists
+        if endpoint.parameters or endpoint.query_params or endpoint.request_body:
+            jsdoc_params_str, js_params_str = self._method_params_js(endpoint)
+        else:
+            jsdoc_params_str = js_params_str = ""
+            
+        write = buf.write
+        write(f'''/**
+   * {endpoint.summary or f"{endpoint.method.value} {endpoint.path}"}
+   * 
+   * {endpoint.description or "No description available."}
+   * 
+{jsdoc_params_str}
+   * @returns {{Promise<Object>}} API response
+   * @throws {{APIError}} When the request fails
+   */
+  async {method_name}({js_params_str}) {{
+    {self._generate_path_substitution_js(endpoint)}
+    
+    const requestOptions = {{}};
+    
+    ''')
+        self._write_query_params_code_js(endpoint, buf)
+        write(_METHOD_ENDS[bool(endpoint.request_body)])
+        write(endpoint.method.value)
+        write("', path, requestOptions);\n  }")
+        
+    def _method_params_js(self, endpoint: Endpoint) -> Tuple[str, str]:
+        """Generate the JSDoc parameter lines and parameter list of a method."""
         # Generate JSDoc parameters
         jsdoc_params = []
         js_params = []
@@ -178,180 +343,93 @@ module.exports = {{ {self._get_client_class_name()} }};'''
             jsdoc_params.append(f"   * @param {{{param_type}}} {param.name} - {param.description or 'Path parameter'}")
             js_params.append(param.name)
             
-        # Query parameters
-        query_required = [p for p in endpoint.query_params if p.required]
-        query_optional = [p for p in endpoint.query_params if not p.required]
-        
-        for param in query_required:
+        # Query parameters, partitioned in one pass: required ones are
+        # positional and optional ones go in an options object
+        optional_props = []
+        for param in endpoint.query_params:
             param_type = self._type_to_jsdoc_type(param.type)
-            jsdoc_params.append(f"   * @param {{{param_type}}} {param.name} - {param.description or 'Query parameter'}")
-            js_params.append(param.name)
-            
-        # Optional parameters object
-        if query_optional:
-            optional_props = []
-            for param in query_optional:
-                param_type = self._type_to_jsdoc_type(param.type)
+            if param.required:
+                jsdoc_params.append(f"   * @param {{{param_type}}} {param.name} - {param.description or 'Query parameter'}")
+                js_params.append(param.name)
+            else:
                 optional_props.append(f"   * @param {{{param_type}}} [options.{param.name}] - {param.description or 'Optional query parameter'}")
-            
-            if optional_props:
-                jsdoc_params.append("   * @param {Object} [options] - Optional parameters")
-                jsdoc_params.extend(optional_props)
-                js_params.append("options = {}")
                 
+        # Optional parameters object
+        if optional_props:
+            jsdoc_params.append("   * @param {Object} [options] - Optional parameters")
+            jsdoc_params.extend(optional_props)
+            js_params.append("options = {}")
+            
         # Request body
         if endpoint.request_body:
             jsdoc_params.append("   * @param {Object} [data] - Request body data")
             js_params.append("data")
             
-        jsdoc_params_str = "\n".join(jsdoc_params)
-        js_params_str = ", ".join(js_params)
-        
-        # Generate method body
-        path_substitution = self._generate_path_substitution_js(endpoint)
-        query_params_code = self._generate_query_params_code_js(endpoint)
-        request_body_code = self._generate_request_body_code_js(endpoint)
-        
-        return f'''/**
-   * {endpoint.summary or f"{endpoint.method.value} {endpoint.path}"}
-   * 
-   * {endpoint.description or "No description available."}
-   * 
-{jsdoc_params_str}
-   * @returns {{Promise<Object>}} API response
-   * @throws {{APIError}} When the request fails
-   */
-  async {method_name}({js_params_str}) {{
-    {path_substitution}
-    
-    const requestOptions = {{}};
-    
-    {query_params_code}
-    
-    {request_body_code}
-    
-    return this.makeRequest('{endpoint.method.value}', path, requestOptions);
-  }}'''
+        return "\n".join(jsdoc_params), ", ".join(js_params)
         
     def _generate_path_substitution_js(self, endpoint: Endpoint) -> str:
         """Generate path parameter substitution code for JavaScript."""
         if not endpoint.parameters:
             return f'let path = "{endpoint.path}";'
             
-        substitutions = []
-        for param in endpoint.parameters:
-            substitutions.append(f'path = path.replace("{{{param.name}}}", String({param.name}));')
-            
-        return f'let path = "{endpoint.path}";\n    ' + '\n    '.join(substitutions)
+        # A single template literal with a slot for each path parameter,
+        # rather than one path.replace() call per parameter at runtime. The
+        # path is escaped, then placeholders with a parameter are replaced in
+        # one pass; others are kept as literal text
+        names = {param.name for param in endpoint.parameters}
+        path = _PATH_PARAM_RE.sub(
+            lambda match: f"${{String({match.group(1)})}}" if match.group(1) in names else match.group(0),
+            endpoint.path.translate(_TEMPLATE_LITERAL_ESCAPES)
+        )
+        return f"let path = `{path}`;"
         
     def _generate_query_params_code_js(self, endpoint: Endpoint) -> str:
         """Generate query parameters handling code for JavaScript."""
+        buf = io.StringIO()
+        self._write_query_params_code_js(endpoint, buf)
+        return buf.getvalue()
+        
+    def _write_query_params_code_js(self, endpoint: Endpoint, buf: io.StringIO):
+        """Write query parameters handling code for JavaScript."""
         if not endpoint.query_params:
-            return ""
+            return
             
-        lines = ["const searchParams = new URLSearchParams();"]
+        write = buf.write
+        write("const searchParams = new URLSearchParams();")
         
+        # One write per parameter, in declaration order
         for param in endpoint.query_params:
+            name = param.name
             if param.required:
-                lines.append(f'searchParams.append("{param.name}", String({param.name}));')
+                write(f'\n    searchParams.append("{name}", String({name}));')
             else:
-                lines.append(f'if (options.{param.name} !== undefined) {{')
-                lines.append(f'  searchParams.append("{param.name}", String(options.{param.name}));')
-                lines.append('}')
+                write(f'\n    if (options.{name} !== undefined) {{'
+                      f'\n      searchParams.append("{name}", String(options.{name}));'
+                      '\n    }')
                 
-        lines.append("if (searchParams.toString()) {")
-        lines.append("  path += '?' + searchParams.toString();")
-        lines.append("}")
-        
-        return "\n    ".join(lines)
+        write(_QUERY_STRING_APPEND)
         
     def _generate_request_body_code_js(self, endpoint: Endpoint) -> str:
         """Generate request body handling code for JavaScript."""
-        if not endpoint.request_body:
-            return ""
-            
-        return '''if (data !== undefined) {
-      requestOptions.body = JSON.stringify(data);
-    }'''
+        return _REQUEST_BODY_CODE if endpoint.request_body else ""
         
     def _generate_auth_jsdoc(self) -> str:
         """Generate authentication JSDoc."""
-        auth_method = self._get_auth_method()
-        
-        if auth_method == "bearer_token":
-            return "   * @param {string} config.token - Bearer token for authentication"
-        elif auth_method == "api_key":
-            return "   * @param {string} config.apiKey - API key for authentication"
-        elif auth_method == "basic_auth":
-            return "   * @param {string} config.username - Username for basic authentication\\n   * @param {string} config.password - Password for basic authentication"
-        else:
-            return ""
-            
+        return _AUTH_BLOCKS.get(self._get_auth_method(), _NO_AUTH_BLOCK)["jsdoc"]
+        
     def _generate_auth_init(self) -> str:
         """Generate authentication initialization."""
-        auth_method = self._get_auth_method()
-        
-        if auth_method == "bearer_token":
-            return "this.token = config.token;"
-        elif auth_method == "api_key":
-            return "this.apiKey = config.apiKey;"
-        elif auth_method == "basic_auth":
-            return "this.username = config.username;\\n    this.password = config.password;"
-        else:
-            return "// No authentication required"
-            
+        return _AUTH_BLOCKS.get(self._get_auth_method(), _NO_AUTH_BLOCK)["init"]
+        
     def _generate_auth_headers(self) -> str:
         """Generate authentication headers code."""
-        auth_method = self._get_auth_method()
-        
-        if auth_method == "bearer_token":
-            return 'headers["Authorization"] = `Bearer ${this.token}`;'
-        elif auth_method == "api_key":
-            header_name = "X-API-Key"
-            if self.api_spec.auth_patterns:
-                header_name = self.api_spec.auth_patterns[0].header_name or "X-API-Key"
-            return f'headers["{header_name}"] = this.apiKey;'
-        elif auth_method == "basic_auth":
-            return '''const authString = Buffer.from(`${this.username}:${this.password}`).toString('base64');
-    headers["Authorization"] = `Basic ${authString}`;'''
-        else:
-            return "// No authentication headers needed"
-            
+        patterns = self.api_spec.auth_patterns
+        header_name = (patterns[0].header_name if patterns else None) or "X-API-Key"
+        return _AUTH_BLOCKS.get(self._get_auth_method(), _NO_AUTH_BLOCK)["headers"].format(header_name=header_name)
+        
     def _generate_types(self) -> str:
         """Generate types file with JSDoc definitions."""
-        return '''/**
- * Type definitions and error classes for the API client.
- */
-
-/**
- * API Error class
- * @class
- * @extends Error
- */
-class APIError extends Error {
-  /**
-   * Create an API error
-   * @param {string} message - Error message
-   * @param {number} statusCode - HTTP status code
-   */
-  constructor(message, statusCode) {
-    super(message);
-    this.name = 'APIError';
-    this.statusCode = statusCode;
-  }
-}
-
-/**
- * @typedef {Object} APIResponse
- * @property {*} data - Response data
- * @property {number} status - HTTP status code
- * @property {Object} headers - Response headers
- */
-
-module.exports = {
-  APIError
-};
-'''
+        return _TYPES_JS
         
     def _generate_index(self) -> str:
         """Generate index file."""
@@ -392,11 +470,11 @@ module.exports = {{
   }}
 }}'''
         
-    def _generate_readme(self) -> str:
+    def _generate_readme(self, method_names: Optional[List[str]] = None) -> str:
         """Generate README.md file."""
         client_class = self._get_client_class_name()
         auth_example = self._generate_auth_example_js()
-        usage_examples = self._generate_usage_examples_js()
+        usage_examples = self._generate_usage_examples_js(method_names)
         
         return f'''# {self.api_spec.title} JavaScript SDK
 
@@ -413,7 +491,7 @@ npm install
 ### Basic Setup
 
 ```javascript
-const {{ {client_class} }} = require('./{self._get_client_class_name().lower()}');
+const {{ {client_class} }} = require('./{client_class.lower()}');
 
 // Initialize the client
 {auth_example}
@@ -423,115 +501,53 @@ const {{ {client_class} }} = require('./{self._get_client_class_name().lower()}'
 
 {usage_examples}
 
-## Error Handling
-
-The SDK includes custom error handling:
-
-```javascript
-const {{ APIError }} = require('./types');
-
-try {{
-  const result = await client.someMethod();
-  console.log(result.data);
-}} catch (error) {{
-  if (error instanceof APIError) {{
-    console.error(`API Error: ${{error.message}} (Status: ${{error.statusCode}})`);
-  }} else {{
-    console.error('Unexpected error:', error);
-  }}
-}}
-```
-
-## Node.js Compatibility
-
-This SDK requires Node.js 14.0.0 or higher for native fetch support.
-For older versions, you may need to install a fetch polyfill.
-
-## Generated from API Traffic
+{_README_ERROR_HANDLING}## Generated from API Traffic
 
 This SDK was automatically generated by analyzing API traffic patterns.
 Endpoint coverage: {len(self.api_spec.endpoints)} endpoints discovered.
 '''
         
-    def _get_client_class_name(self) -> str:
-        """Get the client class name."""
-        name = self._sanitize_name(self.api_spec.title.replace(" ", ""))
-        return f"{name}Client"
-        
     def _generate_auth_example_js(self) -> str:
         """Generate authentication example for JavaScript."""
-        auth_method = self._get_auth_method()
-        client_class = self._get_client_class_name()
+        config = _AUTH_BLOCKS.get(self._get_auth_method(), _NO_AUTH_BLOCK)["example"]
+        return f'const client = new {self._get_client_class_name()}({config});'
         
-        if auth_method == "bearer_token":
-            return f'''const client = new {client_class}({{
-  token: 'your-bearer-token'
-}});'''
-        elif auth_method == "api_key":
-            return f'''const client = new {client_class}({{
-  apiKey: 'your-api-key'
-}});'''
-        elif auth_method == "basic_auth":
-            return f'''const client = new {client_class}({{
-  username: 'your-username',
-  password: 'your-password'
-}});'''
-        else:
-            return f'const client = new {client_class}();'
-            
-    def _generate_usage_examples_js(self) -> str:
+    def _generate_usage_examples_js(self, method_names: Optional[List[str]] = None) -> str:
         """Generate usage examples for endpoints."""
-        examples = []
-        
-        for endpoint in self.api_spec.endpoints[:3]:  # Show first 3 endpoints
-            method_name = self._camel_case(self._get_method_name(endpoint))
-            
-            # Generate example call
-            args = []
-            for param in endpoint.parameters:
-                if param.example:
-                    args.append(f'"{param.example}"')
-                else:
-                    args.append('"example_value"')
-                    
-            # Add options object if there are optional query params
-            optional_params = [p for p in endpoint.query_params if not p.required]
-            if optional_params:
-                options = []
-                for param in optional_params:
-                    if param.example:
-                        options.append(f'{param.name}: "{param.example}"')
-                        
-                if options:
-                    args.append(f'{{ {", ".join(options)} }}')
-                    
-            args_str = ", ".join(args)
-            
-            example = f'''#### {endpoint.summary or endpoint.method.value + " " + endpoint.path}
+        if method_names is None:
+            method_names = self._method_names()
+        buf = io.StringIO()
+        write = buf.write
+        
+        # Show first 3 endpoints
+        for i, (endpoint, method_name) in enumerate(zip(self.api_spec.endpoints[:3], method_names)):
+            if i:
+                write("\n\n")
+                
+            # Example call: path parameters, then an options object for the
+            # optional query parameters that have an example
+            args = [f'"{param.example}"' if param.example else '"example_value"' for param in endpoint.parameters]
+            options = [
+                f'{param.name}: "{param.example}"'
+                for param in endpoint.query_params
+                if not param.required and param.example
+            ]
+            if options:
+                args.append(f'{{ {", ".join(options)} }}')
+                
+            write(f'''#### {endpoint.summary or endpoint.method.value + " " + endpoint.path}
 
 ```javascript
-const result = await client.{method_name}({args_str});
+const result = await client.{method_name}({", ".join(args)});
 console.log(result.data);
-```'''
-            examples.append(example)
+```''')
             
-        return "\n\n".join(examples)
+        return buf.getvalue()
         
     def _camel_case(self, name: str) -> str:
         """Convert snake_case to camelCase."""
-        components = name.split('_')
-        return components[0] + ''.join(x.title() for x in components[1:])
+        return _camel_case(name)
         
     def _type_to_jsdoc_type(self, param_type: ParameterType) -> str:
         """Convert ParameterType to JSDoc type string."""
-        type_map = {
-            ParameterType.STRING: "string",
-            ParameterType.INTEGER: "number",
-            ParameterType.FLOAT: "number",
-            ParameterType.BOOLEAN: "boolean",
-            ParameterType.ARRAY: "Array",
-            ParameterType.OBJECT: "Object",
-            ParameterType.NULL: "*"
-        }
-        
-        return type_map.get(param_type, "*")
\ No newline at end of file
+        return _JSDOC_TYPES.get(param_type, "*")
\ No newline at end of file
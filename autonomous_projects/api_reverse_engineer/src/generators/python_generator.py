@@ -3,78 +3,210 @@ Python SDK generator with full typing support.
 """
 
 from typing import Dict, List, Any
-from pathlib import Path
+import os
+import io
+import re
 import textwrap
 
 from .base_generator import BaseGenerator
 from ..types import APISpec, Endpoint, Parameter, ParameterType, AuthType
 
 
+# Path placeholders after brace escaping, capturing the parameter name
+_ESCAPED_PATH_PARAM_RE = re.compile(r'\{\{([^{}]+)\}\}')
+
+# Imports at the top of every generated client
+_CLIENT_IMPORTS = '''import requests
+from typing import Dict, Any, Optional, List, Union
+from urllib.parse import urljoin
+
+from .types import *
+from .exceptions import APIError, AuthenticationError, RateLimitError
+
+
+'''
+
+# End of _get_headers and the _make_request method shared by every generated client
+_MAKE_REQUEST = '''        return headers
+        
+    def _make_request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Make an HTTP request to the API."""
+        url = urljoin(self.base_url, path.lstrip('/'))
+        headers = self._get_headers()
+        headers.update(kwargs.pop('headers', {}))
+        
+        try:
+            response = self.session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                **kwargs
+            )
+            
+            # Handle common HTTP errors
+            if response.status_code == 401:
+                raise AuthenticationError("Invalid authentication credentials")
+            elif response.status_code == 429:
+                raise RateLimitError("Rate limit exceeded")
+            elif response.status_code >= 400:
+                raise APIError(f"API request failed: {response.status_code} {response.text}")
+                
+            return response
+            
+        except requests.RequestException as e:
+            raise APIError(f"Network error: {str(e)}")
+    
+'''
+
+# Request body handling code of generated methods
+_REQUEST_BODY_CODE = '''if data is not None:
+        request_kwargs['json'] = data'''
+
+# Generated method code between the query code and the HTTP method,
+# indexed by whether the endpoint has a request body
+_METHOD_ENDS = tuple(
+    f"\n    \n    {body_code}\n    \n    response = self._make_request(\""
+    for body_code in ("", _REQUEST_BODY_CODE)
+)
+
+# Generated method code after the HTTP method
+_METHOD_TAIL = '''", path, **request_kwargs)
+    
+    try:
+        return response.json()
+    except ValueError:
+        return {"data": response.text}'''
+
+# Generated authentication code for each auth method. Headers are
+# format templates taking the header name.
+_AUTH_BLOCKS = {
+    "bearer_token": {
+        "init": "token: str",
+        "assignment": "self.token = token",
+        "headers": 'headers["Authorization"] = f"Bearer {{self.token}}"',
+        "example": 'token="your-bearer-token"'
+    },
+    "api_key": {
+        "init": "api_key: str",
+        "assignment": "self.api_key = api_key",
+        "headers": 'headers["{header_name}"] = self.api_key',
+        "example": 'api_key="your-api-key"'
+    },
+    "basic_auth": {
+        "init": "username: str, password: str",
+        "assignment": "self.username = username\n        self.password = password",
+        "headers": '''import base64
+        auth_string = base64.b64encode(f"{{self.username}}:{{self.password}}".encode()).decode()
+        headers["Authorization"] = f"Basic {{auth_string}}"''',
+        "example": 'username="your-username", password="your-password"'
+    }
+}
+
+# Generated code when no authentication is used
+_NO_AUTH_BLOCK = {
+    "init": "",
+    "assignment": "# No authentication required",
+    "headers": "# No authentication headers needed",
+    "example": ""
+}
+
+# Types file, which doesn't depend on the API spec
+_TYPES_PY = '''"""
+Type definitions for the generated API client.
+"""
+
+from typing import Dict, Any, List, Optional, Union
+from dataclasses import dataclass
+
+
+# Add custom types here as needed
+'''
+
+# Exceptions file, which doesn't depend on the API spec
+_EXCEPTIONS_PY = '''"""
+Exception classes for the API client.
+"""
+
+
+class APIError(Exception):
+    """Base exception for API errors."""
+    pass
+
+
+class AuthenticationError(APIError):
+    """Raised when authentication fails."""
+    pass
+
+
+class RateLimitError(APIError):
+    """Raised when rate limit is exceeded."""
+    pass
+
+
+class ValidationError(APIError):
+    """Raised when request validation fails."""
+    pass
+'''
+
+# README sections that don't depend on the API spec
+_README_ERROR_HANDLING = '''## Error Handling
+
+The SDK includes custom exception classes:
+
+- `APIError`: Base exception for all API errors
+- `AuthenticationError`: Raised for authentication failures
+- `RateLimitError`: Raised when rate limits are exceeded
+
+```python
+from exceptions import APIError, AuthenticationError, RateLimitError
+
+try:
+    result = client.some_method()
+except AuthenticationError:
+    print("Invalid credentials")
+except RateLimitError:
+    print("Rate limit exceeded")
+except APIError as e:
+    print(f"API error: {e}")
+```
+
+'''
+
+
 class PythonGenerator(BaseGenerator):
     """Generate Python SDK with full typing support."""
     
     def get_language_name(self) -> str:
         return "python"
         
-    def generate(self, output_dir: str) -> Dict[str, str]:
+    def generate(self, output_dir: str, return_contents: bool = True) -> Dict[str, Any]:
         """Generate Python SDK files."""
-        output_path = self._create_output_dir(output_dir)
-        files = {}
-        
-        # Generate main client file
-        client_content = self._generate_client()
-        client_file = output_path / "client.py"
-        self._write_file(str(client_file), client_content)
-        files[str(client_file)] = client_content
-        
-        # Generate types file
-        types_content = self._generate_types()
-        types_file = output_path / "types.py"
-        self._write_file(str(types_file), types_content)
-        files[str(types_file)] = types_content
-        
-        # Generate exceptions file
-        exceptions_content = self._generate_exceptions()
-        exceptions_file = output_path / "exceptions.py"
-        self._write_file(str(exceptions_file), exceptions_content)
-        files[str(exceptions_file)] = exceptions_content
-        
-        # Generate __init__.py
-        init_content = self._generate_init()
-        init_file = output_path / "__init__.py"
-        self._write_file(str(init_file), init_content)
-        files[str(init_file)] = init_content
-        
-        # Generate requirements.txt
-        requirements_content = self._generate_requirements()
-        requirements_file = output_path / "requirements.txt"
-        self._write_file(str(requirements_file), requirements_content)
-        files[str(requirements_file)] = requirements_content
-        
-        # Generate setup.py
-        setup_content = self._generate_setup()
-        setup_file = output_path / "setup.py"
-        self._write_file(str(setup_file), setup_content)
-        files[str(setup_file)] = setup_content
-        
-        # Generate README.md
-        readme_content = self._generate_readme()
-        readme_file = output_path / "README.md"
-        self._write_file(str(readme_file), readme_content)
-        files[str(readme_file)] = readme_content
-        
-        return files
+        self._create_output_dir(output_dir)
+        
+        files = {
+            # Main client file
+            os.path.join(output_dir, "client.py"): self._generate_client(),
+            os.path.join(output_dir, "types.py"): self._generate_types(),
+            os.path.join(output_dir, "exceptions.py"): self._generate_exceptions(),
+            os.path.join(output_dir, "__init__.py"): self._generate_init(),
+            os.path.join(output_dir, "requirements.txt"): self._generate_requirements(),
+            os.path.join(output_dir, "setup.py"): self._generate_setup(),
+            os.path.join(output_dir, "README.md"): self._generate_readme()
+        }
+        
+        self._write_files(files)
+        return self._generated_files(files, return_contents)
         
     def _generate_client(self) -> str:
         """Generate the main client class."""
-        methods = []
-        
-        for endpoint in self.api_spec.endpoints:
-            method_code = self._generate_method(endpoint)
-            methods.append(method_code)
+        # Methods are written into one buffer rather than built as separate
+        # strings and joined
+        methods_buf = io.StringIO()
+        for i, endpoint in enumerate(self.api_spec.endpoints):
+            if i:
+                methods_buf.write("\n\n")
+            self._write_method(endpoint, methods_buf)
             
-        methods_str = "\n\n".join(methods)
-        
         auth_init = self._generate_auth_init()
         auth_headers = self._generate_auth_headers()
         
@@ -84,15 +216,7 @@ Generated API client for {self.api_spec.title}.
 This client was automatically generated from API traffic analysis.
 """
 
-import requests
-from typing import Dict, Any, Optional, List, Union
-from urllib.parse import urljoin
-
-from .types import *
-from .exceptions import APIError, AuthenticationError, RateLimitError
-
-
-class {self._get_client_class_name()}:
+{_CLIENT_IMPORTS}class {self._get_client_class_name()}:
     """
     {self.api_spec.description}
     
@@ -116,89 +240,64 @@ class {self._get_client_class_name()}:
         
         {auth_headers}
         
-        return headers
-        
-    def _make_request(self, method: str, path: str, **kwargs) -> requests.Response:
-        """Make an HTTP request to the API."""
-        url = urljoin(self.base_url, path.lstrip('/'))
-        headers = self._get_headers()
-        headers.update(kwargs.pop('headers', {{}}))
-        
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                **kwargs
-            )
-            
-            # Handle common HTTP errors
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid authentication credentials")
-            elif response.status_code == 429:
-                raise RateLimitError("Rate limit exceeded")
-            elif response.status_code >= 400:
-                raise APIError(f"API request failed: {{response.status_code}} {{response.text}}")
-                
-            return response
-            
-        except requests.RequestException as e:
-            raise APIError(f"Network error: {{str(e)}}")
-    
-{textwrap.indent(methods_str, "    ")}
+{_MAKE_REQUEST}{textwrap.indent(methods_buf.getvalue(), "    ")}
 '''
         
     def _generate_method(self, endpoint: Endpoint) -> str:
         """Generate a method for an endpoint."""
-        method_name = self._get_method_name(endpoint)
-        
-        # Generate parameters
-        params = []
+        buf = io.StringIO()
+        self._write_method(endpoint, buf)
+        return buf.getvalue()
+        
+    def _write_method(self, endpoint: Endpoint, buf: io.StringIO):
+        """Write a method for an endpoint."""
+        write = buf.write
+        write("def ")
+        write(self._get_method_name(endpoint))
+        write("(self")
+        
+        # Parameters are written straight into the signature while their
+        # docstring lines are collected
         doc_params = []
         
         # Path parameters
         for param in endpoint.parameters:
             param_type = self._type_to_string(param.type, "python")
-            params.append(f"{param.name}: {param_type}")
+            write(f", {param.name}: {param_type}")
             doc_params.append(f"        {param.name}: {param.description or 'Path parameter'}")
             
-        # Query parameters
-        query_required = [p for p in endpoint.query_params if p.required]
-        query_optional = [p for p in endpoint.query_params if not p.required]
-        
-        for param in query_required:
-            param_type = self._type_to_string(param.type, "python")
-            params.append(f"{param.name}: {param_type}")
-            doc_params.append(f"        {param.name}: {param.description or 'Query parameter'}")
-            
-        # Optional query parameters
-        if query_optional:
-            for param in query_optional:
+        # Query parameters, partitioned in one pass: required ones are
+        # written as they're found and optional ones follow them
+        query_optional = []
+        for param in endpoint.query_params:
+            if param.required:
                 param_type = self._type_to_string(param.type, "python")
-                params.append(f"{param.name}: Optional[{param_type}] = None")
-                doc_params.append(f"        {param.name}: {param.description or 'Optional query parameter'}")
+                write(f", {param.name}: {param_type}")
+                doc_params.append(f"        {param.name}: {param.description or 'Query parameter'}")
+            else:
+                query_optional.append(param)
                 
+        # Optional query parameters
+        for param in query_optional:
+            param_type = self._type_to_string(param.type, "python")
+            write(f", {param.name}: Optional[{param_type}] = None")
+            doc_params.append(f"        {param.name}: {param.description or 'Optional query parameter'}")
+            
         # Request body
         if endpoint.request_body:
-            params.append("data: Optional[Dict[str, Any]] = None")
+            write(", data: Optional[Dict[str, Any]] = None")
             doc_params.append("        data: Request body data")
             
-        params_str = ", ".join(params)
-        doc_params_str = "\n".join(doc_params)
-        
-        # Generate method body
-        path_substitution = self._generate_path_substitution(endpoint)
-        query_params_code = self._generate_query_params_code(endpoint)
-        request_body_code = self._generate_request_body_code(endpoint)
-        
-        return f'''def {method_name}(self{", " + params_str if params_str else ""}) -> Dict[str, Any]:
+        write(f''') -> Dict[str, Any]:
     """
     {endpoint.summary or f"{endpoint.method.value} {endpoint.path}"}
     
     {endpoint.description or "No description available."}
     
     Args:
-{doc_params_str}
+''')
+        write("\n".join(doc_params))
+        write(f'''
         
     Returns:
         API response data
@@ -208,144 +307,78 @@ class {self._get_client_class_name()}:
         AuthenticationError: If authentication is invalid
         RateLimitError: If rate limit is exceeded
     """
-    {path_substitution}
+    {self._generate_path_substitution(endpoint)}
     
     # Prepare request parameters
     request_kwargs = {{}}
     
-    {query_params_code}
-    
-    {request_body_code}
-    
-    response = self._make_request("{endpoint.method.value}", path, **request_kwargs)
-    
-    try:
-        return response.json()
-    except ValueError:
-        return {{"data": response.text}}'''
+    ''')
+        self._write_query_params_code(endpoint, buf)
+        write(_METHOD_ENDS[bool(endpoint.request_body)])
+        write(endpoint.method.value)
+        write(_METHOD_TAIL)
         
     def _generate_path_substitution(self, endpoint: Endpoint) -> str:
         """Generate path parameter substitution code."""
         if not endpoint.parameters:
             return f'path = "{endpoint.path}"'
             
-        substitutions = []
-        for param in endpoint.parameters:
-            substitutions.append(f'path = path.replace("{{{param.name}}}", str({param.name}))')
-            
-        return f'path = "{endpoint.path}"\n    ' + '\n    '.join(substitutions)
-        
-    def _generate_query_params_code(self, endpoint: Endpoint) -> str:
-        """Generate query parameters handling code."""
+        # A single f-string with a slot for each path parameter, rather than
+        # one path.replace() call per parameter at runtime. Braces are
+        # escaped, then placeholders with a parameter are unescaped in one
+        # pass; others are kept as literal text
+        names = {param.name for param in endpoint.parameters}
+        path = _ESCAPED_PATH_PARAM_RE.sub(
+            lambda match: f"{{{match.group(1)}}}" if match.group(1) in names else match.group(0),
+            endpoint.path.replace("{", "{{").replace("}", "}}")
+        )
+        return f'path = f"{path}"'
+        
+    def _write_query_params_code(self, endpoint: Endpoint, buf: io.StringIO):
+        """Write query parameters handling code."""
         if not endpoint.query_params:
-            return ""
+            return
             
-        lines = ["params = {}"]
+        write = buf.write
+        write("params = {}")
         
+        # One write per parameter, in declaration order
         for param in endpoint.query_params:
+            name = param.name
             if param.required:
-                lines.append(f'params["{param.name}"] = {param.name}')
+                write(f'\n    params["{name}"] = {name}')
             else:
-                lines.append(f'if {param.name} is not None:')
-                lines.append(f'    params["{param.name}"] = {param.name}')
+                write(f'\n    if {name} is not None:'
+                      f'\n        params["{name}"] = {name}')
                 
-        lines.append("if params:")
-        lines.append("    request_kwargs['params'] = params")
-        
-        return "\n    ".join(lines)
+        write("\n    if params:\n        request_kwargs['params'] = params")
         
     def _generate_request_body_code(self, endpoint: Endpoint) -> str:
         """Generate request body handling code."""
-        if not endpoint.request_body:
-            return ""
-            
-        return '''if data is not None:
-        request_kwargs['json'] = data'''
+        return _REQUEST_BODY_CODE if endpoint.request_body else ""
         
     def _generate_auth_init(self) -> str:
         """Generate authentication parameters for __init__."""
-        auth_method = self._get_auth_method()
-        
-        if auth_method == "bearer_token":
-            return "token: str"
-        elif auth_method == "api_key":
-            return "api_key: str"
-        elif auth_method == "basic_auth":
-            return "username: str, password: str"
-        else:
-            return ""
-            
+        return _AUTH_BLOCKS.get(self._get_auth_method(), _NO_AUTH_BLOCK)["init"]
+        
     def _generate_auth_assignment(self) -> str:
         """Generate authentication assignment in __init__."""
-        auth_method = self._get_auth_method()
-        
-        if auth_method == "bearer_token":
-            return "self.token = token"
-        elif auth_method == "api_key":
-            return "self.api_key = api_key"
-        elif auth_method == "basic_auth":
-            return "self.username = username\n        self.password = password"
-        else:
-            return "# No authentication required"
-            
+        return _AUTH_BLOCKS.get(self._get_auth_method(), _NO_AUTH_BLOCK)["assignment"]
+        
     def _generate_auth_headers(self) -> str:
         """Generate authentication headers code."""
-        auth_method = self._get_auth_method()
-        
-        if auth_method == "bearer_token":
-            return 'headers["Authorization"] = f"Bearer {self.token}"'
-        elif auth_method == "api_key":
-            # Find the header name from auth patterns
-            header_name = "X-API-Key"
-            if self.api_spec.auth_patterns:
-                header_name = self.api_spec.auth_patterns[0].header_name or "X-API-Key"
-            return f'headers["{header_name}"] = self.api_key'
-        elif auth_method == "basic_auth":
-            return '''import base64
-        auth_string = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
-        headers["Authorization"] = f"Basic {auth_string}"'''
-        else:
-            return "# No authentication headers needed"
-            
+        # The header name comes from the first auth pattern
+        patterns = self.api_spec.auth_patterns
+        header_name = (patterns[0].header_name if patterns else None) or "X-API-Key"
+        return _AUTH_BLOCKS.get(self._get_auth_method(), _NO_AUTH_BLOCK)["headers"].format(header_name=header_name)
+        
     def _generate_types(self) -> str:
         """Generate types file."""
-        return '''"""
-Type definitions for the generated API client.
-"""
-
-from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass
-
-
-# Add custom types here as needed
-'''
+        return _TYPES_PY
         
     def _generate_exceptions(self) -> str:
         """Generate exceptions file."""
-        return '''"""
-Exception classes for the API client.
-"""
-
-
-class APIError(Exception):
-    """Base exception for API errors."""
-    pass
-
-
-class AuthenticationError(APIError):
-    """Raised when authentication fails."""
-    pass
-
-
-class RateLimitError(APIError):
-    """Raised when rate limit is exceeded."""
-    pass
-
-
-class ValidationError(APIError):
-    """Raised when request validation fails."""
-    pass
-'''
+        return _EXCEPTIONS_PY
         
     def _generate_init(self) -> str:
         """Generate __init__.py file."""
@@ -428,79 +461,44 @@ from client import {client_class}
 
 {usage_examples}
 
-## Error Handling
-
-The SDK includes custom exception classes:
-
-- `APIError`: Base exception for all API errors
-- `AuthenticationError`: Raised for authentication failures
-- `RateLimitError`: Raised when rate limits are exceeded
-
-```python
-from exceptions import APIError, AuthenticationError, RateLimitError
-
-try:
-    result = client.some_method()
-except AuthenticationError:
-    print("Invalid credentials")
-except RateLimitError:
-    print("Rate limit exceeded")
-except APIError as e:
-    print(f"API error: {{e}}")
-```
-
-## Generated from API Traffic
+{_README_ERROR_HANDLING}## Generated from API Traffic
 
 This SDK was automatically generated by analyzing API traffic patterns.
 Endpoint coverage: {len(self.api_spec.endpoints)} endpoints discovered.
 '''
         
-    def _get_client_class_name(self) -> str:
-        """Get the client class name."""
-        name = self._sanitize_name(self.api_spec.title.replace(" ", ""))
-        return f"{name}Client"
-        
     def _generate_auth_example(self) -> str:
         """Generate authentication example."""
-        auth_method = self._get_auth_method()
-        client_class = self._get_client_class_name()
-        
-        if auth_method == "bearer_token":
-            return f'client = {client_class}(token="your-bearer-token")'
-        elif auth_method == "api_key":
-            return f'client = {client_class}(api_key="your-api-key")'
-        elif auth_method == "basic_auth":
-            return f'client = {client_class}(username="your-username", password="your-password")'
-        else:
-            return f'client = {client_class}()'
+        example_args = _AUTH_BLOCKS.get(self._get_auth_method(), _NO_AUTH_BLOCK)["example"]
+        return f'client = {self._get_client_class_name()}({example_args})'
             
     def _generate_usage_examples(self) -> str:
         """Generate usage examples for endpoints."""
-        examples = []
+        buf = io.StringIO()
+        write = buf.write
         
-        for endpoint in self.api_spec.endpoints[:3]:  # Show first 3 endpoints
-            method_name = self._get_method_name(endpoint)
-            
-            # Generate example call
-            args = []
-            for param in endpoint.parameters:
-                if param.example:
-                    args.append(f'{param.name}="{param.example}"')
-                else:
-                    args.append(f'{param.name}="example_value"')
-                    
-            for param in endpoint.query_params:
-                if param.required and param.example:
-                    args.append(f'{param.name}="{param.example}"')
-                    
-            args_str = ", ".join(args)
+        # Show first 3 endpoints
+        for i, endpoint in enumerate(self.api_spec.endpoints[:3]):
+            if i:
+                write("\n\n")
+                
+            # Example call: path parameters, then required query parameters
+            # that have an example
+            args = [
+                f'{param.name}="{param.example}"' if param.example else f'{param.name}="example_value"'
+                for param in endpoint.parameters
+            ]
+            args.extend(
+                f'{param.name}="{param.example}"'
+                for param in endpoint.query_params
+                if param.required and param.example
+            )
             
-            example = f'''#### {endpoint.summary or endpoint.method.value + " " + endpoint.path}
+            write(f'''#### {endpoint.summary or endpoint.method.value + " " + endpoint.path}
 
 ```python
-result = client.{method_name}({args_str})
+result = client.{self._get_method_name(endpoint)}({", ".join(args)})
 print(result)
-```'''
-            examples.append(example)
+```''')
             
-        return "\n\n".join(examples)
\ No newline at end of file
+        return buf.getvalue()
@@ -3,10 +3,10 @@ TypeScript SDK generator with full typing support.
 """
 
 from typing import Dict, List, Any
-from pathlib import Path
+import os
 import textwrap
 
-from .base_generator import BaseGenerator
+from .base_generator import BaseGenerator, _camel_case
 from ..types import APISpec, Endpoint, Parameter, ParameterType, AuthType
 
 
@@ -16,48 +16,22 @@ class TypeScriptGenerator(BaseGenerator):
     def get_language_name(self) -> str:
         return "typescript"
         
-    def generate(self, output_dir: str) -> Dict[str, str]:
+    def generate(self, output_dir: str, return_contents: bool = True) -> Dict[str, Any]:
         """Generate TypeScript SDK files."""
-        output_path = self._create_output_dir(output_dir)
-        files = {}
-        
-        # Generate main client file
-        client_content = self._generate_client()
-        client_file = output_path / "client.ts"
-        self._write_file(str(client_file), client_content)
-        files[str(client_file)] = client_content
-        
-        # Generate types file
-        types_content = self._generate_types()
-        types_file = output_path / "types.ts"
-        self._write_file(str(types_file), types_content)
-        files[str(types_file)] = types_content
-        
-        # Generate index file
-        index_content = self._generate_index()
-        index_file = output_path / "index.ts"
-        self._write_file(str(index_file), index_content)
-        files[str(index_file)] = index_content
-        
-        # Generate package.json
-        package_content = self._generate_package_json()
-        package_file = output_path / "package.json"
-        self._write_file(str(package_file), package_content)
-        files[str(package_file)] = package_content
-        
-        # Generate tsconfig.json
-        tsconfig_content = self._generate_tsconfig()
-        tsconfig_file = output_path / "tsconfig.json"
-        self._write_file(str(tsconfig_file), tsconfig_content)
-        files[str(tsconfig_file)] = tsconfig_content
-        
-        # Generate README.md
-        readme_content = self._generate_readme()
-        readme_file = output_path / "README.md"
-        self._write_file(str(readme_file), readme_content)
-        files[str(readme_file)] = readme_content
-        
-        return files
+        self._create_output_dir(output_dir)
+        
+        files = {
+            # Main client file
+            os.path.join(output_dir, "client.ts"): self._generate_client(),
+            os.path.join(output_dir, "types.ts"): self._generate_types(),
+            os.path.join(output_dir, "index.ts"): self._generate_index(),
+            os.path.join(output_dir, "package.json"): self._generate_package_json(),
+            os.path.join(output_dir, "tsconfig.json"): self._generate_tsconfig(),
+            os.path.join(output_dir, "README.md"): self._generate_readme()
+        }
+        
+        self._write_files(files)
+        return self._generated_files(files, return_contents)
         
     def _generate_client(self) -> str:
         """Generate the main client class."""
@@ -452,7 +426,7 @@ npm run build
 ### Basic Setup
 
 ```typescript
-import {{ {client_class} }} from './{self._get_client_class_name().lower()}';
+import {{ {client_class} }} from './{client_class.lower()}';
 
 // Initialize the client
 {auth_example}
@@ -487,11 +461,6 @@ This SDK was automatically generated by analyzing API traffic patterns.
 Endpoint coverage: {len(self.api_spec.endpoints)} endpoints discovered.
 '''
         
-    def _get_client_class_name(self) -> str:
-        """Get the client class name."""
-        name = self._sanitize_name(self.api_spec.title.replace(" ", ""))
-        return f"{name}Client"
-        
     def _generate_auth_example_ts(self) -> str:
         """Generate authentication example for TypeScript."""
         auth_method = self._get_auth_method()
@@ -553,5 +522,4 @@ console.log(result.data);
         
     def _camel_case(self, name: str) -> str:
         """Convert snake_case to camelCase."""
-        components = name.split('_')
-        return components[0] + ''.join(x.title() for x in components[1:])
\ No newline at end of file
+        return _camel_case(name)
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+JSON serialization helpers that use orjson when it is installed.
+
+Compact output falls back to msgspec when only msgspec is available.
+"""
+
+import json
+import re
+from typing import Any, Iterator, TextIO, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+_WHITESPACE = re.compile(r'\s*')
+
+# Characters that can continue a JSON number
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+_decoder = json.JSONDecoder()
+_msgspec_encoder = msgspec.json.Encoder() if msgspec is not None else None
+
+# Characters read from a file at a time by iter_items
+READ_SIZE = 64 * 1024
+
+
+def loads(data: Union[str, bytes, memoryview]) -> Any:
+    """Parse a JSON document from text, bytes or a memoryview of bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    if _msgspec_encoder is not None:
+        return _msgspec_encoder.encode(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def dumps_indented(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes with two-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+
+def iter_items(source: Union[str, TextIO], key: str, read_size: int = READ_SIZE) -> Iterator[Any]:
+    """
+    Yield the items of the array stored under key in a top-level JSON object.
+    
+    source is the document text or a text file. Files are read in chunks
+    of read_size characters as items are decoded, and text that has been
+    decoded is dropped, so neither the whole file nor the whole document
+    is held in memory at once. Other top-level values are decoded and
+    discarded.
+    """
+    if isinstance(source, str):
+        text, read = source, None
+    else:
+        text, read = '', source.read
+    pos = 0
+    
+    def more() -> bool:
+        """Read more of the file, dropping already decoded text."""
+        nonlocal text, pos, read
+        if read is None:
+            return False
+        # Read at least as much as is buffered, so a value longer than
+        # read_size is only retried a logarithmic number of times
+        chunk = read(max(read_size, len(text) - pos))
+        if not chunk:
+            read = None
+            return False
+        text = text[pos:] + chunk
+        pos = 0
+        return True
+        
+    def peek() -> str:
+        """Skip whitespace and get the next character, or '' at the end."""
+        nonlocal pos
+        while True:
+            pos = _WHITESPACE.match(text, pos).end()
+            if pos < len(text) or not more():
+                return text[pos:pos + 1]
+                
+    def expect(expected: str):
+        nonlocal pos
+        if peek() != expected:
+            raise ValueError(f"Expected {expected!r} at position {pos}")
+        pos += 1
+        
+    def decode() -> Any:
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(text, pos)
+            except ValueError:
+                # The value may continue past the text read so far
+                if more():
+                    continue
+                raise
+            # So may a number that runs up to the end of the text read so far
+            if (end < len(text) and text[end] not in _NUMBER_CHARS) or not more():
+                pos = end
+                return value
+                
+    expect('{')
+    if peek() == '}':
+        return
+        
+    while True:
+        name = decode()
+        expect(':')
+        
+        if name == key and peek() == '[':
+            pos += 1
+            if peek() == ']':
+                pos += 1
+            else:
+                while True:
+                    yield decode()
+                    if peek() == ']':
+                        pos += 1
+                        break
+                    expect(',')
+        else:
+            decode()
+            
+        if peek() == '}':
+            return
+        expect(',')
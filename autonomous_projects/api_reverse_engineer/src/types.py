@@ -3,9 +3,21 @@ Type definitions for the API reverse engineering tool.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Union, Set
+from typing import BinaryIO, Dict, List, Optional, Any, Union, Set, Tuple
 from enum import Enum
 import json
+import sys
+
+from . import serialization
+
+
+# Slotted dataclasses (no per-instance __dict__) where the Python version supports them
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+# Marks a body that has not been parsed yet / is not valid JSON
+_UNPARSED = object()
+NOT_JSON = object()
 
 
 class HTTPMethod(Enum):
@@ -40,7 +52,7 @@ class ParameterType(Enum):
     NULL = "null"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Parameter:
     """Represents an API parameter."""
     name: str
@@ -54,7 +66,7 @@ class Parameter:
     pattern: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ResponseSchema:
     """Represents a response schema."""
     status_code: int
@@ -63,7 +75,7 @@ class ResponseSchema:
     examples: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RateLimit:
     """Rate limiting information."""
     requests_per_minute: Optional[int] = None
@@ -72,7 +84,7 @@ class RateLimit:
     headers: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AuthPattern:
     """Authentication pattern information."""
     type: AuthType
@@ -82,7 +94,7 @@ class AuthPattern:
     examples: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Endpoint:
     """Represents an API endpoint."""
     path: str
@@ -99,7 +111,7 @@ class Endpoint:
     examples: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class APISpec:
     """Complete API specification."""
     base_url: str
@@ -118,56 +130,220 @@ class APISpec:
             "title": self.title,
             "version": self.version,
             "description": self.description,
-            "endpoints": [
+            "endpoints": [self._endpoint_to_dict(ep) for ep in self.endpoints],
+            "auth_patterns": self._auth_patterns_to_list()
+        }
+        
+    @staticmethod
+    def _endpoint_to_dict(ep: Endpoint) -> Dict[str, Any]:
+        """Convert a single endpoint to a dictionary."""
+        return {
+            "path": ep.path,
+            "method": ep.method.value,
+            "summary": ep.summary,
+            "description": ep.description,
+            "parameters": [
+                {
+                    "name": p.name,
+                    "type": p.type.value,
+                    "required": p.required,
+                    "description": p.description,
+                    "example": p.example
+                } for p in ep.parameters
+            ],
+            "query_params": [
                 {
-                    "path": ep.path,
-                    "method": ep.method.value,
-                    "summary": ep.summary,
-                    "description": ep.description,
-                    "parameters": [
-                        {
-                            "name": p.name,
-                            "type": p.type.value,
-                            "required": p.required,
-                            "description": p.description,
-                            "example": p.example
-                        } for p in ep.parameters
-                    ],
-                    "query_params": [
-                        {
-                            "name": p.name,
-                            "type": p.type.value,
-                            "required": p.required,
-                            "description": p.description,
-                            "example": p.example
-                        } for p in ep.query_params
-                    ],
-                    "responses": [
-                        {
-                            "status_code": r.status_code,
-                            "content_type": r.content_type,
-                            "schema": r.schema
-                        } for r in ep.responses
-                    ]
-                } for ep in self.endpoints
+                    "name": p.name,
+                    "type": p.type.value,
+                    "required": p.required,
+                    "description": p.description,
+                    "example": p.example
+                } for p in ep.query_params
             ],
-            "auth_patterns": [
+            "responses": [
                 {
-                    "type": auth.type.value,
-                    "header_name": auth.header_name,
-                    "parameter_name": auth.parameter_name,
-                    "token_prefix": auth.token_prefix
-                } for auth in self.auth_patterns
+                    "status_code": r.status_code,
+                    "content_type": r.content_type,
+                    "schema": r.schema
+                } for r in ep.responses
             ]
         }
+        
+    def _auth_patterns_to_list(self) -> List[Dict[str, Any]]:
+        """Convert the auth patterns to a list of dictionaries."""
+        return [
+            {
+                "type": auth.type.value,
+                "header_name": auth.header_name,
+                "parameter_name": auth.parameter_name,
+                "token_prefix": auth.token_prefix
+            } for auth in self.auth_patterns
+        ]
     
     def to_json(self) -> str:
         """Convert to JSON string."""
         return json.dumps(self.to_dict(), indent=2)
+        
+    def write_json(self, f: BinaryIO):
+        """
+        Write the to_dict() document to a binary file as indented JSON.
+        
+        Endpoints are serialized and written one at a time, so the full
+        dictionary is never held in memory. The layout matches
+        json.dumps(indent=2), but the bytes may differ: when orjson is
+        installed, non-ASCII text is written as raw UTF-8 rather than
+        \\uXXXX escapes. Both parse to the same document.
+        """
+        def indented(value: Any, level: int) -> bytes:
+            # JSON strings can't contain raw newlines, so this only
+            # re-indents structural line breaks
+            return serialization.dumps_indented(value).replace(b'\n', b'\n' + b'  ' * level)
+            
+        f.write(b'{\n')
+        for key in ("base_url", "title", "version", "description"):
+            f.write(b'  "%s": %s,\n' % (key.encode(), serialization.dumps(getattr(self, key))))
+            
+        f.write(b'  "endpoints": [')
+        for i, ep in enumerate(self.endpoints):
+            f.write(b',\n    ' if i else b'\n    ')
+            f.write(indented(self._endpoint_to_dict(ep), 2))
+        f.write(b'\n  ],\n' if self.endpoints else b'],\n')
+        
+        f.write(b'  "auth_patterns": %s\n}' % indented(self._auth_patterns_to_list(), 1))
+
+
+class CaseInsensitiveDict(dict):
+    """
+    Header dictionary with case-insensitive lookups that keeps the
+    original header names.
+    
+    Headers are indexed by lowercased name once when they are captured,
+    so the analyzer doesn't have to lowercase every header name on every
+    pass. Iteration, equality and dict(headers) use the original names.
+    """
+    
+    def __init__(self, data=None, **kwargs):
+        super().__init__()
+        self._lower: Dict[str, str] = {}
+        self.update(data or {}, **kwargs)
+        
+    def _original_key(self, key: str) -> Optional[str]:
+        """Get the stored name for a header name in any case."""
+        return self._lower.get(key.lower()) if isinstance(key, str) else None
+        
+    def __setitem__(self, key: str, value: Any):
+        lower = sys.intern(key.lower())
+        previous = self._lower.get(lower)
+        if previous is not None and previous != key:
+            super().__delitem__(previous)
+        self._lower[lower] = key
+        super().__setitem__(key, value)
+        
+    def __getitem__(self, key: str) -> Any:
+        original = self._original_key(key)
+        if original is None:
+            raise KeyError(key)
+        return super().__getitem__(original)
+        
+    def __delitem__(self, key: str):
+        original = self._original_key(key)
+        if original is None:
+            raise KeyError(key)
+        super().__delitem__(original)
+        del self._lower[key.lower()]
+        
+    def __contains__(self, key: object) -> bool:
+        return self._original_key(key) is not None
+        
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+        
+    def get(self, key: str, default: Any = None) -> Any:
+        original = self._original_key(key)
+        if original is None:
+            return default
+        return super().__getitem__(original)
+        
+    def pop(self, key: str, *default: Any) -> Any:
+        original = self._original_key(key)
+        if original is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        del self._lower[key.lower()]
+        return super().pop(original)
+        
+    def popitem(self) -> Tuple[str, Any]:
+        key, value = super().popitem()
+        del self._lower[key.lower()]
+        return key, value
+        
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        original = self._original_key(key)
+        if original is not None:
+            return super().__getitem__(original)
+        self[key] = default
+        return default
+        
+    def clear(self):
+        super().clear()
+        self._lower.clear()
+        
+    def copy(self) -> 'CaseInsensitiveDict':
+        # The lowercase index is copied rather than rebuilt
+        new = self.__class__()
+        dict.update(new, self)
+        new._lower = self._lower.copy()
+        return new
+        
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+            
+    def get_lower(self, key_lower: str, default: Any = None) -> Any:
+        """Look up a header by its lowercased name."""
+        key = self._lower.get(key_lower)
+        if key is None:
+            return default
+        return dict.__getitem__(self, key)
+        
+    def lower_keys(self):
+        """Get a view of the lowercased header names."""
+        return self._lower.keys()
+        
+    def lower_items(self) -> List[Tuple[str, str, Any]]:
+        """Get (original name, lowercased name, value) for each header."""
+        return [
+            (key, lower, dict.__getitem__(self, key))
+            for lower, key in self._lower.items()
+        ]
+
+
+class _JSONBodyMixin:
+    """Lazily parse and cache a captured JSON body."""
+    
+    __slots__ = ()
+    
+    def json_body(self) -> Any:
+        """
+        Get the body parsed as JSON.
+        
+        The result is cached, so repeated analyzer passes only parse once.
+        Returns NOT_JSON when there is no body or it isn't valid JSON.
+        """
+        if self._parsed_body is _UNPARSED:
+            parsed = NOT_JSON
+            if self.body:
+                try:
+                    parsed = serialization.loads(self.body)
+                except ValueError:
+                    pass
+            self._parsed_body = parsed
+        return self._parsed_body
 
 
-@dataclass
-class CapturedRequest:
+@dataclass(**_SLOTS)
+class CapturedRequest(_JSONBodyMixin):
     """Represents a captured HTTP request."""
     url: str
     method: str
@@ -175,19 +351,21 @@ class CapturedRequest:
     query_params: Dict[str, Any]
     body: Optional[str] = None
     timestamp: Optional[float] = None
+    _parsed_body: Any = field(default=_UNPARSED, init=False, repr=False, compare=False)
 
 
-@dataclass
-class CapturedResponse:
+@dataclass(**_SLOTS)
+class CapturedResponse(_JSONBodyMixin):
     """Represents a captured HTTP response."""
     status_code: int
     headers: Dict[str, str]
     body: Optional[str] = None
     content_type: Optional[str] = None
     timestamp: Optional[float] = None
+    _parsed_body: Any = field(default=_UNPARSED, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class APICall:
     """Represents a complete API call (request + response)."""
     request: CapturedRequest
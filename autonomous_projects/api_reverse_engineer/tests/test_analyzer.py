@@ -4,7 +4,11 @@ Tests for the request analyzer.
 
 import unittest
 import json
-from src.analyzer import RequestAnalyzer, TypeInferencer, PatternDetector
+import random
+from collections import OrderedDict
+from src.analyzer import (
+    RequestAnalyzer, TypeInferencer, PatternDetector, _normalize_path_regex, _reservoir_add
+)
 from src.types import (
     APICall, CapturedRequest, CapturedResponse, 
     HTTPMethod, ParameterType, AuthType
@@ -27,6 +31,10 @@ class TestTypeInferencer(unittest.TestCase):
         self.assertEqual(self.inferencer.infer_type([1, 2, 3]), ParameterType.ARRAY)
         self.assertEqual(self.inferencer.infer_type({"key": "value"}), ParameterType.OBJECT)
         
+        # Subclasses resolve to their base type
+        self.assertEqual(self.inferencer.infer_type(OrderedDict()), ParameterType.OBJECT)
+        self.assertEqual(self.inferencer.infer_type(object()), ParameterType.STRING)
+        
     def test_infer_schema(self):
         """Test JSON schema inference."""
         # Test simple object
@@ -57,6 +65,26 @@ class TestTypeInferencer(unittest.TestCase):
         schema = self.inferencer.infer_schema({})
         self.assertEqual(schema["type"], "object")
         self.assertEqual(schema["properties"], {})
+        
+    def test_infer_schema_deeply_nested(self):
+        """Test schema inference on nesting deeper than the recursion limit."""
+        data = leaf = {}
+        for _ in range(5000):
+            leaf["child"] = {}
+            leaf = leaf["child"]
+            
+        schema = self.inferencer.infer_schema(data)
+        self.assertEqual(schema["properties"]["child"]["type"], "object")
+        
+    def test_infer_schema_reuses_repeated_shapes(self):
+        """Test that repeated shapes share a cached schema."""
+        first = self.inferencer.infer_schema({"id": 1, "name": "John"})
+        second = self.inferencer.infer_schema({"id": 2, "name": "Jane"})
+        self.assertIs(first, second)
+        
+        # Same keys with different value types must not collide
+        other = self.inferencer.infer_schema({"id": "2", "name": "Jane"})
+        self.assertEqual(other["properties"]["id"]["type"], "string")
 
 
 class TestPatternDetector(unittest.TestCase):
@@ -85,6 +113,19 @@ class TestPatternDetector(unittest.TestCase):
             "/users/{id}/posts/{id}"
         )
         
+    def test_normalize_path_regex_fallback(self):
+        """Test that the regex fallback matches the segment scanner."""
+        paths = [
+            "/users/123/posts",
+            "/users/550e8400-e29b-41d4-a716-446655440000",
+            "/users/123/posts/456",
+            "/files/abcdefghijklmnopqrstuvwxyz/meta",
+            "/v1/users"
+        ]
+        
+        for path in paths:
+            self.assertEqual(_normalize_path_regex(path), self.detector._normalize_path(path))
+            
     def test_detect_auth_patterns(self):
         """Test authentication pattern detection."""
         # Create mock API calls with different auth patterns
@@ -262,6 +303,53 @@ class TestRequestAnalyzer(unittest.TestCase):
         self.assertEqual(limit_param.type, ParameterType.STRING)
         self.assertEqual(limit_param.example, "10")
         
+    def test_query_parameter_required_ratio(self):
+        """Test that required is based on the share of calls using a param."""
+        calls = []
+        for query_params in ({"limit": "10", "sort": "name"}, {"limit": "20"}, {"limit": "5"}):
+            request = CapturedRequest(
+                url="https://api.example.com/users",
+                method="GET",
+                headers={},
+                query_params=query_params
+            )
+            calls.append(APICall(request, CapturedResponse(200, {}, '{}')))
+            
+        params = {p.name: p for p in self.analyzer._analyze_query_parameters(calls)}
+        
+        self.assertTrue(params["limit"].required)
+        self.assertFalse(params["sort"].required)
+        
+    def test_reservoir_add(self):
+        """Test that sampled values stay bounded and come from the input."""
+        samples = []
+        rng = random.Random(0)
+        for seen, value in enumerate(range(1000), 1):
+            _reservoir_add(samples, seen, value, 16, rng)
+            
+        self.assertEqual(len(samples), 16)
+        self.assertTrue(all(0 <= value < 1000 for value in samples))
+        
+    def test_examples_are_reproducible(self):
+        """Test that examples don't change between runs on the same calls."""
+        calls = [
+            APICall(
+                CapturedRequest("https://api.example.com/items", "GET", {}, {"page": str(i)}),
+                CapturedResponse(200, {}, json.dumps({"id": i}), content_type="application/json")
+            )
+            for i in range(50)
+        ]
+        
+        endpoint = self.analyzer.analyze_calls(calls).endpoints[0]
+        self.assertEqual(endpoint.query_params[0].example, "0")
+        self.assertEqual(endpoint.responses[0].examples[0], {"id": 0})
+        self.assertEqual(len(endpoint.responses[0].examples), 3)
+        
+        # Global random state and repeated runs don't affect the samples
+        random.seed(12345)
+        for analyzer in (self.analyzer, RequestAnalyzer()):
+            self.assertEqual(analyzer.analyze_calls(calls).endpoints[0], endpoint)
+        
     def test_analyze_request_body(self):
         """Test request body analysis."""
         calls = self.create_sample_calls()
@@ -277,6 +365,19 @@ class TestRequestAnalyzer(unittest.TestCase):
         self.assertIn("name", body_schema["properties"])
         self.assertIn("email", body_schema["properties"])
         
+    def test_base_url_uses_most_common_host(self):
+        """Test that the base URL comes from the most frequently called host."""
+        calls = self.create_sample_calls()
+        request = CapturedRequest(
+            url="https://cdn.example.com/assets/app.js",
+            method="GET",
+            headers={},
+            query_params={}
+        )
+        calls.insert(0, APICall(request, CapturedResponse(200, {}, '')))
+        
+        self.assertEqual(self.analyzer._determine_base_url(calls), "https://api.example.com")
+        
     def test_empty_calls_raises_error(self):
         """Test that empty calls list raises ValueError."""
         with self.assertRaises(ValueError):
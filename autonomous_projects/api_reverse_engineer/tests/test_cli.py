@@ -4,13 +4,17 @@ Tests for the CLI interface.
 
 import unittest
 import json
+import os
+import threading
 import tempfile
 import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 from src.cli import APIReverseEngineerCLI
-from src.types import APISpec, Endpoint, HTTPMethod
+from src.types import (
+    APISpec, AuthPattern, AuthType, Endpoint, HTTPMethod, Parameter, ParameterType, ResponseSchema
+)
 
 
 class TestCLI(unittest.TestCase):
@@ -38,6 +42,18 @@ class TestCLI(unittest.TestCase):
         except Exception as e:
             self.fail(f"Parser help generation failed: {e}")
             
+    def test_parser_builds_only_selected_command(self):
+        """Test that only the selected subcommand's parser is built."""
+        parser = self.cli.create_parser(['-v', 'docs', 'api_spec.json'])
+        
+        args = parser.parse_args(['-v', 'docs', 'api_spec.json'])
+        self.assertEqual(args.command, 'docs')
+        self.assertTrue(args.verbose)
+        
+        with patch('sys.stderr'):
+            with self.assertRaises(SystemExit):
+                parser.parse_args(['capture', '--output', 'test.json'])
+                
     def test_capture_command_args(self):
         """Test capture command argument parsing."""
         parser = self.cli.create_parser()
@@ -125,7 +141,26 @@ class TestCLI(unittest.TestCase):
         self.assertEqual(args.languages, ['python', 'javascript'])
         self.assertEqual(args.api_title, 'Complete API')
         
-    @patch('src.cli.DocumentationGenerator')
+    def test_workflow_fast_path_matches_argparse(self):
+        """Test that the workflow fast path parses like argparse."""
+        argv_variants = [
+            ['workflow', '-o', '/tmp/out'],
+            ['-v', 'workflow', '--port', '9090', '--duration', '120', '--output-dir', '/tmp/out',
+             '--languages', 'python', 'javascript', '--hosts', 'a.com', 'b.com', '--api-title', 'API']
+        ]
+        
+        for argv in argv_variants:
+            self.assertEqual(
+                self.cli._parse_workflow_args(argv),
+                self.cli.create_parser().parse_args(argv)
+            )
+            
+        # Anything unusual is left to argparse
+        for argv in (['workflow', '--help'], ['workflow'], ['workflow', '-o', 'x', '--port', 'abc'],
+                     ['workflow', '-o', 'x', '--languages', 'rust'], ['docs', 'api_spec.json']):
+            self.assertIsNone(self.cli._parse_workflow_args(argv))
+            
+    @patch('src.documentation.DocumentationGenerator')
     def test_cmd_docs(self, mock_doc_gen):
         """Test docs command execution."""
         # Create a test API spec file
@@ -156,6 +191,18 @@ class TestCLI(unittest.TestCase):
             self.cli.cmd_docs(args)
             mock_print.assert_called_once_with("# Test API Documentation")
             
+    def test_wait_with_progress_stops_at_duration(self):
+        """Test that waiting ends after the duration and logs progress."""
+        capture = Mock()
+        capture.wait.return_value = False
+        capture.call_count = 3
+        
+        with patch('src.cli.PROGRESS_INTERVAL', 0.01), \
+             patch.object(self.cli.logger, 'info') as mock_info:
+            self.cli._wait_with_progress(capture, duration=0.05)
+            
+        mock_info.assert_called_once_with("Captured %d API calls", 3)
+        
     def test_generate_sdk_method(self):
         """Test SDK generation method."""
         # Create a simple API spec
@@ -167,16 +214,32 @@ class TestCLI(unittest.TestCase):
         )
         
         # Test Python generation
-        with patch('src.cli.PythonGenerator') as mock_gen:
+        with patch('src.generators.PythonGenerator') as mock_gen:
             mock_generator = Mock()
             mock_gen.return_value = mock_generator
             mock_generator.generate.return_value = {"client.py": "# Python client"}
             
             self.cli._generate_sdk(api_spec, 'python', self.temp_dir)
             
-            mock_gen.assert_called_once_with(api_spec)
-            mock_generator.generate.assert_called_once_with(self.temp_dir)
+            mock_gen.assert_called_once_with(api_spec, create_output_dir=True)
+            mock_generator.generate.assert_called_once_with(self.temp_dir, return_contents=False)
+            
+    def test_generate_sdks_for_each_language(self):
+        """Test that an SDK is generated for every requested language."""
+        api_spec = APISpec(base_url="https://api.example.com", title="Test API")
+        output_dirs = {
+            'python': str(Path(self.temp_dir) / 'python'),
+            'typescript': str(Path(self.temp_dir) / 'typescript')
+        }
+        
+        with patch.object(self.cli, '_generate_sdk') as mock_generate_sdk:
+            self.cli._generate_sdks(api_spec, output_dirs, already_created=True)
             
+        self.assertEqual(
+            sorted(call.args for call in mock_generate_sdk.call_args_list),
+            sorted((api_spec, language, output_dir, True) for language, output_dir in output_dirs.items())
+        )
+        
     def test_unsupported_language_error(self):
         """Test error handling for unsupported language."""
         endpoint = Endpoint("/users", HTTPMethod.GET)
@@ -289,6 +352,45 @@ class TestCLIIntegration(unittest.TestCase):
             except SystemExit:
                 pass  # Expected for help commands
                 
+    def test_load_api_spec_special_files(self):
+        """Test loading empty files and pipes."""
+        empty_file = Path(self.temp_dir) / "empty.json"
+        empty_file.touch()
+        
+        # An empty file is a JSON error
+        with self.assertRaises(ValueError):
+            self.cli._load_api_spec(str(empty_file))
+            
+        if hasattr(os, 'mkfifo'):
+            fifo = Path(self.temp_dir) / "spec.fifo"
+            os.mkfifo(fifo)
+            writer = threading.Thread(target=fifo.write_text, args=('{"base_url": "https://api.example.com"}',))
+            writer.start()
+            try:
+                self.assertEqual(self.cli._load_api_spec(str(fifo)).base_url, "https://api.example.com")
+            finally:
+                writer.join()
+                
+    def test_load_api_spec_round_trip(self):
+        """Test that specs written by the CLI load back unchanged from the JSON alone."""
+        endpoint = Endpoint(
+            "/users/{id}", HTTPMethod.GET,
+            parameters=[Parameter("id", ParameterType.INTEGER, required=True, example=7)],
+            query_params=[Parameter("limit", ParameterType.INTEGER, description="Page size")],
+            responses=[ResponseSchema(200, "application/json", {"type": "object"})]
+        )
+        api_spec = APISpec(
+            base_url="https://api.example.com", title="Test API", endpoints=[endpoint],
+            auth_patterns=[AuthPattern(AuthType.BEARER_TOKEN, header_name="Authorization", token_prefix="Bearer")]
+        )
+        spec_file = Path(self.temp_dir) / "api_spec.json"
+        
+        self.cli._write_api_spec(api_spec, str(spec_file))
+        self.assertEqual(json.loads(spec_file.read_text()), api_spec.to_dict())
+        self.assertEqual(sorted(p.name for p in Path(self.temp_dir).iterdir()), ["api_spec.json"])
+        
+        self.assertEqual(self.cli._load_api_spec(str(spec_file)), api_spec)
+            
     def test_dict_to_api_spec_conversion(self):
         """Test conversion from dictionary to APISpec."""
         spec_data = {
@@ -313,6 +415,18 @@ class TestCLIIntegration(unittest.TestCase):
         self.assertEqual(len(api_spec.endpoints), 1)
         self.assertEqual(api_spec.endpoints[0].path, "/users")
         self.assertEqual(api_spec.endpoints[0].method, HTTPMethod.GET)
+        
+    def test_dict_to_api_spec_invalid_method(self):
+        """Test that an unknown HTTP method names the bad value."""
+        spec_data = {
+            "base_url": "https://api.example.com",
+            "endpoints": [{"path": "/users", "method": "FETCH"}]
+        }
+        
+        with self.assertRaises(ValueError) as context:
+            self.cli._dict_to_api_spec(spec_data)
+            
+        self.assertEqual(str(context.exception), "'FETCH' is not a valid HTTPMethod")
 
 
 if __name__ == '__main__':
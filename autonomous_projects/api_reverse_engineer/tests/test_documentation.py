@@ -131,6 +131,48 @@ class TestDocumentationGenerator(unittest.TestCase):
         self.assertIn("security", get_operation)
         self.assertEqual(get_operation["security"], [{"bearerAuth": []}])
         
+    def test_prepare_refreshes_shared_data(self):
+        """Test that prepare() picks up changes to the API spec."""
+        self.generator.prepare()
+        self.api_spec.auth_patterns = [AuthPattern(type=AuthType.API_KEY, header_name="X-Key")]
+        self.api_spec.endpoints.append(Endpoint("/", HTTPMethod.GET))
+        
+        openapi_spec = self.generator.prepare().generate_openapi()
+        
+        self.assertEqual(openapi_spec["paths"]["/users/{id}"]["get"]["security"], [{"apiKey": []}])
+        self.assertIn("### Root Operations", self.generator.generate_markdown())
+        
+    def test_outputs_reused_until_prepare(self):
+        """Test that generated outputs are reused until the spec changes."""
+        openapi_spec = self.generator.generate_openapi()
+        markdown = self.generator.generate_markdown()
+        
+        self.assertIs(self.generator.generate_openapi(), openapi_spec)
+        self.assertIs(self.generator.generate_markdown(), markdown)
+        
+        # prepare() and replacing the spec both regenerate
+        self.assertIsNot(self.generator.prepare().generate_openapi(), openapi_spec)
+        
+        self.generator.api_spec = APISpec(base_url="https://other.example.com", title="Other API")
+        self.assertEqual(self.generator.generate_openapi()["info"]["title"], "Other API")
+        self.assertIn("# Other API", self.generator.generate_markdown())
+        
+    def test_endpoint_views_shared(self):
+        """Test that per-endpoint derived values are computed once per prepare()."""
+        endpoint = self.api_spec.endpoints[0]
+        view = self.generator._endpoint_view(endpoint)
+        
+        self.assertIs(self.generator._endpoint_view(endpoint), view)
+        self.assertEqual(view.method_lower, "get")
+        self.assertEqual(view.example_path, "/users/123")
+        self.assertEqual(view.query_examples, [])
+        self.assertEqual(view.path_parts, ("users", "{id}"))
+        self.assertIsNone(view.request_body_json)
+        
+        endpoint.request_body = {"name": "test"}
+        self.assertIsNot(self.generator.prepare()._endpoint_view(endpoint), view)
+        self.assertEqual(self.generator._endpoint_view(endpoint).request_body_json, '{\n  "name": "test"\n}')
+        
     def test_generate_postman_collection(self):
         """Test Postman collection generation."""
         collection = self.generator.generate_postman_collection()
@@ -266,6 +308,33 @@ class TestDocumentationGenerator(unittest.TestCase):
         finally:
             Path(temp_file).unlink(missing_ok=True)
             
+    def test_json_file_output(self):
+        """Test OpenAPI and Postman file output."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name, generate in (("openapi", self.generator.generate_openapi),
+                                   ("postman", self.generator.generate_postman)):
+                output_file = Path(temp_dir) / f"{name}.json"
+                
+                document = generate(str(output_file))
+                self.assertEqual(output_file.read_text(), json.dumps(document, indent=2))
+                
+                # Writing again reuses the serialized document
+                output_file.unlink()
+                generate(str(output_file))
+                self.assertEqual(json.loads(output_file.read_text()), document)
+                
+    def test_generate_all(self):
+        """Test generating every format into a directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            outputs = self.generator.generate_all(temp_dir)
+            
+            self.assertEqual(set(outputs), set(DocumentationGenerator.OUTPUT_FILES))
+            self.assertEqual(outputs["openapi"], self.generator.generate_openapi())
+            
+            for file_name in DocumentationGenerator.OUTPUT_FILES.values():
+                self.assertTrue((Path(temp_dir) / file_name).exists())
+            self.assertEqual((Path(temp_dir) / "README.md").read_text(encoding="utf-8"), outputs["markdown"])
+            
     def test_complex_endpoint_documentation(self):
         """Test documentation generation for complex endpoints."""
         # Add a POST endpoint with request body
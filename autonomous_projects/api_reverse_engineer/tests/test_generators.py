@@ -3,6 +3,7 @@ Tests for SDK generators.
 """
 
 import unittest
+import asyncio
 import tempfile
 import shutil
 from pathlib import Path
@@ -95,6 +96,12 @@ class TestPythonGenerator(TestBaseGenerator):
         method_name = generator._get_method_name(endpoint)
         self.assertEqual(method_name, "get_users")
         
+        # Names are cached by path and method, so edited endpoints are renamed
+        endpoint.path = "/orders/{id}"
+        self.assertEqual(generator._get_method_name(endpoint), "get_orders")
+        self.assertEqual(generator._sanitize_name("1st name"), "_1st_name")
+        self.assertEqual(generator._sanitize_name("caf\u00e9-api"), "caf__api")
+        
     def test_auth_initialization(self):
         """Test authentication initialization code."""
         generator = PythonGenerator(self.api_spec)
@@ -113,6 +120,24 @@ class TestPythonGenerator(TestBaseGenerator):
         self.assertEqual(generator._type_to_string(ParameterType.INTEGER, "python"), "int")
         self.assertEqual(generator._type_to_string(ParameterType.BOOLEAN, "python"), "bool")
         self.assertEqual(generator._type_to_string(ParameterType.ARRAY, "python"), "List[Any]")
+        
+    def test_path_substitution(self):
+        """Test that path parameters are substituted with one f-string."""
+        generator = PythonGenerator(self.api_spec)
+        endpoint = Endpoint(
+            path="/orders/{order_id}/items/{item}",
+            method=HTTPMethod.GET,
+            parameters=[Parameter("order_id", ParameterType.INTEGER)]
+        )
+        
+        self.assertEqual(
+            generator._generate_path_substitution(endpoint),
+            'path = f"/orders/{order_id}/items/{{item}}"'
+        )
+        self.assertEqual(
+            generator._generate_path_substitution(self.api_spec.endpoints[0]),
+            'path = f"/users/{id}"'
+        )
 
 
 class TestTypeScriptGenerator(TestBaseGenerator):
@@ -219,6 +244,24 @@ class TestJavaScriptGenerator(TestBaseGenerator):
         self.assertEqual(generator._type_to_jsdoc_type(ParameterType.BOOLEAN), "boolean")
         self.assertEqual(generator._type_to_jsdoc_type(ParameterType.ARRAY), "Array")
         self.assertEqual(generator._type_to_jsdoc_type(ParameterType.OBJECT), "Object")
+        
+    def test_path_substitution(self):
+        """Test that path parameters are substituted with one template literal."""
+        generator = JavaScriptGenerator(self.api_spec)
+        endpoint = Endpoint(
+            path="/orders/{order_id}/items/{item}",
+            method=HTTPMethod.GET,
+            parameters=[Parameter("order_id", ParameterType.INTEGER)]
+        )
+        
+        self.assertEqual(
+            generator._generate_path_substitution_js(endpoint),
+            "let path = `/orders/${String(order_id)}/items/{item}`;"
+        )
+        self.assertEqual(
+            generator._generate_path_substitution_js(self.api_spec.endpoints[0]),
+            "let path = `/users/${String(id)}`;"
+        )
 
 
 class TestGeneratorComparison(TestBaseGenerator):
@@ -247,6 +290,32 @@ class TestGeneratorComparison(TestBaseGenerator):
                 self.assertTrue(Path(file_path).exists(), 
                               f"File {file_path} was reported but doesn't exist")
                 
+    def test_generate_without_contents(self):
+        """Test that generate() can report content lengths instead of content."""
+        for i, generator_class in enumerate((PythonGenerator, TypeScriptGenerator, JavaScriptGenerator)):
+            output_dir = str(Path(self.temp_dir) / f"test_{i}")
+            
+            files = generator_class(self.api_spec).generate(output_dir, return_contents=False)
+            
+            self.assertGreaterEqual(len(files), 3)
+            for file_path, length in files.items():
+                self.assertEqual(len(Path(file_path).read_text(encoding='utf-8')), length)
+                
+    def test_generate_async(self):
+        """Test generating several SDKs concurrently from an event loop."""
+        generators = [PythonGenerator(self.api_spec), JavaScriptGenerator(self.api_spec)]
+        
+        async def generate_all():
+            return await asyncio.gather(*(
+                generator.generate_async(str(Path(self.temp_dir) / f"test_{i}"))
+                for i, generator in enumerate(generators)
+            ))
+            
+        for files in asyncio.run(generate_all()):
+            self.assertGreaterEqual(len(files), 3)
+            for file_path, content in files.items():
+                self.assertEqual(Path(file_path).read_text(encoding='utf-8'), content)
+                
     def test_consistent_method_naming(self):
         """Test that method naming is consistent across generators."""
         endpoint = Endpoint(
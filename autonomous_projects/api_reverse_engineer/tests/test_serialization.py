@@ -0,0 +1,66 @@
+"""
+Tests for the JSON serialization helpers.
+"""
+
+import unittest
+import io
+import json
+
+from src import serialization
+
+
+class TestSerialization(unittest.TestCase):
+    """Test JSON serialization helpers."""
+    
+    def test_round_trip(self):
+        """Test that dumped data loads back unchanged."""
+        data = {"calls": [{"id": 1, "tags": ["a", "b"]}], "total": 1.5, "empty": None}
+        
+        self.assertEqual(serialization.loads(serialization.dumps(data)), data)
+        self.assertEqual(serialization.loads(serialization.dumps_indented(data)), data)
+        self.assertEqual(serialization.loads(memoryview(serialization.dumps(data))), data)
+    
+    def test_iter_items(self):
+        """Test iterating over an array nested in a top-level object."""
+        data = {
+            "captured_at": 1.0,
+            "meta": {"calls": ["not", "these"]},
+            "calls": [{"id": 1}, {"id": 2, "body": "[1, 2]"}, [], "x"],
+            "total_calls": 4
+        }
+        
+        for text in (json.dumps(data), json.dumps(data, indent=2)):
+            self.assertEqual(list(serialization.iter_items(text, "calls")), data["calls"])
+    
+    def test_iter_items_file(self):
+        """Test reading items from a file in small chunks."""
+        data = {
+            "captured_at": 1234.5,
+            "calls": [{"id": 1, "body": "x" * 50}, 12345, [True, None], 'a "quoted" ]'],
+            "total_calls": 100
+        }
+        
+        for read_size in (1, 3, 64):
+            f = io.StringIO(json.dumps(data, indent=2))
+            self.assertEqual(list(serialization.iter_items(f, "calls", read_size)), data["calls"])
+            
+        with self.assertRaises(ValueError):
+            list(serialization.iter_items(io.StringIO('{"calls": [1, {"id": '), "calls", 4))
+            
+    def test_iter_items_empty(self):
+        """Test documents with no items."""
+        self.assertEqual(list(serialization.iter_items('{}', "calls")), [])
+        self.assertEqual(list(serialization.iter_items('{"calls": [ ]}', "calls")), [])
+        self.assertEqual(list(serialization.iter_items('{"other": 1}', "calls")), [])
+    
+    def test_iter_items_invalid(self):
+        """Test that malformed documents raise ValueError."""
+        with self.assertRaises(ValueError):
+            list(serialization.iter_items('[1, 2]', "calls"))
+        
+        with self.assertRaises(ValueError):
+            list(serialization.iter_items('{"calls": [1 2]}', "calls"))
+
+
+if __name__ == '__main__':
+    unittest.main()
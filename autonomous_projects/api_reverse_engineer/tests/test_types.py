@@ -3,11 +3,13 @@ Tests for type definitions.
 """
 
 import unittest
+import io
 import json
+import pickle
 from src.types import (
     APISpec, Endpoint, Parameter, ResponseSchema, AuthPattern,
     HTTPMethod, ParameterType, AuthType, CapturedRequest, 
-    CapturedResponse, APICall
+    CapturedResponse, APICall, NOT_JSON, CaseInsensitiveDict
 )
 
 
@@ -72,6 +74,64 @@ class TestTypes(unittest.TestCase):
         parsed_json = json.loads(spec_json)
         self.assertEqual(parsed_json["base_url"], "https://api.example.com")
         
+    def test_api_spec_write_json(self):
+        """Test that streamed JSON matches to_dict()."""
+        endpoint = Endpoint(
+            path="/users",
+            method=HTTPMethod.GET,
+            query_params=[Parameter("limit", ParameterType.INTEGER, example=10)]
+        )
+        auth = AuthPattern(type=AuthType.BEARER_TOKEN, header_name="Authorization")
+        
+        for endpoints, auth_patterns in (([], []), ([endpoint, endpoint], [auth])):
+            api_spec = APISpec(
+                base_url="https://api.example.com",
+                description="Line one\nline two",
+                endpoints=endpoints,
+                auth_patterns=auth_patterns
+            )
+            
+            buffer = io.BytesIO()
+            api_spec.write_json(buffer)
+            
+            self.assertEqual(json.loads(buffer.getvalue()), api_spec.to_dict())
+            # ASCII-only specs are also laid out exactly like json.dumps
+            self.assertEqual(buffer.getvalue().decode(), json.dumps(api_spec.to_dict(), indent=2))
+            
+    def test_api_spec_write_json_non_ascii(self):
+        """Test that non-ASCII specs round-trip through write_json."""
+        endpoint = Endpoint(
+            path="/caf\u00e9s/{id}",
+            method=HTTPMethod.GET,
+            summary="Caf\u00e9 \u2615 lookup",
+            parameters=[Parameter("id", ParameterType.STRING, example="\u00fcber-\U0001F600")]
+        )
+        api_spec = APISpec(
+            base_url="https://api.example.com",
+            title="\u65e5\u672c\u8a9e API",
+            description="Na\u00efve r\u00e9sum\u00e9",
+            endpoints=[endpoint]
+        )
+        
+        buffer = io.BytesIO()
+        api_spec.write_json(buffer)
+        
+        # Only the parsed documents are compared: escaping may differ
+        self.assertEqual(json.loads(buffer.getvalue()), api_spec.to_dict())
+        self.assertEqual(json.loads(buffer.getvalue()), json.loads(json.dumps(api_spec.to_dict(), indent=2)))
+        
+    def test_api_spec_pickle_round_trip(self):
+        """Test that a pickled API spec loads back unchanged."""
+        api_spec = APISpec(
+            base_url="https://api.example.com",
+            endpoints=[Endpoint("/users/{id}", HTTPMethod.GET, parameters=[Parameter("id", ParameterType.INTEGER)])]
+        )
+        
+        restored = pickle.loads(pickle.dumps(api_spec, protocol=pickle.HIGHEST_PROTOCOL))
+        
+        self.assertEqual(restored, api_spec)
+        self.assertEqual(restored.to_dict(), api_spec.to_dict())
+        
     def test_api_call_creation(self):
         """Test APICall creation with request and response."""
         request = CapturedRequest(
@@ -125,6 +185,72 @@ class TestTypes(unittest.TestCase):
         self.assertEqual(schema.content_type, "application/json")
         self.assertIsInstance(schema.schema, dict)
         self.assertEqual(len(schema.examples), 1)
+        
+    def test_captured_json_body(self):
+        """Test that captured JSON bodies are parsed once and cached."""
+        response = CapturedResponse(200, {}, '{"id": 1}')
+        
+        body = response.json_body()
+        self.assertEqual(body, {"id": 1})
+        self.assertIs(response.json_body(), body)
+        
+        # Non-JSON and empty bodies
+        self.assertIs(CapturedResponse(200, {}, "not json").json_body(), NOT_JSON)
+        self.assertIs(CapturedResponse(204, {}).json_body(), NOT_JSON)
+        
+        # Cached bodies don't affect equality
+        self.assertEqual(response, CapturedResponse(200, {}, '{"id": 1}'))
+        
+    def test_case_insensitive_headers(self):
+        """Test header lookup by lowercased name."""
+        headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        
+        self.assertEqual(headers["Content-Type"], "application/json")
+        self.assertEqual(headers.get_lower("content-type"), "application/json")
+        self.assertEqual(headers.lower_items(), [("Content-Type", "content-type", "application/json")])
+        
+        # Re-setting with different case replaces the existing header
+        headers["content-type"] = "text/plain"
+        self.assertEqual(dict(headers), {"content-type": "text/plain"})
+        
+        del headers["content-type"]
+        self.assertIsNone(headers.get_lower("content-type"))
+        
+    def test_case_insensitive_dict_methods(self):
+        """Test that every lookup and removal ignores header name case."""
+        headers = CaseInsensitiveDict({"Content-Type": "application/json", "X-A": "1"})
+        
+        self.assertEqual(headers["content-type"], "application/json")
+        self.assertIn("CONTENT-TYPE", headers)
+        self.assertNotIn(1, headers)
+        self.assertEqual(headers.get("x-a"), "1")
+        self.assertIsNone(headers.get("x-b"))
+        with self.assertRaises(KeyError):
+            headers["x-b"]
+            
+        # setdefault doesn't add a second spelling of an existing header
+        self.assertEqual(headers.setdefault("x-a", "2"), "1")
+        self.assertEqual(headers.setdefault("X-B", "3"), "3")
+        self.assertEqual(list(headers), ["Content-Type", "X-A", "X-B"])
+        
+        # Copies are independent and keep the lowercase index
+        copy = headers.copy()
+        self.assertIsInstance(copy, CaseInsensitiveDict)
+        copy["x-c"] = "4"
+        self.assertEqual(copy.get_lower("x-c"), "4")
+        self.assertNotIn("x-c", headers)
+        
+        # Removals keep the index in sync
+        self.assertEqual(headers.pop("x-a"), "1")
+        self.assertEqual(headers.pop("x-a", None), None)
+        with self.assertRaises(KeyError):
+            headers.pop("x-a")
+        self.assertEqual(headers.popitem(), ("X-B", "3"))
+        self.assertEqual(headers.lower_items(), [("Content-Type", "content-type", "application/json")])
+        
+        headers.clear()
+        self.assertEqual(headers.lower_items(), [])
+        self.assertNotIn("content-type", headers)
 
 
 if __name__ == '__main__':